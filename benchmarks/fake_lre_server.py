@@ -0,0 +1,566 @@
+import argparse
+import hashlib
+import json
+import random
+import re
+import secrets
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple
+from urllib.parse import urlsplit, parse_qs
+
+from lre_client.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+SESSION_COOKIE = "LWSSO_COOKIE_KEY"
+PROJECT_COOKIE = "QCSession"
+
+# Results listed for every synthetic run (IDs run_id * 10 + 1, + 2, ...)
+_RESULT_TYPES = ("Analyzed Result", "Raw Results", "HTML Report", "Output Log")
+_STREAM_CHUNK = 64 * 1024
+
+
+@dataclass
+class FakeLREConfig:
+    """Behaviour of a FakeLREServer; every field can be changed while it runs."""
+    client_id: str = "fake-client"
+    client_secret: str = "fake-secret"
+    runs: int = 50
+    tests: int = 5
+    hosts: int = 20
+    payload_bytes: int = 8 * 2**20
+    analysis_db: Optional[Path] = None
+    latency_ms: float = 0.0
+    latency_jitter_ms: float = 0.0
+    bandwidth_bytes_per_sec: float = 0.0
+    throttle_rate: float = 0.0
+    unavailable_rate: float = 0.0
+    retry_after: Optional[int] = None
+    session_ttl: Optional[float] = None
+    seed: int = 0
+
+
+@dataclass
+class _Session:
+    created: float
+    project: Optional[Tuple[str, str]] = None
+
+
+@dataclass
+class FakeServerStats:
+    """What the server saw: requests per route, injected faults and bytes sent."""
+    requests: Dict[str, int] = field(default_factory=dict)
+    statuses: Dict[int, int] = field(default_factory=dict)
+    throttled: int = 0
+    unavailable: int = 0
+    logins: int = 0
+    range_requests: int = 0
+    bytes_sent: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": dict(self.requests),
+            "statuses": {str(k): v for k, v in self.statuses.items()},
+            "throttled": self.throttled,
+            "unavailable": self.unavailable,
+            "logins": self.logins,
+            "range_requests": self.range_requests,
+            "bytes_sent": self.bytes_sent,
+        }
+
+
+def build_payload(path: Path, size: int, analysis_db: Optional[Path] = None, seed: int = 0) -> Path:
+    """
+    Write a synthetic analyzed-result zip of roughly ``size`` bytes.
+
+    The zip holds ``Analysis/<name>.db`` (``analysis_db`` if given, else a
+    ``size``-byte filler) stored uncompressed, so transfer size is predictable.
+    """
+    rng = random.Random(seed)
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_STORED) as archive:
+        if analysis_db is not None:
+            archive.write(analysis_db, f"Analysis/{Path(analysis_db).name}")
+        else:
+            with archive.open("Analysis/Results.db", "w", force_zip64=size > 2**31) as out:
+                block = rng.randbytes(_STREAM_CHUNK)
+                remaining = size
+                while remaining > 0:
+                    out.write(block[:remaining])
+                    remaining -= _STREAM_CHUNK
+    return path
+
+
+class FakeLREServer:
+    """
+    Local stand-in for an LRE server, for network benchmarks and deterministic tests.
+
+    Implements the endpoints in api.endpoints: client authentication (cookie
+    session), project login, logout, the runs query, results listing, result
+    data download with Range/ETag support, and hosts CRUD. Runs, results and
+    hosts are synthetic and generated from ``config.seed``.
+
+    Fault and network shaping are driven by FakeLREConfig: a per-request latency
+    with jitter, a per-connection bandwidth cap on response bodies, random 429
+    (with optional Retry-After) and 503 responses, and session expiry (401).
+
+    Usable as a context manager; the server runs on a background thread and
+    ``url`` is what settings.lre_server should point at.
+    """
+
+    def __init__(self, config: Optional[FakeLREConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or FakeLREConfig()
+        self.stats = FakeServerStats()
+        self._lock = threading.Lock()
+        self._rng = random.Random(self.config.seed)
+        self._sessions: Dict[str, _Session] = {}
+        self._runs = self._make_runs()
+        self._hosts: Dict[int, Dict[str, Any]] = {
+            i: {"id": i, "name": f"lg{i:03d}.example.com", "description": "Load generator"}
+            for i in range(1, self.config.hosts + 1)
+        }
+        self._next_host_id = self.config.hosts + 1
+        self._tmp = tempfile.TemporaryDirectory(prefix="fake_lre_")
+        self.payload = build_payload(Path(self._tmp.name) / "payload.zip", self.config.payload_bytes,
+                                     self.config.analysis_db, self.config.seed)
+        self.payload_size = self.payload.stat().st_size
+        self.payload_etag = '"' + hashlib.sha1(f"{self.payload_size}:{self.config.seed}".encode()).hexdigest() + '"'
+
+        self.httpd = ThreadingHTTPServer((host, port), _FakeLREHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.fake = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeLREServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, kwargs={"poll_interval": 0.05},
+                                        name="fake-lre", daemon=True)
+        self._thread.start()
+        log.info(f"Fake LRE server on {self.url} ({self.config.runs} runs, "
+                 f"{self.payload_size / 2**20:,.1f} MiB result payload)")
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        self._tmp.cleanup()
+
+    def __enter__(self) -> "FakeLREServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.stats = FakeServerStats()
+
+    # -------------------- DATA --------------------
+
+    def _make_runs(self) -> Dict[int, Dict[str, Any]]:
+        rng = random.Random(self.config.seed)
+        start = datetime(2026, 1, 1, 8, 0, 0)
+        runs = {}
+        for run_id in range(1, self.config.runs + 1):
+            began = start + timedelta(hours=6 * run_id)
+            duration = timedelta(minutes=rng.choice((30, 60, 90)))
+            runs[run_id] = {
+                "Id": run_id,
+                "TestId": (run_id - 1) % max(1, self.config.tests) + 1,
+                "TestName": f"Test {(run_id - 1) % max(1, self.config.tests) + 1}",
+                "State": "Finished",
+                "Start": began.strftime("%Y-%m-%d %H:%M:%S"),
+                "End": (began + duration).strftime("%Y-%m-%d %H:%M:%S"),
+                "Duration": int(duration.total_seconds() // 60),
+                "RunSLAStatus": rng.choice(("Passed", "Failed")),
+                "TotalHits": rng.randint(10_000, 1_000_000),
+                "MaxVusers": rng.choice((50, 100, 250, 500)),
+                "Errors": rng.randint(0, 500),
+            }
+        return runs
+
+    def results_for(self, run_id: int) -> List[Dict[str, Any]]:
+        return [
+            {"ID": run_id * 10 + i, "RunID": run_id, "Type": result_type,
+             "Name": f"{result_type.replace(' ', '')}_{run_id}.zip"}
+            for i, result_type in enumerate(_RESULT_TYPES, start=1)
+        ]
+
+    # -------------------- BEHAVIOUR --------------------
+
+    def count(self, route: str, status: int, sent: int = 0) -> None:
+        with self._lock:
+            self.stats.requests[route] = self.stats.requests.get(route, 0) + 1
+            self.stats.statuses[status] = self.stats.statuses.get(status, 0) + 1
+            self.stats.bytes_sent += sent
+
+    def delay(self) -> float:
+        """Latency to add to this request, in seconds."""
+        cfg = self.config
+        if not cfg.latency_ms and not cfg.latency_jitter_ms:
+            return 0.0
+        with self._lock:
+            jitter = self._rng.uniform(0, cfg.latency_jitter_ms) if cfg.latency_jitter_ms else 0.0
+        return (cfg.latency_ms + jitter) / 1000
+
+    def injected_fault(self) -> Optional[int]:
+        """429 or 503 for this request, per the configured rates, or None."""
+        cfg = self.config
+        if not cfg.throttle_rate and not cfg.unavailable_rate:
+            return None
+        with self._lock:
+            draw = self._rng.random()
+            if draw < cfg.throttle_rate:
+                self.stats.throttled += 1
+                return HTTPStatus.TOO_MANY_REQUESTS
+            if draw < cfg.throttle_rate + cfg.unavailable_rate:
+                self.stats.unavailable += 1
+                return HTTPStatus.SERVICE_UNAVAILABLE
+        return None
+
+    def open_session(self) -> str:
+        token = secrets.token_hex(16)
+        with self._lock:
+            self._sessions[token] = _Session(time.monotonic())
+            self.stats.logins += 1
+        return token
+
+    def session(self, token: Optional[str]) -> Optional[_Session]:
+        with self._lock:
+            session = self._sessions.get(token) if token else None
+            if session is not None and self.config.session_ttl is not None \
+                    and time.monotonic() - session.created > self.config.session_ttl:
+                del self._sessions[token]
+                return None
+            return session
+
+    def close_session(self, token: Optional[str]) -> None:
+        with self._lock:
+            self._sessions.pop(token, None)
+
+    def query_runs(self, payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Apply LRE run filters/sorting/paging (EqualTo, NotEqualTo, GreaterThan, LessThan, Between)."""
+        runs = list(self._runs.values())
+        for f in payload.get("Filters") or []:
+            name, kind, values = f.get("Field"), f.get("Type", "EqualTo"), f.get("Values") or []
+            if kind == "EqualTo":
+                wanted = {str(v) for v in values}
+                runs = [r for r in runs if str(r.get(name)) in wanted]
+            elif kind == "NotEqualTo":
+                unwanted = {str(v) for v in values}
+                runs = [r for r in runs if str(r.get(name)) not in unwanted]
+            elif kind == "GreaterThan":
+                runs = [r for r in runs if r.get(name) is not None and r[name] > type(r[name])(values[0])]
+            elif kind == "LessThan":
+                runs = [r for r in runs if r.get(name) is not None and r[name] < type(r[name])(values[0])]
+            elif kind == "Between":
+                low, high = values[0], values[1]
+                runs = [r for r in runs if r.get(name) is not None
+                        and type(r[name])(low) <= r[name] <= type(r[name])(high)]
+            else:
+                raise ValueError(f"Unsupported filter type '{kind}'")
+        for s in reversed(payload.get("Sorting") or []):
+            runs.sort(key=lambda r: r.get(s["Field"]), reverse=s.get("Direction") == "Descending")
+        page_index, page_size = int(payload.get("PageIndex", -1)), int(payload.get("PageSize", 0))
+        if page_index >= 0 and page_size > 0:
+            runs = runs[page_index * page_size:(page_index + 1) * page_size]
+        return runs
+
+    def add_host(self, spec: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            host = {"id": self._next_host_id, "name": spec.get("name", ""), "description": spec.get("description", "")}
+            self._hosts[host["id"]] = host
+            self._next_host_id += 1
+        return host
+
+    def get_host(self, host_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._hosts.get(host_id)
+
+    def list_hosts(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._hosts.values())
+
+    def delete_host(self, host_id: int) -> bool:
+        with self._lock:
+            return self._hosts.pop(host_id, None) is not None
+
+
+def _parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """(first, last) byte of a single ``bytes=`` range, or None if unsatisfiable."""
+    match = re.fullmatch(r"bytes=(\d*)-(\d*)", header.strip())
+    if not match or match.group(1) == match.group(2) == "":
+        return None
+    if match.group(1) == "":
+        first, last = max(0, size - int(match.group(2))), size - 1
+    else:
+        first = int(match.group(1))
+        last = min(int(match.group(2)), size - 1) if match.group(2) else size - 1
+    return (first, last) if first <= last < size else None
+
+
+class _FakeLREHandler(BaseHTTPRequestHandler):
+    """Routes requests to the FakeLREServer attached to the HTTP server."""
+
+    server_version = "FakeLRE/1.0"
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; without this each response waits on a delayed ACK
+    disable_nagle_algorithm = True
+
+    # Matched against the lower-cased path; LRE paths are case-insensitive
+    ROUTES = [
+        ("POST", re.compile(r"^/loadtest/rest/authentication-point/authenticateclient$"), "authenticate", False),
+        ("GET", re.compile(r"^/loadtest/rest-pcweb/login/logintoproject$"), "login_project", False),
+        ("GET", re.compile(r"^/loadtest/rest/authentication-point/logout$"), "logout", False),
+        ("POST", re.compile(r"^/loadtest/rest-pcweb/runs/get$"), "runs", True),
+        ("GET", re.compile(r"^/loadtest/rest/domains/[^/]+/projects/[^/]+/runs/(\d+)/results$"), "results", True),
+        ("GET", re.compile(r"^/loadtest/rest/domains/[^/]+/projects/[^/]+/runs/(\d+)/results/(\d+)/data$"),
+         "result_data", True),
+        ("GET", re.compile(r"^/loadtest/rest/domains/[^/]+/projects/[^/]+/hosts$"), "list_hosts", True),
+        ("POST", re.compile(r"^/loadtest/rest/domains/[^/]+/projects/[^/]+/hosts$"), "add_host", True),
+        ("GET", re.compile(r"^/loadtest/rest/domains/[^/]+/projects/[^/]+/hosts/(\d+)$"), "get_host", True),
+        ("DELETE", re.compile(r"^/loadtest/rest/domains/[^/]+/projects/[^/]+/hosts/(\d+)$"), "delete_host", True),
+        ("GET", re.compile(r"^/__fake/stats$"), "fake_stats", False),
+    ]
+
+    @property
+    def fake(self) -> FakeLREServer:
+        return self.server.fake
+
+    def log_message(self, format, *args):
+        log.debug("%s - %s", self.address_string(), format % args)
+
+    # -------------------- RESPONSES --------------------
+
+    def _cookies(self) -> Dict[str, str]:
+        cookies = {}
+        for part in (self.headers.get("Cookie") or "").split(";"):
+            name, _, value = part.strip().partition("=")
+            if name:
+                cookies[name] = value
+        return cookies
+
+    def _reply(self, route: str, status: int, body: Any = b"", headers: Optional[Dict[str, str]] = None) -> None:
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json" if body else "text/plain")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        # Count before writing so the stats are current by the time the client sees the response
+        self.fake.count(route, status, len(body))
+        self._write(body)
+
+    def _write(self, data: bytes) -> None:
+        """Write a response body, paced to the configured bandwidth cap."""
+        rate = self.fake.config.bandwidth_bytes_per_sec
+        if not rate:
+            self.wfile.write(data)
+            return
+        started = time.monotonic()
+        for offset in range(0, len(data), _STREAM_CHUNK):
+            self.wfile.write(data[offset:offset + _STREAM_CHUNK])
+            ahead = (offset + _STREAM_CHUNK) / rate - (time.monotonic() - started)
+            if ahead > 0:
+                time.sleep(ahead)
+
+    def _read_json(self) -> Any:
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length)) if length else None
+
+    def _dispatch(self, method: str) -> None:
+        url = urlsplit(self.path)
+        path = url.path.lower()
+        for route_method, pattern, handler, needs_session in self.ROUTES:
+            match = pattern.match(path)
+            if route_method != method or not match:
+                continue
+            # Read the body first so the connection stays usable for keep-alive
+            body = self._read_json() if method in ("POST", "PUT") else None
+            delay = self.fake.delay()
+            if delay:
+                time.sleep(delay)
+            fault = self.fake.injected_fault() if handler != "fake_stats" else None
+            if fault is not None:
+                retry_after = self.fake.config.retry_after
+                headers = {"Retry-After": str(retry_after)} if retry_after is not None and fault == 429 else None
+                return self._reply(handler, fault, {"ErrorMessage": HTTPStatus(fault).phrase}, headers)
+            if needs_session:
+                session = self.fake.session(self._cookies().get(SESSION_COOKIE))
+                if session is None:
+                    return self._reply(handler, HTTPStatus.UNAUTHORIZED, {"ErrorMessage": "Session expired"})
+                if session.project is None:
+                    return self._reply(handler, HTTPStatus.UNAUTHORIZED, {"ErrorMessage": "Not authenticated to project"})
+            query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+            try:
+                return getattr(self, f"_{handler}")(*match.groups(), body=body, query=query)
+            except (ValueError, KeyError, TypeError) as e:
+                return self._reply(handler, HTTPStatus.BAD_REQUEST, {"ErrorMessage": str(e)})
+        if method in ("POST", "PUT"):
+            self._read_json()
+        self._reply("unknown", HTTPStatus.NOT_FOUND, {"ErrorMessage": f"No such endpoint: {method} {url.path}"})
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    # -------------------- HANDLERS --------------------
+
+    def _authenticate(self, body, query):
+        cfg = self.fake.config
+        if not body or body.get("ClientIdKey") != cfg.client_id or body.get("ClientSecretKey") != cfg.client_secret:
+            return self._reply("authenticate", HTTPStatus.UNAUTHORIZED, {"ErrorMessage": "Invalid client credentials"})
+        token = self.fake.open_session()
+        return self._reply("authenticate", HTTPStatus.OK, {"Token": token},
+                           {"Set-Cookie": f"{SESSION_COOKIE}={token}; Path=/; HttpOnly"})
+
+    def _login_project(self, body, query):
+        token = self._cookies().get(SESSION_COOKIE)
+        session = self.fake.session(token)
+        if session is None:
+            return self._reply("login_project", HTTPStatus.UNAUTHORIZED, {"ErrorMessage": "Not authenticated"})
+        session.project = (query.get("domain", ""), query.get("project", ""))
+        return self._reply("login_project", HTTPStatus.OK, {"Domain": session.project[0], "Project": session.project[1]},
+                           {"Set-Cookie": f"{PROJECT_COOKIE}={secrets.token_hex(8)}; Path=/"})
+
+    def _logout(self, body, query):
+        self.fake.close_session(self._cookies().get(SESSION_COOKIE))
+        return self._reply("logout", HTTPStatus.OK, b"")
+
+    def _runs(self, body, query):
+        return self._reply("runs", HTTPStatus.OK, self.fake.query_runs(body or {}))
+
+    def _results(self, run_id, body, query):
+        if int(run_id) not in self.fake._runs:
+            return self._reply("results", HTTPStatus.NOT_FOUND, {"ErrorMessage": f"Run {run_id} not found"})
+        return self._reply("results", HTTPStatus.OK, self.fake.results_for(int(run_id)))
+
+    def _result_data(self, run_id, result_id, body, query):
+        fake = self.fake
+        if int(run_id) not in fake._runs or not 0 < int(result_id) - int(run_id) * 10 <= len(_RESULT_TYPES):
+            return self._reply("result_data", HTTPStatus.NOT_FOUND, {"ErrorMessage": f"Result {result_id} not found"})
+        if self.headers.get("If-None-Match") == fake.payload_etag:
+            return self._reply("result_data", HTTPStatus.NOT_MODIFIED, b"", {"ETag": fake.payload_etag})
+
+        size = fake.payload_size
+        first, last, status = 0, size - 1, HTTPStatus.OK
+        headers = {"Accept-Ranges": "bytes", "ETag": fake.payload_etag}
+        range_header = self.headers.get("Range")
+        if range_header and self.headers.get("If-Range", fake.payload_etag) == fake.payload_etag:
+            with fake._lock:
+                fake.stats.range_requests += 1
+            byte_range = _parse_range(range_header, size)
+            if byte_range is None:
+                return self._reply("result_data", HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE, b"",
+                                   {"Content-Range": f"bytes */{size}"})
+            first, last = byte_range
+            status = HTTPStatus.PARTIAL_CONTENT
+            headers["Content-Range"] = f"bytes {first}-{last}/{size}"
+
+        length = last - first + 1
+        self.send_response(status)
+        self.send_header("Content-Type", "application/zip")
+        self.send_header("Content-Length", str(length))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        sent = 0
+        try:
+            with open(fake.payload, "rb") as f:
+                f.seek(first)
+                while sent < length:
+                    chunk = f.read(min(_STREAM_CHUNK * 16, length - sent))
+                    if not chunk:
+                        break
+                    self._write(chunk)
+                    sent += len(chunk)
+        except (BrokenPipeError, ConnectionResetError):
+            log.debug("Client closed the connection during a result download")
+        fake.count("result_data", status, sent)
+
+    def _list_hosts(self, body, query):
+        return self._reply("list_hosts", HTTPStatus.OK, self.fake.list_hosts())
+
+    def _add_host(self, body, query):
+        if not body or not body.get("name"):
+            raise ValueError("Host name is required")
+        return self._reply("add_host", HTTPStatus.CREATED, self.fake.add_host(body))
+
+    def _get_host(self, host_id, body, query):
+        host = self.fake.get_host(int(host_id))
+        if host is None:
+            return self._reply("get_host", HTTPStatus.NOT_FOUND, {"ErrorMessage": f"Host {host_id} not found"})
+        return self._reply("get_host", HTTPStatus.OK, host)
+
+    def _delete_host(self, host_id, body, query):
+        deleted = self.fake.delete_host(int(host_id))
+        return self._reply("delete_host", HTTPStatus.OK if deleted else HTTPStatus.NOT_FOUND,
+                           b"" if deleted else {"ErrorMessage": f"Host {host_id} not found"})
+
+    def _fake_stats(self, body, query):
+        return self._reply("fake_stats", HTTPStatus.OK, self.fake.stats.to_dict())
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run a local fake LRE server until interrupted.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--runs", type=int, default=50, help="Synthetic runs")
+    parser.add_argument("--payload-mb", type=float, default=8.0, help="Result zip size (MiB)")
+    parser.add_argument("--analysis-db", type=Path, help="Serve this analysis DB inside the result zip")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Added latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Random extra latency, up to this much")
+    parser.add_argument("--bandwidth-mbps", type=float, default=0.0, help="Per-connection cap in MiB/s (0 = none)")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests answered 429")
+    parser.add_argument("--unavailable-rate", type=float, default=0.0, help="Fraction of requests answered 503")
+    parser.add_argument("--retry-after", type=int, help="Retry-After seconds sent with 429")
+    parser.add_argument("--session-ttl", type=float, help="Seconds before sessions expire (401)")
+    args = parser.parse_args(argv)
+
+    config = FakeLREConfig(
+        runs=args.runs,
+        payload_bytes=int(args.payload_mb * 2**20),
+        analysis_db=args.analysis_db,
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.jitter_ms,
+        bandwidth_bytes_per_sec=args.bandwidth_mbps * 2**20,
+        throttle_rate=args.throttle_rate,
+        unavailable_rate=args.unavailable_rate,
+        retry_after=args.retry_after,
+        session_ttl=args.session_ttl,
+    )
+    server = FakeLREServer(config, args.host, args.port).start()
+    print(f"Fake LRE server on {server.url} (client id {config.client_id!r}, secret {config.client_secret!r})")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+# Libraries that must only load once analytics, DB or async code is actually used
+HEAVY_MODULES = ("pandas", "numpy", "tdigest", "pyarrow", "aiohttp", "pydantic", "pydantic_settings")
+
+DEFAULT_MODULE = "lre_client.main"
+DEFAULT_BUDGET_MS = 300.0
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s?( *)(\S+)$")
+
+
+@dataclass
+class ImportProfile:
+    """Parsed ``-X importtime`` output of one interpreter start."""
+    module: str
+    total_ms: float
+    cumulative_ms: Dict[str, float] = field(default_factory=dict, repr=False)
+
+    @property
+    def modules(self) -> List[str]:
+        return list(self.cumulative_ms)
+
+    def loaded(self, names: Sequence[str]) -> List[str]:
+        """Top-level packages from ``names`` that were imported."""
+        return [name for name in names if name in self.cumulative_ms]
+
+    def slowest(self, limit: int = 10) -> List[tuple]:
+        """Package-level modules (``a.b`` and shorter) with the highest cumulative import time."""
+        top = [(name, ms) for name, ms in self.cumulative_ms.items() if name.count(".") <= 1]
+        return sorted(top, key=lambda item: item[1], reverse=True)[:limit]
+
+
+def profile_import(module: str = DEFAULT_MODULE, python: str = sys.executable) -> ImportProfile:
+    """Import ``module`` in a fresh interpreter with ``-X importtime`` and parse the timings."""
+    proc = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{proc.stderr[-2000:]}")
+
+    cumulative: Dict[str, float] = {}
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            cumulative[match.group(4)] = int(match.group(2)) / 1000
+    return ImportProfile(module, cumulative.get(module, 0.0), cumulative)
+
+
+def check_startup(
+        module: str = DEFAULT_MODULE,
+        budget_ms: float = DEFAULT_BUDGET_MS,
+        forbidden: Sequence[str] = HEAVY_MODULES,
+        repeat: int = 5,
+) -> List[str]:
+    """
+    Measure ``module``'s import time and check it against the startup budget.
+
+    The median of ``repeat`` fresh-interpreter imports is compared with the
+    budget, so one cold disk cache does not fail the check.
+
+    :return: Violations; empty when the budget holds and no forbidden module was imported
+    """
+    profiles = [profile_import(module) for _ in range(max(1, repeat))]
+    median_ms = statistics.median(p.total_ms for p in profiles)
+
+    violations = []
+    if median_ms > budget_ms:
+        violations.append(f"{module} imports in {median_ms:.1f} ms (budget {budget_ms:.0f} ms)")
+    for name in profiles[0].loaded(forbidden):
+        violations.append(f"{module} eagerly imports {name}")
+    return violations
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Check lre_client import time against a startup budget.")
+    parser.add_argument("--module", default=DEFAULT_MODULE, help="Module to import")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="Median import time budget")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh-interpreter imports to take the median of")
+    parser.add_argument("--top", type=int, default=10, help="Slowest packages to list")
+    args = parser.parse_args(argv)
+
+    profile = profile_import(args.module)
+    print(f"{args.module}: {profile.total_ms:.1f} ms")
+    for name, ms in profile.slowest(args.top):
+        print(f"  {ms:8.1f} ms  {name}")
+
+    violations = check_startup(args.module, args.budget_ms, repeat=args.repeat)
+    for violation in violations:
+        print(f"FAIL: {violation}")
+    if not violations:
+        print(f"OK: within {args.budget_ms:.0f} ms, no heavy modules loaded")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from lre_client.utils.logger import configure_logging, get_logger, shutdown_logging
+
+# Roughly what an authenticated session carries on every request
+_SESSION_HEADERS = {
+    "User-Agent": "python-requests/2.32",
+    "Accept-Encoding": "gzip, deflate",
+    "Accept": "application/json",
+    "Connection": "keep-alive",
+    "Content-Type": "application/json",
+    "Cookie": "LWSSO_COOKIE_KEY=" + "x" * 200 + "; QCSession=" + "y" * 40,
+}
+_URL = "https://lre.example.com/LoadTest/rest-pcweb/v1/domains/D/projects/P/Runs/1234"
+
+
+def _time_per_call(fn: Callable[[], None], number: int) -> float:
+    """Mean microseconds per call on the calling thread."""
+    start = time.perf_counter()
+    for _ in range(number):
+        fn()
+    return (time.perf_counter() - start) / number * 1e6
+
+
+def _request_log_eager(log: logging.Logger) -> Callable[[], None]:
+    """LRERequestExecutor.execute before: merge headers and call debug() unconditionally."""
+    def call():
+        headers = {**_SESSION_HEADERS, **{"X-Request": "1"}}
+        log.debug(f"HTTP GET {_URL} | headers={headers} | params={None} | json={None} | timeout={60}")
+    return call
+
+
+def _request_log_lazy(log: logging.Logger) -> Callable[[], None]:
+    """LRERequestExecutor.execute now: build arguments only when DEBUG is enabled."""
+    def call():
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("HTTP %s %s | headers=%s | params=%s | json=%s | timeout=%s",
+                      "GET", _URL, {**_SESSION_HEADERS, **{"X-Request": "1"}}, None, None, 60)
+    return call
+
+
+def _chunk_log_eager(log: logging.Logger, level: int) -> Callable[[], None]:
+    state = {"n": 0}
+
+    def call():
+        state["n"] += 1
+        log.log(level, f"Processed {state['n'] * 100_000:,} rows, {1234:,} active groups")
+    return call
+
+
+def _chunk_log_lazy(log: logging.Logger, level: int) -> Callable[[], None]:
+    state = {"n": 0}
+
+    def call():
+        state["n"] += 1
+        log.log(level, "Processed %d rows, %d active groups", state["n"] * 100_000, 1234)
+    return call
+
+
+def run(number: int = 20_000) -> List[Tuple[str, float, float]]:
+    """
+    Measure caller-side logging overhead before/after the queue-backed setup.
+
+    "Before" uses a synchronous stream handler and eager f-strings; "after" uses
+    the QueueHandler/QueueListener setup and lazy arguments. Records are written
+    to a temporary file so real I/O is included.
+
+    :return: (scenario, before µs/call, after µs/call)
+    """
+    log = get_logger("lre_client.benchmark")
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp, open(os.path.join(tmp, "bench.log"), "w") as out:
+        def measure(level: int, use_queue: bool, fn: Callable[[], None]) -> float:
+            configure_logging(level=level, use_queue=use_queue, stream=out)
+            try:
+                return _time_per_call(fn, number)
+            finally:
+                shutdown_logging()
+
+        results.append((
+            "request log, DEBUG off",
+            measure(logging.INFO, False, _request_log_eager(log)),
+            measure(logging.INFO, True, _request_log_lazy(log)),
+        ))
+        results.append((
+            "request log, DEBUG on",
+            measure(logging.DEBUG, False, _request_log_eager(log)),
+            measure(logging.DEBUG, True, _request_log_lazy(log)),
+        ))
+        results.append((
+            "chunk log, DEBUG off",
+            measure(logging.INFO, False, _chunk_log_eager(log, logging.DEBUG)),
+            measure(logging.INFO, True, _chunk_log_lazy(log, logging.DEBUG)),
+        ))
+        results.append((
+            "chunk log, INFO written",
+            measure(logging.INFO, False, _chunk_log_eager(log, logging.INFO)),
+            measure(logging.INFO, True, _chunk_log_lazy(log, logging.INFO)),
+        ))
+
+    configure_logging()
+    return results
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure per-request and per-chunk logging overhead.")
+    parser.add_argument("--number", type=int, default=20_000, help="Log calls per scenario")
+    args = parser.parse_args(argv)
+
+    results = run(args.number)
+    print(f"{'scenario':<26}{'before µs':>12}{'after µs':>12}{'speedup':>10}")
+    for name, before, after in results:
+        print(f"{name:<26}{before:>12.2f}{after:>12.2f}{before / after:>9.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+from benchmarks.fake_lre_server import FakeLREConfig, FakeLREServer
+from lre_client.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+# Network conditions each scenario is measured under
+PROFILES: Dict[str, FakeLREConfig] = {
+    "local": FakeLREConfig(),
+    "wan": FakeLREConfig(latency_ms=20.0, latency_jitter_ms=20.0, bandwidth_bytes_per_sec=20 * 2**20),
+    "throttled": FakeLREConfig(latency_ms=5.0, throttle_rate=0.05, unavailable_rate=0.02),
+}
+SCENARIOS = ("run_status", "runs_batch", "results_list", "hosts", "download")
+
+
+@dataclass
+class BenchmarkResult:
+    """Client-side throughput and latency of one scenario under one profile."""
+    profile: str
+    scenario: str
+    operations: int
+    errors: int
+    wall_seconds: float
+    latencies_ms: List[float]
+    bytes_received: int = 0
+    server_faults: int = 0
+
+    @property
+    def ops_per_second(self) -> float:
+        return self.operations / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    @property
+    def mib_per_second(self) -> float:
+        return self.bytes_received / 2**20 / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Latency percentile (0-100) in ms, nearest-rank."""
+        if not self.latencies_ms:
+            return float("nan")
+        ordered = sorted(self.latencies_ms)
+        return ordered[min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))]
+
+
+def _settings(server: FakeLREServer, concurrency: int):
+    """Settings pointing an LREClient at ``server``, ignoring the project's .env file."""
+    from lre_client.config import BaseLRESettings
+
+    return BaseLRESettings(
+        _env_file=None,
+        lre_server=server.url,
+        lre_client_id=server.config.client_id,
+        lre_client_secret=server.config.client_secret,
+        lre_domain="DEFAULT",
+        lre_project="benchmark",
+        lre_max_concurrency=concurrency,
+        lre_retry_backoff=0.1,
+        lre_max_retries=5,
+        lre_cache_enabled=False,
+    )
+
+
+def _measure(profile: str, scenario: str, server: FakeLREServer, calls: Sequence[Callable[[], int]],
+             workers: int) -> BenchmarkResult:
+    """Run ``calls`` on ``workers`` threads; each call returns the bytes it received."""
+    latencies: List[float] = []
+    received = [0]
+    errors = [0]
+    lock = threading.Lock()
+
+    def timed(call: Callable[[], int]) -> None:
+        started = time.perf_counter()
+        size, failed = 0, 0
+        try:
+            size = call() or 0
+        except Exception as e:
+            failed = 1
+            log.debug("%s/%s call failed: %s", profile, scenario, e)
+        with lock:
+            latencies.append((time.perf_counter() - started) * 1000)
+            received[0] += size
+            errors[0] += failed
+
+    server.reset_stats()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="lre-bench") as pool:
+        list(pool.map(timed, calls))
+    wall = time.perf_counter() - started
+    faults = server.stats.throttled + server.stats.unavailable
+    return BenchmarkResult(profile, scenario, len(calls), errors[0], wall, latencies, received[0], faults)
+
+
+def run_profile(
+        profile: str,
+        config: FakeLREConfig,
+        scenarios: Sequence[str] = SCENARIOS,
+        requests: int = 200,
+        downloads: int = 8,
+        workers: int = 8,
+) -> List[BenchmarkResult]:
+    """
+    Start a fake server with ``config`` and measure every scenario against it
+    through a single authenticated LREClient shared by ``workers`` threads.
+    """
+    from lre_client.api.client import LREClient
+
+    results = []
+    with FakeLREServer(config) as server, tempfile.TemporaryDirectory(prefix="lre_bench_") as tmp:
+        run_ids = list(range(1, server.config.runs + 1))
+        with LREClient(_settings(server, workers)) as lre:
+            for scenario in scenarios:
+                if scenario == "run_status":
+                    calls = [lambda i=i: lre.runs.get_run_status(run_ids[i % len(run_ids)]) and 0
+                             for i in range(requests)]
+                elif scenario == "runs_batch":
+                    calls = [lambda: lre.runs.get_runs_status(run_ids, batch_size=10) and 0
+                             for _ in range(max(1, requests // 10))]
+                elif scenario == "results_list":
+                    calls = [lambda i=i: lre.results.get_run_results(run_ids[i % len(run_ids)]) and 0
+                             for i in range(requests)]
+                elif scenario == "hosts":
+                    def host_roundtrip(i: int) -> int:
+                        host = lre.hosts.add_host(f"bench-{i}.example.com")
+                        lre.hosts.get_host(host["id"])
+                        lre.hosts.delete_host(host["id"])
+                        return 0
+                    calls = [lambda i=i: host_roundtrip(i) for i in range(max(1, requests // 3))]
+                elif scenario == "download":
+                    def download(i: int) -> int:
+                        run_id = run_ids[i % len(run_ids)]
+                        path = lre.results.download_result_data(run_id * 10 + 1, run_id, Path(tmp) / f"r{i}.zip")
+                        size = path.stat().st_size
+                        path.unlink()
+                        return size
+                    calls = [lambda i=i: download(i) for i in range(downloads)]
+                else:
+                    raise ValueError(f"Unknown scenario '{scenario}', expected one of {list(SCENARIOS)}")
+                results.append(_measure(profile, scenario, server, calls, workers))
+    return results
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure LREClient throughput and tail latency against a fake LRE server.")
+    parser.add_argument("--profiles", default=",".join(PROFILES), help=f"Comma-separated, from {list(PROFILES)}")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help=f"Comma-separated, from {list(SCENARIOS)}")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per metadata scenario")
+    parser.add_argument("--downloads", type=int, default=8, help="Result downloads per profile")
+    parser.add_argument("--payload-mb", type=float, default=16.0, help="Result zip size (MiB)")
+    parser.add_argument("--workers", type=int, default=8, help="Client threads (and lre_max_concurrency)")
+    args = parser.parse_args(argv)
+
+    scenarios = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+    print(f"{'profile':<10}{'scenario':<14}{'ops':>6}{'err':>5}{'ops/s':>9}{'MiB/s':>8}"
+          f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}{'faults':>8}")
+    for name in (p.strip() for p in args.profiles.split(",") if p.strip()):
+        if name not in PROFILES:
+            parser.error(f"Unknown profile '{name}', expected one of {list(PROFILES)}")
+        config = replace(PROFILES[name], payload_bytes=int(args.payload_mb * 2**20))
+        for r in run_profile(name, config, scenarios, args.requests, args.downloads, args.workers):
+            print(f"{r.profile:<10}{r.scenario:<14}{r.operations:>6}{r.errors:>5}{r.ops_per_second:>9.1f}"
+                  f"{r.mib_per_second:>8.1f}{r.percentile(50):>9.1f}{r.percentile(95):>9.1f}"
+                  f"{r.percentile(99):>9.1f}{max(r.latencies_ms):>9.1f}{r.server_faults:>8}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,15 @@
+from typing import Any, Callable, Optional, Tuple, Sequence
+
 import pandas as pd
 from lre_client.db.database_manager import  SQLiteDBManager
 from lre_client.db.query_store import QueryStore
 from lre_client.analytics.percentile_calculator import PercentileCalculator
+from lre_client.analytics.errors import ErrorAnalyzer, ErrorReport
+from lre_client.analytics.monitors import MonitorAnalyzer, MonitorReport
+from lre_client.analytics.histograms import HistogramAccumulator, DEFAULT_HISTOGRAM_EDGES, DEFAULT_APDEX_THRESHOLD
+from lre_client.analytics.profiling import StageProfiler, ProfilingReport
+from lre_client.analytics.rollups import build_rollups
+from lre_client.analytics.sketches import sketch_frame
 from lre_client.utils.logger import get_logger
 
 log = get_logger(__name__)
@@ -10,41 +18,131 @@ log = get_logger(__name__)
 class LoadTestAnalyticsManager:
     """Analytics manager combining summary metrics and percentile computation."""
 
-    def __init__(self, db_path: str, chunksize: int = 100_000):
+    def __init__(self, db_path: str, chunksize: int = 100_000,
+                 trace_memory: bool = False, cprofile: bool = False, rollups: bool = True,
+                 histogram_edges: Optional[Sequence[float]] = DEFAULT_HISTOGRAM_EDGES,
+                 apdex_threshold: float = DEFAULT_APDEX_THRESHOLD,
+                 errors: bool = True, error_top_k: int = 200, error_bucket_seconds: float = 60.0,
+                 monitors: bool = True, monitor_bucket_seconds: float = 60.0):
+        """
+        :param db_path: Path to the LRE analysis SQLite database
+        :param chunksize: Rows per chunk when streaming response times
+        :param trace_memory: Record peak traced memory per stage (tracemalloc; slows the run)
+        :param cprofile: Capture a cProfile of the run into the profiling report
+        :param rollups: Also build per-transaction, per-script and overall rollups (see analytics.rollups)
+        :param histogram_edges: Response-time bucket edges (sec) for the histograms; None disables
+                                histograms and Apdex
+        :param apdex_threshold: Apdex T (sec)
+        :param errors: Also aggregate the error tables (see analytics.errors)
+        :param error_top_k: Error message templates tracked
+        :param error_bucket_seconds: Time bucket width of the error breakdowns
+        :param monitors: Also aggregate the monitor tables (see analytics.monitors)
+        :param monitor_bucket_seconds: Time bucket width of the monitor series
+        """
         self.db_path = db_path
         self.chunksize = chunksize
+        self.trace_memory = trace_memory
+        self.cprofile = cprofile
+        self.rollups = rollups
+        self.histogram_edges = histogram_edges
+        self.apdex_threshold = apdex_threshold
+        self.errors = errors
+        self.error_top_k = error_top_k
+        self.error_bucket_seconds = error_bucket_seconds
+        self.monitors = monitors
+        self.monitor_bucket_seconds = monitor_bucket_seconds
+        self.last_report: Optional[ProfilingReport] = None
+        self.last_analytics: Optional[pd.DataFrame] = None
+        # Serialized t-digest per transaction from the last run, see analytics.sketches
+        self.last_sketches: Optional[pd.DataFrame] = None
+        # Rollup levels of the last run, built from its rows and sketches
+        self.last_rollups: Optional[pd.DataFrame] = None
+        # Long-format histograms and per-transaction Apdex of the last run, see analytics.histograms
+        self.last_histograms: Optional[pd.DataFrame] = None
+        self.last_apdex: Optional[pd.DataFrame] = None
+        # Error templates, breakdowns and timeline of the last run (None without error tables)
+        self.last_errors: Optional[ErrorReport] = None
+        # Host/resource monitor statistics and series of the last run (None without monitor tables)
+        self.last_monitors: Optional[MonitorReport] = None
 
-    def _get_summary_df(self) -> pd.DataFrame:
+    def _get_summary_df(self, profiler: StageProfiler) -> pd.DataFrame:
         """Fetch summary metrics using optimized SQLiteDBManager."""
         log.info("Fetching summary metrics...")
-        with SQLiteDBManager(self.db_path) as db:
-            df_summary = db.query_single(QueryStore.SQL_TRANSACTION_SUMMARY)
+        with profiler.stage("summary_query") as stats:
+            with SQLiteDBManager(self.db_path) as db:
+                df_summary = db.query_single(QueryStore.SQL_TRANSACTION_SUMMARY)
+            stats.rows += len(df_summary)
         log.info(f"Fetched summary for {len(df_summary):,} transaction groups")
         return df_summary
 
-    def _get_percentiles_df(self) -> pd.DataFrame:
+    def _get_percentiles_df(self, profiler: StageProfiler) -> pd.DataFrame:
         """Compute percentiles using PercentileCalculator."""
         log.info("Computing percentiles...")
-        calculator = PercentileCalculator(self.db_path, self.chunksize)
+        histogram = HistogramAccumulator(self.histogram_edges, self.apdex_threshold) \
+            if self.histogram_edges else None
+        calculator = PercentileCalculator(self.db_path, self.chunksize, profiler=profiler, histogram=histogram)
         df_percentiles = calculator.compute_percentiles()
+        self.last_sketches = sketch_frame(calculator.digests)
+        if histogram is not None:
+            self.last_histograms = histogram.histogram_frame()
+            self.last_apdex = histogram.apdex_frame()
         log.info(f"Computed percentiles for {len(df_percentiles):,} transaction groups")
         return df_percentiles
 
+    @staticmethod
+    def _optional_stage(name: str, fn: Callable[[], Any]) -> Any:
+        """Run an optional analytics stage; a failure is logged and yields None instead of failing the run."""
+        log.info(f"Aggregating {name} analytics...")
+        try:
+            return fn()
+        except Exception as e:
+            log.warning(f"Skipping {name} analytics: {e}")
+            return None
+
     def run(self) -> pd.DataFrame:
         """Run full analytics workflow: summary + percentiles + merge."""
-        df_summary = self._get_summary_df()
-        df_percentiles = self._get_percentiles_df()
-
-        log.info("Merging summary and percentile data...")
-        df_final = df_summary.merge(
-            df_percentiles,
-            on=["Script_Name", "Transaction_Name"],
-            how="left"
-        )
-
-        # Fill any missing percentiles with 0
-        percentile_cols = ['p50', 'p90', 'p95', 'p99']
-        df_final[percentile_cols] = df_final[percentile_cols].fillna(0.0)
-
-        log.info(f"Final dataset contains {len(df_final):,} rows")
-        return df_final
\ No newline at end of file
+        df_final, _ = self.run_with_report()
+        return df_final
+
+    def run_with_report(self) -> Tuple[pd.DataFrame, ProfilingReport]:
+        """Run the analytics workflow and return the DataFrame with its stage profiling report."""
+        profiler = StageProfiler(trace_memory=self.trace_memory, cprofile=self.cprofile)
+        profiler.start()
+        try:
+            df_summary = self._get_summary_df(profiler)
+            df_percentiles = self._get_percentiles_df(profiler)
+            if self.errors:
+                self.last_errors = self._optional_stage("error", lambda: ErrorAnalyzer(
+                    self.db_path, self.chunksize, self.error_top_k, self.error_bucket_seconds,
+                    profiler=profiler).run())
+            if self.monitors:
+                self.last_monitors = self._optional_stage("monitor", lambda: MonitorAnalyzer(
+                    self.db_path, self.chunksize, self.monitor_bucket_seconds, profiler=profiler).run())
+
+            log.info("Merging summary and percentile data...")
+            with profiler.stage("merge", rows=len(df_summary)):
+                df_final = df_summary.merge(
+                    df_percentiles,
+                    on=["Script_Name", "Transaction_Name"],
+                    how="left"
+                )
+
+                # Fill any missing percentiles with 0
+                percentile_cols = ['p50', 'p90', 'p95', 'p99']
+                df_final[percentile_cols] = df_final[percentile_cols].fillna(0.0)
+
+            log.info(f"Final dataset contains {len(df_final):,} rows")
+            self.last_analytics = df_final
+
+            if self.rollups:
+                with profiler.stage("rollups", rows=len(df_final)):
+                    self.last_rollups = build_rollups(df_final, self.last_sketches)
+
+            self.last_report = profiler.report(self.db_path, chunksize=self.chunksize, result_rows=len(df_final))
+        finally:
+            # A failed stage must not leave cProfile/tracemalloc running in a long-lived worker
+            profiler.stop()
+
+        log.info(f"Analytics finished in {self.last_report.wall_seconds:.2f}s")
+        self.last_report.log_summary()
+        return df_final, self.last_report
\ No newline at end of file
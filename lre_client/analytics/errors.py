@@ -0,0 +1,242 @@
+import heapq
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from lre_client.analytics.profiling import StageProfiler
+from lre_client.db.database_manager import SQLiteDBManager
+from lre_client.db.query_store import QueryStore
+from lre_client.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+# Applied in order, so the more specific masks come first. The patterns use
+# explicit ASCII classes and no lookaround, and are compiled with re.ASCII, so
+# Python's re (normalize_message) and RE2 (normalize_messages) agree on any
+# input; non-ASCII letters and digits are left unmasked by both.
+MESSAGE_MASKS: List[Tuple[str, str]] = [
+    (r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}", "<uuid>"),
+    (r"[A-Za-z0-9_.+-]+@[A-Za-z0-9_-]+\.[A-Za-z0-9_.-]+", "<email>"),
+    (r"\b[0-9]{1,3}(?:\.[0-9]{1,3}){3}(?::[0-9]+)?\b", "<ip>"),
+    (r"\b0[xX][0-9a-fA-F]+\b", "<hex>"),
+    (r"\b[0-9a-fA-F]*(?:[0-9][0-9a-fA-F]*[a-fA-F]|[a-fA-F][0-9a-fA-F]*[0-9])[0-9a-fA-F]*\b", "<hex>"),
+    (r"=[^ \t\n\r\f\v&;,\"']+", "=<value>"),
+    (r"[0-9]+(?:[.,][0-9]+)*", "<n>"),
+    (r"[ \t\n\r\f\v]+", " "),
+]
+_COMPILED_MASKS = [(re.compile(pattern, re.ASCII), mask) for pattern, mask in MESSAGE_MASKS]
+
+
+def normalize_message(message: str) -> str:
+    """Error message template: IDs, numbers and parameter values masked, whitespace collapsed."""
+    for pattern, mask in _COMPILED_MASKS:
+        message = pattern.sub(mask, message)
+    return message.strip()
+
+
+def normalize_messages(messages: pa.Array) -> pa.Array:
+    """normalize_message() over a whole string array with pyarrow's vectorized RE2 kernels."""
+    for pattern, mask in MESSAGE_MASKS:
+        messages = pc.replace_substring_regex(messages, pattern, mask)
+    return pc.utf8_trim_whitespace(messages)
+
+
+@dataclass
+class _Tracked:
+    count: int
+    overestimate: int
+    sample: str
+    first_seen: float
+    last_seen: float
+    codes: Dict[int, int] = field(default_factory=dict)
+
+
+class ErrorAggregator:
+    """
+    Bounded streaming aggregation of error rows.
+
+    Messages are reduced to templates once per distinct message of a chunk,
+    with vectorized regex replacement (normalize_messages).
+    The heaviest templates are tracked with the Space-Saving algorithm: at
+    most ``top_k`` templates are held, a new template replaces the smallest
+    one and inherits its count as an overestimate bound, so any template with
+    more than total/top_k errors is guaranteed to be tracked. Per-template
+    (script, injector, time bucket) breakdowns exist only for tracked
+    templates; the all-errors timeline per (script, injector, time bucket) is
+    exact. Memory is bounded by top_k and the number of scripts, injectors
+    and buckets, not by the number of error rows.
+    """
+
+    def __init__(self, top_k: int = 200, bucket_seconds: float = 60.0):
+        """
+        :param top_k: Message templates tracked
+        :param bucket_seconds: Width of the time buckets (seconds since scenario start)
+        """
+        if top_k < 1 or bucket_seconds <= 0:
+            raise ValueError("top_k must be >= 1 and bucket_seconds > 0")
+        self.top_k = top_k
+        self.bucket_seconds = float(bucket_seconds)
+
+        self.total_errors = 0
+        # Templates that entered the tracked set, counting re-admissions after eviction
+        self.templates_admitted = 0
+        self._templates: Dict[str, _Tracked] = {}
+        self._heap: List[Tuple[int, str]] = []
+        self._breakdown: Dict[str, Dict[Tuple[str, str, float], int]] = {}
+        self._timeline: Dict[Tuple[str, str, float], int] = {}
+
+    @staticmethod
+    def _templates_of(messages: pd.Series) -> np.ndarray:
+        codes, uniques = pd.factorize(messages.fillna(""), sort=False)
+        templates = normalize_messages(pa.array(np.asarray(uniques, dtype=object), type=pa.string()))
+        return np.asarray(templates.to_pylist(), dtype=object)[codes]
+
+    def _evict_smallest(self) -> int:
+        """Drop the smallest tracked template (lazy heap entries are refreshed) and return its count."""
+        while True:
+            count, template = heapq.heappop(self._heap)
+            tracked = self._templates.get(template)
+            if tracked is None:
+                continue
+            if tracked.count != count:
+                heapq.heappush(self._heap, (tracked.count, template))
+                continue
+            del self._templates[template]
+            self._breakdown.pop(template, None)
+            return count
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """Fold in a chunk of SQL_ERROR_EVENTS rows."""
+        if chunk.empty:
+            return
+        frame = pd.DataFrame({
+            "template": self._templates_of(chunk["Error_Message"].astype(str)),
+            "message": chunk["Error_Message"].to_numpy(),
+            "Script_Name": chunk["Script_Name"].fillna("").to_numpy(),
+            "Injector": chunk["Injector"].fillna("").astype(str).to_numpy(),
+            "bucket": (np.floor(chunk["End_Time"].fillna(0).to_numpy(dtype=float) / self.bucket_seconds)
+                       * self.bucket_seconds),
+            "time": chunk["End_Time"].to_numpy(dtype=float),
+            "code": chunk["Error_Code"].fillna(0).to_numpy(dtype=np.int64),
+        })
+        self.total_errors += len(frame)
+
+        for key, count in frame.groupby(["Script_Name", "Injector", "bucket"], sort=False).size().items():
+            self._timeline[key] = self._timeline.get(key, 0) + int(count)
+
+        per_template = frame.groupby("template", sort=False).agg(
+            count=("template", "size"), sample=("message", "first"),
+            first_seen=("time", "min"), last_seen=("time", "max"),
+        )
+        # Largest first, so a chunk's heavy templates are not evicted by its light ones
+        for template, row in per_template.sort_values("count", ascending=False).iterrows():
+            count = int(row["count"])
+            tracked = self._templates.get(template)
+            if tracked is None:
+                self.templates_admitted += 1
+                floor = self._evict_smallest() if len(self._templates) >= self.top_k else 0
+                tracked = self._templates[template] = _Tracked(floor, floor, row["sample"],
+                                                               row["first_seen"], row["last_seen"])
+            tracked.count += count
+            tracked.first_seen = min(tracked.first_seen, row["first_seen"])
+            tracked.last_seen = max(tracked.last_seen, row["last_seen"])
+            heapq.heappush(self._heap, (tracked.count, template))
+        if len(self._heap) > 4 * self.top_k:
+            self._heap = [(t.count, name) for name, t in self._templates.items()]
+            heapq.heapify(self._heap)
+
+        tracked_rows = frame[frame["template"].isin(self._templates.keys())]
+        for (template, script, injector, bucket, code), count in tracked_rows.groupby(
+                ["template", "Script_Name", "Injector", "bucket", "code"], sort=False).size().items():
+            breakdown = self._breakdown.setdefault(template, {})
+            breakdown[(script, injector, bucket)] = breakdown.get((script, injector, bucket), 0) + int(count)
+            codes = self._templates[template].codes
+            codes[code] = codes.get(code, 0) + int(count)
+
+    # -------------------- RESULTS --------------------
+
+    def top_errors(self) -> pd.DataFrame:
+        """
+        Tracked templates, most frequent first. ``Count`` may overestimate by up to
+        ``Count_Overestimate`` (0 for templates tracked since their first error).
+        """
+        rows = [{
+            "Template": template,
+            "Count": t.count,
+            "Count_Overestimate": t.overestimate,
+            "Share": t.count / self.total_errors if self.total_errors else np.nan,
+            "Error_Codes": ",".join(str(c) for c, _ in sorted(t.codes.items(), key=lambda kv: -kv[1])),
+            "First_Seen": t.first_seen,
+            "Last_Seen": t.last_seen,
+            "Sample_Message": t.sample,
+        } for template, t in self._templates.items()]
+        frame = pd.DataFrame(rows, columns=["Template", "Count", "Count_Overestimate", "Share", "Error_Codes",
+                                            "First_Seen", "Last_Seen", "Sample_Message"])
+        return frame.sort_values("Count", ascending=False, kind="stable").reset_index(drop=True)
+
+    def breakdown(self) -> pd.DataFrame:
+        """Long format: Template, Script_Name, Injector, Time_Bucket, Count for the tracked templates."""
+        rows = [(template, script, injector, bucket, count)
+                for template, cells in self._breakdown.items()
+                for (script, injector, bucket), count in cells.items()]
+        return pd.DataFrame(rows, columns=["Template", "Script_Name", "Injector", "Time_Bucket", "Count"])
+
+    def timeline(self) -> pd.DataFrame:
+        """Exact error counts of all templates per Script_Name, Injector and Time_Bucket."""
+        rows = [(script, injector, bucket, count) for (script, injector, bucket), count in self._timeline.items()]
+        return (pd.DataFrame(rows, columns=["Script_Name", "Injector", "Time_Bucket", "Count"])
+                .sort_values(["Time_Bucket", "Script_Name", "Injector"]).reset_index(drop=True))
+
+
+@dataclass
+class ErrorReport:
+    """Output of ErrorAnalyzer.run()."""
+    total_errors: int
+    templates_admitted: int
+    top_errors: pd.DataFrame = field(repr=False)
+    breakdown: pd.DataFrame = field(repr=False)
+    timeline: pd.DataFrame = field(repr=False)
+
+
+class ErrorAnalyzer:
+    """Streams the error rows of an analysis DB through an ErrorAggregator."""
+
+    def __init__(self, db_path: str, chunksize: int = 100_000, top_k: int = 200,
+                 bucket_seconds: float = 60.0, profiler: Optional[StageProfiler] = None):
+        self.db_path = db_path
+        self.chunksize = chunksize
+        self.top_k = top_k
+        self.bucket_seconds = bucket_seconds
+        self.profiler = profiler or StageProfiler()
+
+    def run(self) -> Optional[ErrorReport]:
+        """Aggregate all error rows; None when the DB has no error tables or they lack expected columns."""
+        aggregator = ErrorAggregator(self.top_k, self.bucket_seconds)
+        with SQLiteDBManager(self.db_path, default_chunk_size=self.chunksize) as db:
+            if not db.has_tables(*QueryStore.SQL_ERROR_TABLES):
+                log.info("Analysis DB has no error tables; skipping error analytics")
+                return None
+            missing = db.missing_columns(QueryStore.SQL_ERROR_COLUMNS)
+            if missing:
+                log.warning(f"Error tables lack columns {missing}; skipping error analytics")
+                return None
+            for chunk in self.profiler.iterate(db.query(QueryStore.SQL_ERROR_EVENTS),
+                                               "error_sql_execute", "error_chunk_fetch"):
+                with self.profiler.stage("error_aggregate", rows=len(chunk)):
+                    aggregator.update(chunk)
+
+        report = ErrorReport(
+            total_errors=aggregator.total_errors,
+            templates_admitted=aggregator.templates_admitted,
+            top_errors=aggregator.top_errors(),
+            breakdown=aggregator.breakdown(),
+            timeline=aggregator.timeline(),
+        )
+        log.info(f"Aggregated {report.total_errors:,} errors into {len(report.top_errors):,} tracked templates "
+                 f"({report.templates_admitted:,} admitted)")
+        return report
@@ -0,0 +1,123 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from lre_client.config.constants import DEFAULT_HISTOGRAM_EDGES, DEFAULT_APDEX_THRESHOLD
+from lre_client.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+
+class HistogramAccumulator:
+    """
+    Streaming per-transaction response-time histograms and Apdex counts.
+
+    Fed with the chunks of SQL_TRANSACTION_RESPONSE_TIMES (one weighted row per
+    response time), it keeps a (transactions x buckets) count matrix plus
+    satisfied/tolerating counts per transaction. Each chunk is folded in with
+    one ``np.searchsorted`` and one ``np.bincount``, so memory stays at
+    O(transactions x buckets) regardless of the number of samples.
+
+    Bucket i counts samples with ``edges[i-1] < t <= edges[i]``; the first
+    bucket starts at 0 and the last one is open-ended. Apdex uses the usual
+    definition: satisfied ``t <= T``, tolerating ``T < t <= 4T``, score
+    ``(satisfied + tolerating / 2) / total``.
+    """
+
+    def __init__(self, edges: Sequence[float] = DEFAULT_HISTOGRAM_EDGES,
+                 apdex_threshold: float = DEFAULT_APDEX_THRESHOLD):
+        """
+        :param edges: Increasing bucket upper edges in seconds
+        :param apdex_threshold: Apdex T in seconds
+        """
+        self.edges = np.asarray(sorted(set(float(e) for e in edges)), dtype=float)
+        if self.edges.size == 0 or self.edges[0] <= 0:
+            raise ValueError("Histogram edges must be positive and non-empty")
+        if apdex_threshold <= 0:
+            raise ValueError("Apdex threshold must be positive")
+        self.apdex_threshold = float(apdex_threshold)
+
+        self.n_buckets = self.edges.size + 1
+        self._keys: Dict[Tuple[str, str], int] = {}
+        self._counts = np.zeros((0, self.n_buckets))
+        # Columns: satisfied, tolerating weights per transaction
+        self._apdex = np.zeros((0, 2))
+
+    def _group_ids(self, scripts: np.ndarray, txns: np.ndarray) -> np.ndarray:
+        """Stable row of every (script, transaction) in the count matrix, growing it for new keys."""
+        codes, uniques = pd.factorize(pd.MultiIndex.from_arrays([scripts, txns]), sort=False)
+        ids = np.empty(len(uniques), dtype=np.int64)
+        for i, key in enumerate(uniques):
+            ids[i] = self._keys.setdefault(key, len(self._keys))
+        if len(self._keys) > self._counts.shape[0]:
+            grow = max(len(self._keys), 2 * self._counts.shape[0]) - self._counts.shape[0]
+            self._counts = np.vstack([self._counts, np.zeros((grow, self.n_buckets))])
+            self._apdex = np.vstack([self._apdex, np.zeros((grow, 2))])
+        return ids[codes]
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """Fold in a chunk with Script_Name, Transaction_Name, Response_Times and Counts columns."""
+        if chunk.empty:
+            return
+        ids = self._group_ids(chunk["Script_Name"].to_numpy(), chunk["Transaction_Name"].to_numpy())
+        times = chunk["Response_Times"].to_numpy(dtype=float)
+        weights = chunk["Counts"].to_numpy(dtype=float)
+
+        size = self._counts.shape[0]
+        buckets = np.searchsorted(self.edges, times, side="left")
+        self._counts += np.bincount(ids * self.n_buckets + buckets, weights=weights,
+                                    minlength=size * self.n_buckets).reshape(size, self.n_buckets)
+
+        satisfied = times <= self.apdex_threshold
+        tolerating = ~satisfied & (times <= 4 * self.apdex_threshold)
+        self._apdex[:, 0] += np.bincount(ids, weights=weights * satisfied, minlength=size)
+        self._apdex[:, 1] += np.bincount(ids, weights=weights * tolerating, minlength=size)
+
+    def _key_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(list(self._keys), columns=["Script_Name", "Transaction_Name"])
+
+    def histogram_frame(self) -> pd.DataFrame:
+        """
+        Long-format histograms: one row per (transaction, non-empty bucket) with
+        bucket_lower, bucket_upper (inf for the last bucket) and count.
+        """
+        n = len(self._keys)
+        counts = self._counts[:n]
+        rows, buckets = np.nonzero(counts)
+        lower = np.r_[0.0, self.edges]
+        upper = np.r_[self.edges, np.inf]
+        keys = self._key_frame()
+        return pd.DataFrame({
+            "Script_Name": keys["Script_Name"].to_numpy()[rows],
+            "Transaction_Name": keys["Transaction_Name"].to_numpy()[rows],
+            "bucket": buckets.astype(np.int16),
+            "bucket_lower": lower[buckets],
+            "bucket_upper": upper[buckets],
+            "count": counts[rows, buckets].astype(np.int64),
+        })
+
+    def apdex_frame(self) -> pd.DataFrame:
+        """Per transaction: satisfied, tolerating, frustrated and total counts and the Apdex score."""
+        n = len(self._keys)
+        frame = self._key_frame()
+        total = self._counts[:n].sum(axis=1)
+        satisfied, tolerating = self._apdex[:n, 0], self._apdex[:n, 1]
+        frame["Apdex_T"] = self.apdex_threshold
+        frame["satisfied"] = satisfied.astype(np.int64)
+        frame["tolerating"] = tolerating.astype(np.int64)
+        frame["frustrated"] = (total - satisfied - tolerating).astype(np.int64)
+        frame["total"] = total.astype(np.int64)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            frame["Apdex"] = np.round((satisfied + tolerating / 2) / total, 3)
+        return frame
+
+
+def merge_histograms(histograms: pd.DataFrame, by: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Re-aggregate long-format histograms over fewer keys (e.g. ``["Transaction_Name"]``
+    or ``[]`` for one overall histogram); buckets add up because they share edges.
+    """
+    by = list(by or [])
+    return (histograms.groupby(by + ["bucket", "bucket_lower", "bucket_upper"], sort=True)["count"]
+            .sum().reset_index())
@@ -0,0 +1,230 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from lre_client.analytics.profiling import StageProfiler
+from lre_client.analytics.sketches import grouped_quantiles
+from lre_client.db.database_manager import SQLiteDBManager
+from lre_client.db.query_store import QueryStore
+from lre_client.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+MONITOR_KEY = ["Host", "Monitor", "Metric"]
+
+
+class MonitorAccumulator:
+    """
+    Streaming per-(host, metric) statistics of monitor samples.
+
+    Rows are grouped by their integer (Host ID, Event ID) codes, like the
+    transaction stages: each chunk maps its codes to dense slots once, then
+    count/sum/min/max are folded in with ``bincount`` and ``minimum.at`` /
+    ``maximum.at``. Percentiles come from a bounded centroid sketch per slot:
+    raw samples are buffered and, once a slot holds more than ``compress_at``
+    points, re-binned into at most ``centroids`` weighted centroids (narrower
+    at the tails, as in a t-digest) with one sort and ``add.reduceat`` for all
+    slots at once.
+    Time-bucketed series are pre-aggregated per chunk and folded into one
+    per-(slot, bucket) frame every ``fold_every`` chunks, so memory is
+    O(series points), not O(samples) or O(chunks).
+    """
+
+    def __init__(self, bucket_seconds: float = 60.0, centroids: int = 200, compress_at: int = 2_000,
+                 fold_every: int = 8):
+        """
+        :param bucket_seconds: Width of the time-series buckets (seconds since scenario start)
+        :param centroids: Centroids kept per (host, metric) after compression
+        :param compress_at: Points per (host, metric) that trigger a compression
+        :param fold_every: Per-chunk series partials kept before they are folded together
+        """
+        if bucket_seconds <= 0 or centroids < 2 or compress_at <= centroids or fold_every < 1:
+            raise ValueError("bucket_seconds must be > 0, 2 <= centroids < compress_at and fold_every >= 1")
+        self.bucket_seconds = float(bucket_seconds)
+        self.centroids = centroids
+        self.compress_at = compress_at
+        self.fold_every = fold_every
+
+        self._slots: Dict[int, int] = {}
+        self._keys: List[int] = []
+        self._count = np.zeros(0)
+        self._sum = np.zeros(0)
+        self._min = np.zeros(0)
+        self._max = np.zeros(0)
+        # Sketch points (slot, value, weight), compressed when a slot grows past compress_at
+        self._points: List[np.ndarray] = [np.empty(0, dtype=np.int64), np.empty(0), np.empty(0)]
+        self._series: List[pd.DataFrame] = []
+
+    @staticmethod
+    def _code(host_ids: np.ndarray, event_ids: np.ndarray) -> np.ndarray:
+        return (host_ids.astype(np.int64) << 32) | (event_ids.astype(np.int64) & 0xFFFFFFFF)
+
+    def _slots_of(self, codes: np.ndarray) -> np.ndarray:
+        uniques, inverse = np.unique(codes, return_inverse=True)
+        slots = np.empty(uniques.size, dtype=np.int64)
+        for i, code in enumerate(uniques.tolist()):
+            slot = self._slots.get(code)
+            if slot is None:
+                slot = self._slots[code] = len(self._keys)
+                self._keys.append(code)
+            slots[i] = slot
+        grow = len(self._keys) - self._count.size
+        if grow > 0:
+            self._count = np.r_[self._count, np.zeros(grow)]
+            self._sum = np.r_[self._sum, np.zeros(grow)]
+            self._min = np.r_[self._min, np.full(grow, np.inf)]
+            self._max = np.r_[self._max, np.full(grow, -np.inf)]
+        return slots[inverse]
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """Fold in a chunk of SQL_MONITOR_VALUES rows."""
+        if chunk.empty:
+            return
+        slots = self._slots_of(self._code(chunk["Host_ID"].to_numpy(), chunk["Event_ID"].to_numpy()))
+        values = chunk["Value"].to_numpy(dtype=float)
+        size = self._count.size
+
+        self._count += np.bincount(slots, minlength=size)
+        self._sum += np.bincount(slots, weights=values, minlength=size)
+        np.minimum.at(self._min, slots, values)
+        np.maximum.at(self._max, slots, values)
+
+        buckets = np.floor(chunk["End_Time"].fillna(0).to_numpy(dtype=float) / self.bucket_seconds).astype(np.int64)
+        self._series.append(pd.DataFrame({"slot": slots, "bucket": buckets, "value": values})
+                            .groupby(["slot", "bucket"], sort=False)["value"]
+                            .agg(["count", "sum", "max"]).reset_index())
+        if len(self._series) > self.fold_every:
+            self._fold_series()
+
+        self._points = [np.r_[self._points[0], slots], np.r_[self._points[1], values],
+                        np.r_[self._points[2], np.ones(values.size)]]
+        if np.bincount(self._points[0], minlength=size).max() > self.compress_at:
+            self._compress()
+
+    def _fold_series(self) -> pd.DataFrame:
+        """Combine the buffered series partials into one frame per (slot, bucket)."""
+        folded = (pd.concat(self._series, ignore_index=True)
+                  .groupby(["slot", "bucket"], sort=True)
+                  .agg(count=("count", "sum"), sum=("sum", "sum"), max=("max", "max")).reset_index())
+        self._series = [folded]
+        return folded
+
+    def _compress(self) -> None:
+        """Re-bin every slot's points into at most ``centroids`` centroids."""
+        slots, values, weights = self._points
+        order = np.lexsort((values, slots))
+        slots, values, weights = slots[order], values[order], weights[order]
+        starts = np.flatnonzero(np.r_[True, slots[1:] != slots[:-1]])
+        cumulative = np.cumsum(weights)
+        before = np.repeat(cumulative[starts] - weights[starts], np.diff(np.r_[starts, slots.size]))
+        totals = np.repeat(np.add.reduceat(weights, starts), np.diff(np.r_[starts, slots.size]))
+        # Bin of every point by the rank of its weight midpoint within its slot, on the
+        # t-digest k1 (arcsine) scale so bins get narrower towards the tails
+        rank = (cumulative - before - weights / 2) / totals
+        scale = np.arcsin(2 * rank - 1) / np.pi + 0.5
+        bins = slots * self.centroids + np.minimum((scale * self.centroids).astype(np.int64), self.centroids - 1)
+        bin_starts = np.flatnonzero(np.r_[True, bins[1:] != bins[:-1]])
+        bin_weights = np.add.reduceat(weights, bin_starts)
+        self._points = [slots[bin_starts],
+                        np.add.reduceat(values * weights, bin_starts) / bin_weights,
+                        bin_weights]
+
+    # -------------------- RESULTS --------------------
+
+    def _key_frame(self, hosts: Dict[int, str], metrics: pd.DataFrame) -> pd.DataFrame:
+        codes = np.asarray(self._keys, dtype=np.int64)
+        host_ids, event_ids = codes >> 32, codes & 0xFFFFFFFF
+        names = metrics.drop_duplicates("Event_ID").set_index("Event_ID").reindex(event_ids)
+        return pd.DataFrame({
+            "Host": [hosts.get(int(h), str(int(h))) for h in host_ids],
+            "Monitor": names["Monitor"].fillna("").to_numpy(),
+            "Metric": names["Metric"].fillna(pd.Series(event_ids.astype(str), index=names.index)).to_numpy(),
+        })
+
+    def summary_frame(self, hosts: Dict[int, str], metrics: pd.DataFrame,
+                      quantiles: Sequence[float] = (0.95,)) -> pd.DataFrame:
+        """Per (Host, Monitor, Metric): Samples, Minimum, Average, Maximum and p<q> columns."""
+        frame = self._key_frame(hosts, metrics)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            frame["Samples"] = self._count.astype(np.int64)
+            frame["Minimum"] = np.where(self._count > 0, self._min, np.nan)
+            frame["Average"] = self._sum / self._count
+            frame["Maximum"] = np.where(self._count > 0, self._max, np.nan)
+        values = grouped_quantiles(self._points[0], self._points[1], self._points[2], quantiles, len(self._keys))
+        for i, q in enumerate(quantiles):
+            frame[f"p{round(q * 100):g}"] = values[:, i]
+        return frame.sort_values(MONITOR_KEY, kind="stable").reset_index(drop=True)
+
+    def series_frame(self, hosts: Dict[int, str], metrics: pd.DataFrame) -> pd.DataFrame:
+        """Per (Host, Monitor, Metric, Time_Bucket): Samples, Average and Maximum."""
+        columns = MONITOR_KEY + ["Time_Bucket", "Samples", "Average", "Maximum"]
+        if not self._series:
+            return pd.DataFrame(columns=columns)
+        series = self._fold_series()
+        keys = self._key_frame(hosts, metrics).iloc[series["slot"].to_numpy()].reset_index(drop=True)
+        keys["Time_Bucket"] = series["bucket"].to_numpy() * self.bucket_seconds
+        keys["Samples"] = series["count"].to_numpy().astype(np.int64)
+        keys["Average"] = series["sum"].to_numpy() / series["count"].to_numpy()
+        keys["Maximum"] = series["max"].to_numpy()
+        return keys[columns]
+
+
+@dataclass
+class MonitorReport:
+    """Output of MonitorAnalyzer.run()."""
+    summary: pd.DataFrame = field(repr=False)
+    series: pd.DataFrame = field(repr=False)
+
+    def for_hosts(self, hosts: Sequence[str]) -> "MonitorReport":
+        """
+        Only the given hosts, e.g. RunSummary.get_lgs_list(). Names match
+        case-insensitively, on the full name or the part before the first dot.
+        """
+        wanted = {h.lower() for h in hosts} | {h.split(".", 1)[0].lower() for h in hosts}
+
+        def select(frame: pd.DataFrame) -> pd.DataFrame:
+            names = frame["Host"].astype(str).str.lower()
+            return frame[names.isin(wanted) | names.str.split(".", n=1).str[0].isin(wanted)].reset_index(drop=True)
+
+        return MonitorReport(select(self.summary), select(self.series))
+
+
+class MonitorAnalyzer:
+    """Streams the monitor samples of an analysis DB through a MonitorAccumulator."""
+
+    def __init__(self, db_path: str, chunksize: int = 100_000, bucket_seconds: float = 60.0,
+                 profiler: Optional[StageProfiler] = None):
+        self.db_path = db_path
+        self.chunksize = chunksize
+        self.bucket_seconds = bucket_seconds
+        self.profiler = profiler or StageProfiler()
+
+    def run(self) -> Optional[MonitorReport]:
+        """Aggregate all monitor samples; None when the DB has no monitor tables or they lack expected columns."""
+        accumulator = MonitorAccumulator(self.bucket_seconds)
+        with SQLiteDBManager(self.db_path, default_chunk_size=self.chunksize) as db:
+            if not db.has_tables(*QueryStore.SQL_MONITOR_TABLES):
+                log.info("Analysis DB has no monitor tables; skipping monitor analytics")
+                return None
+            missing = db.missing_columns(QueryStore.SQL_MONITOR_COLUMNS)
+            if missing:
+                log.warning(f"Monitor tables lack columns {missing}; skipping monitor analytics")
+                return None
+            for chunk in self.profiler.iterate(db.query(QueryStore.SQL_MONITOR_VALUES),
+                                               "monitor_sql_execute", "monitor_chunk_fetch"):
+                with self.profiler.stage("monitor_aggregate", rows=len(chunk)):
+                    accumulator.update(chunk)
+            metrics = db.query_single(QueryStore.SQL_MONITOR_NAMES)
+            hosts = db.query_single(QueryStore.SQL_HOST_NAMES)
+
+        if metrics.empty:
+            metrics = pd.DataFrame(columns=["Event_ID", "Monitor", "Metric"])
+        host_names = dict(zip(hosts["Host_ID"].astype(int), hosts["Host"].astype(str))) if not hosts.empty else {}
+        with self.profiler.stage("monitor_finalize"):
+            report = MonitorReport(accumulator.summary_frame(host_names, metrics),
+                                   accumulator.series_frame(host_names, metrics))
+        log.info(f"Aggregated {int(report.summary['Samples'].sum()):,} monitor samples "
+                 f"for {len(report.summary):,} host metrics")
+        return report
@@ -70,7 +70,7 @@ class PercentileCalculator:
 
                 # Optional: Log progress for very large datasets
                 if chunk_count % 10 == 0:
-                    log.debug(f"Processed {chunk_count} chunks, {len(group_data):,} active groups")
+                    log.debug("Processed %d chunks, %d active groups", chunk_count, len(group_data))
 
         log.info(f"Processed {total_rows:,} rows across {chunk_count} chunks")
         log.info(f"Computing percentiles for {len(group_data):,} transaction groups")
@@ -86,7 +86,7 @@ class PercentileCalculator:
 
             # Skip groups with insufficient data
             if times_array.size < 2:
-                log.debug(f"Insufficient data for {script}/{txn}: {times_array.size} points")
+                log.debug("Insufficient data for %s/%s: %d points", script, txn, times_array.size)
                 continue
 
             try:
@@ -1,7 +1,9 @@
 import pandas as pd
-from typing import Dict, Tuple
+from typing import Dict, Tuple, Optional
 from lre_client.utils.logger import get_logger
 from tdigest import TDigest
+from lre_client.analytics.profiling import StageProfiler
+from lre_client.analytics.histograms import HistogramAccumulator
 
 from lre_client.db.database_manager import  SQLiteDBManager
 from lre_client.db.query_store import QueryStore
@@ -12,9 +14,15 @@ log = get_logger(__name__)
 class PercentileCalculator:
     """Production-grade percentile calculator using optimized chunked processing."""
 
-    def __init__(self, db_path: str, chunksize: int = 100_000):
+    def __init__(self, db_path: str, chunksize: int = 100_000, profiler: Optional[StageProfiler] = None,
+                 histogram: Optional[HistogramAccumulator] = None):
         self.db_path = db_path
         self.chunksize = chunksize
+        self.profiler = profiler or StageProfiler()
+        # Fed with the same chunks, so histograms and Apdex cost no extra scan
+        self.histogram = histogram
+        # Per (script, transaction) digests of the last computation, kept as mergeable sketches
+        self.digests: Dict[Tuple[str, str], TDigest] = {}
 
     def _compute_percentiles(self) -> pd.DataFrame:
         """Optimized streaming percentile computation using unified chunked processing."""
@@ -26,47 +34,52 @@ class PercentileCalculator:
 
         with SQLiteDBManager(self.db_path, default_chunk_size=self.chunksize) as db:
             # Unified chunked processing with optimizations always applied
-            for chunk in db.query(QueryStore.SQL_TRANSACTION_RESPONSE_TIMES):
+            for chunk in self.profiler.iterate(
+                    db.query(QueryStore.SQL_TRANSACTION_RESPONSE_TIMES), "sql_execute", "chunk_fetch"):
                 total_processed += len(chunk)
 
-                # Data is already filtered by SQL, but double-check
-                mask = (chunk["Response_Times"] > 0) & (chunk["Counts"] > 0)
-                chunk = chunk[mask]
-
-                if chunk.empty:
-                    continue
-
-                # Vectorized group processing with fallback
-                try:
-                    for (script, txn), group in chunk.groupby(["Script_Name", "Transaction_Name"]):
-                        if (script, txn) not in digests:
-                            digests[(script, txn)] = TDigest()
-
-                        rt_values = group["Response_Times"].to_numpy()
-                        counts = group["Counts"].to_numpy()
-
-                        # Use batch_update if available
-                        if hasattr(digests[(script, txn)], "batch_update"):
-                            digests[(script, txn)].batch_update(rt_values, counts)
-                        else:
-                            method_used = "iterative"
-                            for rt, count in zip(rt_values, counts):
-                                digests[(script, txn)].update(rt, count)
-
-                except (AttributeError, TypeError) as e:
-                    # Full fallback: row-by-row
-                    method_used = "fallback"
-                    for _, row in chunk.iterrows():
-                        script, txn = row["Script_Name"], row["Transaction_Name"]
-                        rt, count = row["Response_Times"], row["Counts"]
-                        if (script, txn) not in digests:
-                            digests[(script, txn)] = TDigest()
-                        digests[(script, txn)].update(rt, count)
+                with self.profiler.stage("groupby_ingest", rows=len(chunk)):
+                    # Data is already filtered by SQL, but double-check
+                    mask = (chunk["Response_Times"] > 0) & (chunk["Counts"] > 0)
+                    chunk = chunk[mask]
+
+                    if chunk.empty:
+                        continue
+
+                    # Vectorized group processing with fallback
+                    try:
+                        for (script, txn), group in chunk.groupby(["Script_Name", "Transaction_Name"]):
+                            if (script, txn) not in digests:
+                                digests[(script, txn)] = TDigest()
+
+                            rt_values = group["Response_Times"].to_numpy(dtype=float)
+                            counts = group["Counts"].to_numpy(dtype=float)
+
+                            # TDigest.batch_update only takes a scalar weight, so weighted rows are added one by one
+                            digest = digests[(script, txn)]
+                            for rt, count in zip(rt_values.tolist(), counts.tolist()):
+                                digest.update(rt, count)
+
+                    except (AttributeError, TypeError) as e:
+                        # Full fallback: row-by-row
+                        method_used = "fallback"
+                        for _, row in chunk.iterrows():
+                            script, txn = row["Script_Name"], row["Transaction_Name"]
+                            rt, count = row["Response_Times"], row["Counts"]
+                            if (script, txn) not in digests:
+                                digests[(script, txn)] = TDigest()
+                            digests[(script, txn)].update(rt, count)
+
+                if self.histogram is not None:
+                    with self.profiler.stage("histogram_ingest", rows=len(chunk)):
+                        self.histogram.update(chunk)
 
         log.info(f"Processed {total_processed:,} rows using {method_used} method")
         log.info(f"Computed percentiles for {len(digests):,} transaction groups")
+        self.digests = digests
 
-        return self._build_results(digests)
+        with self.profiler.stage("percentile_finalize", rows=len(digests)):
+            return self._build_results(digests)
 
     def _build_results(self, digests: Dict[Tuple[str, str], TDigest]) -> pd.DataFrame:
         """Build final percentile DataFrame with validation."""
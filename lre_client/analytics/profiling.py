@@ -0,0 +1,166 @@
+import cProfile
+import io
+import json
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Sized
+
+from lre_client.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+
+@dataclass
+class StageStats:
+    """Accumulated cost of one analytics stage (a stage may be entered many times, e.g. per chunk)."""
+    name: str
+    calls: int = 0
+    rows: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    peak_memory_bytes: Optional[int] = None
+
+    @property
+    def rows_per_second(self) -> Optional[float]:
+        if not self.rows or self.wall_seconds <= 0:
+            return None
+        return self.rows / self.wall_seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "rows_per_second": self.rows_per_second}
+
+
+@dataclass
+class ProfilingReport:
+    """Stage-level profile of one analytics run."""
+    db_path: str
+    started_at: str
+    wall_seconds: float
+    stages: List[StageStats]
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    cprofile_top: Optional[str] = field(default=None, repr=False)
+
+    def stage(self, name: str) -> Optional[StageStats]:
+        return next((s for s in self.stages if s.name == name), None)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "db_path": self.db_path,
+            "started_at": self.started_at,
+            "wall_seconds": self.wall_seconds,
+            "metadata": self.metadata,
+            "stages": [s.to_dict() for s in self.stages],
+            "cprofile_top": self.cprofile_top,
+        }
+
+    def write_json(self, path: str | Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        return path
+
+    def log_summary(self) -> None:
+        for s in self.stages:
+            rate = f", {s.rows_per_second:,.0f} rows/s" if s.rows_per_second else ""
+            peak = f", peak {s.peak_memory_bytes / 2**20:,.1f} MiB" if s.peak_memory_bytes is not None else ""
+            log.info(f"  {s.name:<22} wall {s.wall_seconds:8.3f}s  cpu {s.cpu_seconds:8.3f}s"
+                     f"  calls {s.calls:,}{rate}{peak}")
+
+
+class StageProfiler:
+    """
+    Collects wall time, CPU time, row counts and (optionally) peak traced memory per stage.
+
+    Stages are timed with ``with profiler.stage(name, rows=...)``. ``trace_memory``
+    turns on tracemalloc for the run and ``cprofile`` captures a cProfile of the
+    whole run; both add noticeable overhead and are off by default.
+    """
+
+    def __init__(self, trace_memory: bool = False, cprofile: bool = False, cprofile_limit: int = 30):
+        self.trace_memory = trace_memory
+        self.cprofile = cprofile
+        self.cprofile_limit = cprofile_limit
+        self._stages: Dict[str, StageStats] = {}
+        self._profile: Optional[cProfile.Profile] = None
+        self._started_tracing = False
+        self._start_wall = 0.0
+        self._started_at = ""
+
+    def start(self) -> None:
+        self._started_at = datetime.now().isoformat(timespec="seconds")
+        self._start_wall = time.perf_counter()
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        if self.cprofile:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+
+    @contextmanager
+    def stage(self, name: str, rows: int = 0):
+        stats = self._stages.get(name)
+        if stats is None:
+            stats = self._stages[name] = StageStats(name)
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield stats
+        finally:
+            stats.wall_seconds += time.perf_counter() - wall
+            stats.cpu_seconds += time.process_time() - cpu
+            stats.calls += 1
+            stats.rows += rows
+            if self.trace_memory and tracemalloc.is_tracing():
+                peak = tracemalloc.get_traced_memory()[1]
+                stats.peak_memory_bytes = max(stats.peak_memory_bytes or 0, peak)
+
+    def iterate(self, chunks: Iterable[Sized], first_stage: str, stage: str) -> Iterator:
+        """
+        Yield from a chunk iterator, timing the first ``next()`` as ``first_stage``
+        (query execution) and every later one as ``stage`` (chunk fetch).
+        """
+        iterator = iter(chunks)
+        current = first_stage
+        while True:
+            with self.stage(current) as stats:
+                chunk = next(iterator, None)
+                if chunk is not None:
+                    stats.rows += len(chunk)
+            if chunk is None:
+                return
+            current = stage
+            yield chunk
+
+    def stop(self) -> None:
+        """Stop cProfile and the tracemalloc session started by start(); safe to call twice."""
+        if self._profile is not None:
+            self._profile.disable()
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def report(self, db_path: str, **metadata) -> ProfilingReport:
+        """Stop optional capture and build the report."""
+        self.stop()
+        cprofile_top = None
+        if self._profile is not None:
+            buffer = io.StringIO()
+            pstats.Stats(self._profile, stream=buffer).sort_stats("cumulative").print_stats(self.cprofile_limit)
+            cprofile_top = buffer.getvalue()
+            self._profile = None
+
+        return ProfilingReport(
+            db_path=str(db_path),
+            started_at=self._started_at,
+            wall_seconds=time.perf_counter() - self._start_wall,
+            stages=list(self._stages.values()),
+            metadata=metadata,
+            cprofile_top=cprofile_top,
+        )
@@ -0,0 +1,133 @@
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from lre_client.analytics.sketches import SKETCH_MEANS, SKETCH_COUNTS, grouped_quantiles
+from lre_client.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+TXN_KEY = ["Script_Name", "Transaction_Name"]
+
+# Label used for the key a rollup aggregates away
+ROLLUP_ALL = "*"
+
+# Rollup level -> keys it keeps
+ROLLUP_LEVELS: Dict[str, List[str]] = {
+    "transaction": ["Transaction_Name"],
+    "script": ["Script_Name"],
+    "overall": [],
+}
+
+PERCENTILES = {"p50": 0.50, "p90": 0.90, "p95": 0.95, "p99": 0.99}
+
+
+def _merge_summaries(analytics: pd.DataFrame, keys: List[str]) -> pd.DataFrame:
+    """
+    Merge the summary accumulators of the (script, transaction) rows per ``keys``.
+
+    Counts add up, minimum/maximum combine, and average and standard deviation
+    are recombined from the pass-weighted first and second moments.
+    """
+    passed = analytics["Pass"].astype(float)
+    frame = pd.DataFrame({
+        "Transaction_Count": analytics["Transaction_Count"],
+        "Pass": analytics["Pass"],
+        "Fail": analytics["Fail"],
+        "Minimum": analytics["Minimum"],
+        "Maximum": analytics["Maximum"],
+        "_sum": analytics["Average"].fillna(0.0) * passed,
+        "_sum_sq": (analytics["Std_Deviation"].fillna(0.0) ** 2 + analytics["Average"].fillna(0.0) ** 2) * passed,
+    })
+    if keys:
+        frame[keys] = analytics[keys]
+        merged = frame.groupby(keys, sort=False).agg(
+            Transaction_Count=("Transaction_Count", "sum"), Minimum=("Minimum", "min"),
+            Maximum=("Maximum", "max"), Pass=("Pass", "sum"), Fail=("Fail", "sum"),
+            _sum=("_sum", "sum"), _sum_sq=("_sum_sq", "sum"),
+        ).reset_index()
+    else:
+        merged = pd.DataFrame({
+            "Transaction_Count": [frame["Transaction_Count"].sum()], "Minimum": [frame["Minimum"].min()],
+            "Maximum": [frame["Maximum"].max()], "Pass": [frame["Pass"].sum()], "Fail": [frame["Fail"].sum()],
+            "_sum": [frame["_sum"].sum()], "_sum_sq": [frame["_sum_sq"].sum()],
+        })
+
+    weight = merged["Pass"].astype(float).where(merged["Pass"] > 0)
+    average = merged["_sum"] / weight
+    variance = (merged["_sum_sq"] / weight - average ** 2).clip(lower=0.0)
+    merged["Average"] = average.round(3)
+    merged["Std_Deviation"] = np.sqrt(variance).round(3)
+    return merged.drop(columns=["_sum", "_sum_sq"])
+
+
+def _merge_sketches(sketches: pd.DataFrame, centroids: tuple, keys: List[str]) -> pd.DataFrame:
+    """
+    Percentiles per ``keys`` from the pooled centroids of the (script, transaction) sketches.
+
+    :param centroids: (sketch row, mean, count) of every centroid, flattened once by the caller
+    """
+    rows, means, counts = centroids
+    if keys:
+        group_codes, groups = pd.factorize(sketches[keys[0]] if len(keys) == 1
+                                           else pd.MultiIndex.from_frame(sketches[keys]), sort=False)
+        frame = pd.DataFrame({keys[0]: groups} if len(keys) == 1 else list(groups), columns=keys)
+    else:
+        group_codes = np.zeros(len(sketches), dtype=np.int64)
+        frame = pd.DataFrame(index=[0])
+
+    values = grouped_quantiles(group_codes[rows], means, counts, list(PERCENTILES.values()), len(frame))
+    for i, column in enumerate(PERCENTILES):
+        frame[column] = values[:, i]
+    return frame
+
+
+def build_rollups(analytics: pd.DataFrame, sketches: Optional[pd.DataFrame],
+                  levels: Sequence[str] = tuple(ROLLUP_LEVELS)) -> pd.DataFrame:
+    """
+    Aggregate the per-(script, transaction) analytics to coarser levels.
+
+    Nothing is re-read from the analysis DB: summary columns come from merging
+    the per-row accumulators and percentiles from pooling the t-digest
+    centroids of the rows (see analytics.sketches), so each level describes
+    all of its samples together rather than averaging per-row percentiles.
+
+    :param analytics: LoadTestAnalyticsManager output
+    :param sketches: LoadTestAnalyticsManager.last_sketches; percentiles are NaN without them
+    :param levels: Any of ``transaction`` (across scripts), ``script`` and ``overall``
+    :return: Analytics-shaped rows with a ``Level`` column; aggregated-away keys are ``*``
+    """
+    unknown = [level for level in levels if level not in ROLLUP_LEVELS]
+    if unknown:
+        raise ValueError(f"Unknown rollup levels: {unknown}")
+
+    centroids = None
+    if sketches is not None:
+        sketches = sketches.dropna(subset=[SKETCH_MEANS]).reset_index(drop=True)
+        lengths = sketches[SKETCH_MEANS].map(len).to_numpy()
+        if lengths.sum() > 0:
+            centroids = (np.repeat(np.arange(len(sketches)), lengths),
+                         np.concatenate(sketches[SKETCH_MEANS].to_numpy()).astype(float),
+                         np.concatenate(sketches[SKETCH_COUNTS].to_numpy()).astype(float))
+
+    frames = []
+    for level in levels:
+        keys = ROLLUP_LEVELS[level]
+        summary = _merge_summaries(analytics, keys)
+        if centroids is not None:
+            percentiles = _merge_sketches(sketches, centroids, keys)
+            summary = summary.merge(percentiles, on=keys, how="left") if keys \
+                else pd.concat([summary, percentiles], axis=1)
+        else:
+            summary = summary.assign(**{column: np.nan for column in PERCENTILES})
+        for key in TXN_KEY:
+            if key not in keys:
+                summary[key] = ROLLUP_ALL
+        summary.insert(0, "Level", level)
+        frames.append(summary)
+
+    columns = ["Level"] + TXN_KEY + [c for c in analytics.columns if c not in TXN_KEY]
+    result = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=columns)
+    log.debug("Built %d rollup rows for levels %s", len(result), list(levels))
+    return result.reindex(columns=columns)
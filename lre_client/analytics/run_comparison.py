@@ -0,0 +1,247 @@
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, Sequence, Union, Tuple
+
+import numpy as np
+import pandas as pd
+
+from lre_client.analytics.sketches import SKETCH_MEANS, SKETCH_COUNTS
+from lre_client.utils.common_utils import safe_parse_time
+from lre_client.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+TXN_KEY = ["Script_Name", "Transaction_Name"]
+
+# Metrics where a higher value is worse; for tps a lower value is worse
+LATENCY_METRICS = ("Average", "p90", "p95", "p99")
+DEFAULT_METRICS = LATENCY_METRICS + ("tps", "error_rate")
+
+
+@dataclass
+class RunAnalytics:
+    """One side of a comparison: a LoadTestAnalyticsManager result and what is known about its run."""
+    label: Union[int, str]
+    analytics: pd.DataFrame = field(repr=False)
+    duration_seconds: Optional[float] = None
+    sketches: Optional[pd.DataFrame] = field(default=None, repr=False)
+
+    @classmethod
+    def from_run(cls, run: Dict[str, Any], analytics: pd.DataFrame,
+                 sketches: Optional[pd.DataFrame] = None) -> "RunAnalytics":
+        """Build from a run dict (Id, Start, End) as returned by the runs endpoint."""
+        start, end = safe_parse_time(run.get("Start") or ""), safe_parse_time(run.get("End") or "")
+        duration = (end - start).total_seconds() if start and end and end > start else None
+        return cls(run.get("Id"), analytics, duration, sketches)
+
+    def metrics_frame(self) -> pd.DataFrame:
+        """Analytics indexed by transaction, with derived tps and error_rate columns."""
+        df = self.analytics.set_index(TXN_KEY)
+        total = df["Pass"] + df["Fail"]
+        return df.assign(
+            error_rate=df["Fail"] / total.where(total > 0),
+            tps=df["Transaction_Count"] / self.duration_seconds if self.duration_seconds else np.nan,
+        )
+
+
+def _flatten(sketches: pd.DataFrame, pair_ids: pd.Series) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pair id, centroid mean and weight of every centroid of the sketches matching ``pair_ids``.
+
+    :param sketches: Sketch rows indexed like ``pair_ids``
+    :param pair_ids: Pair id per key; a key may map to several pairs
+    """
+    joined = pair_ids.to_frame("pair").join(sketches[[SKETCH_MEANS, SKETCH_COUNTS]].dropna(), how="inner")
+    if joined.empty:
+        return np.empty(0, dtype=np.int64), np.empty(0), np.empty(0)
+    lengths = joined[SKETCH_MEANS].map(len).to_numpy()
+    return (np.repeat(joined["pair"].to_numpy(), lengths),
+            np.concatenate(joined[SKETCH_MEANS].to_numpy()).astype(float),
+            np.concatenate(joined[SKETCH_COUNTS].to_numpy()).astype(float))
+
+
+def ks_distances(current: Optional[pd.DataFrame], baselines: Optional[pd.DataFrame],
+                 pairs: pd.DataFrame) -> np.ndarray:
+    """
+    Kolmogorov-Smirnov distance between the current and baseline sketch of every pair.
+
+    All pairs are evaluated at once: the centroids of both sides are tagged with
+    their pair id and sorted by (pair, value). Each side's weighted CDF is then a
+    per-pair cumulative sum, and the distance is the per-pair maximum gap.
+    The sort uses one float key, pair id + value scaled into [0, 1), which is much
+    faster than a two-key lexsort. Values closer than ~1e-10 of the overall range
+    may tie, which is well below sketch accuracy.
+
+    :param current: Current-run sketch rows (Script_Name, Transaction_Name, centroid columns)
+    :param baselines: Baseline sketch rows with an extra ``baseline`` column
+    :param pairs: (baseline, Script_Name, Transaction_Name) rows; row position is the pair id
+    :return: KS distance per pair, NaN where either side has no sketch
+    """
+    n_pairs = len(pairs)
+    result = np.full(n_pairs, np.nan)
+    if n_pairs == 0 or current is None or baselines is None or current.empty or baselines.empty:
+        return result
+
+    pair_ids = pd.Series(np.arange(n_pairs), index=pd.MultiIndex.from_frame(pairs[["baseline"] + TXN_KEY]))
+    c_pair, c_value, c_weight = _flatten(current.set_index(TXN_KEY), pair_ids.droplevel("baseline"))
+    b_pair, b_value, b_weight = _flatten(baselines.set_index(["baseline"] + TXN_KEY), pair_ids)
+    if c_pair.size == 0 or b_pair.size == 0:
+        return result
+
+    pair = np.concatenate([c_pair, b_pair])
+    value = np.concatenate([c_value, b_value])
+    weights = {
+        "current": np.concatenate([c_weight, np.zeros_like(b_weight)]),
+        "baseline": np.concatenate([np.zeros_like(c_weight), b_weight]),
+    }
+    span = value.max() - value.min()
+    scaled = (value - value.min()) / span * 0.999 if span > 0 else np.zeros_like(value)
+    order = np.argsort(pair + scaled, kind="stable")
+    pair, value = pair[order], value[order]
+    starts = np.flatnonzero(np.r_[True, pair[1:] != pair[:-1]])
+    run_lengths = np.diff(np.r_[starts, pair.size])
+
+    cdfs = []
+    for side in ("current", "baseline"):
+        w = weights[side][order]
+        cumulative = np.cumsum(w)
+        within = cumulative - np.repeat(cumulative[starts] - w[starts], run_lengths)
+        totals = np.bincount(pair, weights=w, minlength=n_pairs)[pair]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cdfs.append(within / totals)
+
+    gap = np.nan_to_num(np.abs(cdfs[0] - cdfs[1]), nan=0.0)
+    # Compare the CDFs only after every centroid sharing a value has been counted
+    gap[np.r_[(pair[1:] == pair[:-1]) & (value[1:] == value[:-1]), False]] = 0.0
+    ks = np.zeros(n_pairs)
+    ks[pair[starts]] = np.maximum.reduceat(gap, starts)
+    has_both = (np.bincount(c_pair, minlength=n_pairs) > 0) & (np.bincount(b_pair, minlength=n_pairs) > 0)
+    result[has_both] = ks[has_both]
+    return result
+
+
+class RunComparator:
+    """
+    Compares a run's per-transaction analytics with one or more baselines.
+
+    All baselines are stacked into one frame and joined to the current run once,
+    so absolute and relative deltas for every metric, transaction and baseline
+    come from column-wise pandas/NumPy arithmetic. Distribution shift is
+    measured as the KS distance between t-digest sketches when both sides have
+    them (see ks_distances).
+
+    A transaction is flagged as regressed when a latency metric grows by more
+    than ``threshold`` (relative), TPS drops by more than ``threshold``, the
+    error rate rises by more than ``error_rate_threshold`` (absolute), or the KS
+    distance exceeds ``ks_threshold``.
+    """
+
+    def __init__(
+            self,
+            metrics: Sequence[str] = DEFAULT_METRICS,
+            threshold: float = 0.10,
+            error_rate_threshold: float = 0.01,
+            ks_threshold: float = 0.20,
+            min_count: int = 1,
+    ):
+        """
+        :param metrics: Metrics to compare (analytics columns, tps, error_rate)
+        :param threshold: Relative change counted as a regression for latency metrics and tps
+        :param error_rate_threshold: Absolute error-rate increase counted as a regression
+        :param ks_threshold: KS distance counted as a distribution regression
+        :param min_count: Transactions with fewer samples on either side are never flagged
+        """
+        self.metrics = list(metrics)
+        self.threshold = threshold
+        self.error_rate_threshold = error_rate_threshold
+        self.ks_threshold = ks_threshold
+        self.min_count = min_count
+
+    def compare(self, current: RunAnalytics, baselines: Union[RunAnalytics, Sequence[RunAnalytics]]) -> pd.DataFrame:
+        """
+        Compare ``current`` with every baseline in one pass.
+
+        :return: One row per (baseline, transaction) with ``<metric>_baseline``,
+                 ``<metric>_current``, ``<metric>_delta``, ``<metric>_pct`` (relative change),
+                 ``<metric>_regressed``, ``ks_distance``, ``presence``
+                 (both/new/missing) and an overall ``regression`` flag
+        """
+        if isinstance(baselines, RunAnalytics):
+            baselines = [baselines]
+        if not baselines:
+            raise ValueError("At least one baseline is required")
+
+        columns = list(dict.fromkeys(self.metrics + ["Transaction_Count"]))
+        cur = current.metrics_frame()[columns]
+        base = pd.concat(
+            {b.label: b.metrics_frame()[columns] for b in baselines},
+            names=["baseline"],
+        )
+
+        # Every (baseline, transaction) pair present on either side
+        labels = [b.label for b in baselines]
+        keys = pd.MultiIndex.from_arrays(
+            [np.repeat(np.asarray(labels, dtype=object), len(cur)),
+             np.tile(cur.index.get_level_values(0), len(labels)),
+             np.tile(cur.index.get_level_values(1), len(labels))],
+            names=base.index.names,
+        ).union(base.index)
+        base = base.reindex(keys)
+        cur = cur.reindex(keys.droplevel("baseline"))
+        cur.index = keys
+
+        out = pd.DataFrame(index=keys)
+        presence = np.where(base["Transaction_Count"].isna(), "new",
+                            np.where(cur["Transaction_Count"].isna(), "missing", "both"))
+        out["presence"] = presence
+
+        comparable = ((presence == "both")
+                      & (base["Transaction_Count"].fillna(0).to_numpy() >= self.min_count)
+                      & (cur["Transaction_Count"].fillna(0).to_numpy() >= self.min_count))
+        flags = []
+        for metric in self.metrics:
+            b, c = base[metric].astype(float), cur[metric].astype(float)
+            delta = c - b
+            pct = delta / b.where(b != 0)
+            out[f"{metric}_baseline"] = b
+            out[f"{metric}_current"] = c
+            out[f"{metric}_delta"] = delta
+            out[f"{metric}_pct"] = pct
+
+            if metric == "error_rate":
+                regressed = delta > self.error_rate_threshold
+            elif metric == "tps":
+                regressed = pct < -self.threshold
+            else:
+                regressed = pct > self.threshold
+            out[f"{metric}_regressed"] = regressed.fillna(False).to_numpy() & comparable
+            flags.append(f"{metric}_regressed")
+
+        pairs = out.index.to_frame(index=False)
+        base_sketches = pd.concat(
+            [b.sketches.assign(baseline=b.label) for b in baselines if b.sketches is not None],
+            ignore_index=True,
+        ) if any(b.sketches is not None for b in baselines) else None
+        out["ks_distance"] = ks_distances(current.sketches, base_sketches, pairs)
+        out["ks_regressed"] = (out["ks_distance"] > self.ks_threshold).to_numpy() & comparable
+        flags.append("ks_regressed")
+
+        out["regression"] = out[flags].any(axis=1)
+        out = out.reset_index()
+        log.info(f"Compared run {current.label} with {len(baselines)} baselines: "
+                 f"{len(out):,} transaction pairs, {int(out['regression'].sum()):,} regressions")
+        return out
+
+    @staticmethod
+    def summary(comparison: pd.DataFrame) -> pd.DataFrame:
+        """Per-baseline counts of compared, regressed, new and missing transactions."""
+        frame = comparison.assign(
+            new=comparison["presence"] == "new",
+            missing=comparison["presence"] == "missing",
+        )
+        return frame.groupby("baseline", sort=False).agg(
+            transactions=("presence", "size"),
+            regressions=("regression", "sum"),
+            new=("new", "sum"),
+            missing=("missing", "sum"),
+            max_ks_distance=("ks_distance", "max"),
+        ).reset_index()
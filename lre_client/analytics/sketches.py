@@ -0,0 +1,132 @@
+from typing import Dict, Iterable, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from tdigest import TDigest
+
+# Columns holding a serialized t-digest: centroid means and their weights
+SKETCH_MEANS = "sketch_means"
+SKETCH_COUNTS = "sketch_counts"
+
+SketchKey = Tuple[str, str]
+
+
+def digest_to_arrays(digest: TDigest) -> Tuple[np.ndarray, np.ndarray]:
+    """Centroid means and counts of a t-digest, sorted by mean."""
+    centroids = digest.centroids_to_list()
+    means = np.fromiter((c["m"] for c in centroids), dtype=float, count=len(centroids))
+    counts = np.fromiter((c["c"] for c in centroids), dtype=float, count=len(centroids))
+    order = np.argsort(means, kind="stable")
+    return means[order], counts[order]
+
+
+def digest_from_arrays(means: Sequence[float], counts: Sequence[float]) -> TDigest:
+    """Rebuild a TDigest from stored centroids."""
+    digest = TDigest()
+    digest.update_centroids_from_list([{"m": float(m), "c": float(c)} for m, c in zip(means, counts)])
+    return digest
+
+
+def sketch_frame(digests: Dict[SketchKey, TDigest]) -> pd.DataFrame:
+    """One row per (script, transaction) with the digest's centroids as list columns."""
+    rows = []
+    for (script, txn), digest in digests.items():
+        means, counts = digest_to_arrays(digest)
+        rows.append({
+            "Script_Name": script,
+            "Transaction_Name": txn,
+            SKETCH_MEANS: means,
+            SKETCH_COUNTS: counts,
+        })
+    return pd.DataFrame(rows, columns=["Script_Name", "Transaction_Name", SKETCH_MEANS, SKETCH_COUNTS])
+
+
+def merge_centroids(means: Iterable[Sequence[float]], counts: Iterable[Sequence[float]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Merge several sketches by pooling their centroids.
+
+    Centroids are weighted points, so the pooled set describes the combined
+    distribution without rebuilding a TDigest; quantiles are read from it with
+    sketch_quantiles().
+    """
+    means = [np.asarray(m, dtype=float) for m in means]
+    counts = [np.asarray(c, dtype=float) for c in counts]
+    if not means:
+        return np.empty(0), np.empty(0)
+    merged_means, merged_counts = np.concatenate(means), np.concatenate(counts)
+    order = np.argsort(merged_means, kind="stable")
+    return merged_means[order], merged_counts[order]
+
+
+def sketch_quantiles(means: Sequence[float], counts: Sequence[float], qs: Sequence[float]) -> np.ndarray:
+    """
+    Quantiles (0-1) of a sketch, interpolating between centroid midpoints as t-digest does.
+
+    Means must be sorted; returns NaN for an empty sketch.
+    """
+    means = np.asarray(means, dtype=float)
+    counts = np.asarray(counts, dtype=float)
+    qs = np.asarray(qs, dtype=float)
+    if means.size == 0 or counts.sum() <= 0:
+        return np.full(qs.shape, np.nan)
+    if means.size == 1:
+        return np.full(qs.shape, means[0])
+    cumulative = np.cumsum(counts)
+    midpoints = cumulative - counts / 2
+    return np.interp(qs * cumulative[-1], midpoints, means)
+
+
+def sketch_cdf(means: Sequence[float], counts: Sequence[float], values: Sequence[float]) -> np.ndarray:
+    """Approximate CDF of a sketch at ``values`` (inverse of sketch_quantiles)."""
+    means = np.asarray(means, dtype=float)
+    counts = np.asarray(counts, dtype=float)
+    values = np.asarray(values, dtype=float)
+    if means.size == 0 or counts.sum() <= 0:
+        return np.full(values.shape, np.nan)
+    cumulative = np.cumsum(counts)
+    midpoints = (cumulative - counts / 2) / cumulative[-1]
+    return np.interp(values, means, midpoints, left=0.0, right=1.0)
+
+
+def grouped_quantiles(group_ids: np.ndarray, means: np.ndarray, counts: np.ndarray,
+                      qs: Sequence[float], n_groups: int) -> np.ndarray:
+    """
+    Quantiles of many pooled sketches at once (same interpolation as sketch_quantiles).
+
+    :param group_ids: Group (0..n_groups-1) of every centroid
+    :param means: Centroid means, in any order
+    :param counts: Centroid weights
+    :return: (n_groups, len(qs)) array, NaN for groups without centroids
+    """
+    qs = np.asarray(qs, dtype=float)
+    result = np.full((n_groups, qs.size), np.nan)
+    keep = counts > 0
+    group_ids, means, counts = group_ids[keep], np.asarray(means, dtype=float)[keep], counts[keep]
+    if group_ids.size == 0:
+        return result
+
+    # One float sort key (group + mean scaled into [0, 1)) is much faster than a lexsort
+    span = means.max() - means.min()
+    scaled = (means - means.min()) / span * 0.999 if span > 0 else np.zeros_like(means)
+    order = np.argsort(group_ids + scaled, kind="stable")
+    group_ids, means, counts = group_ids[order], means[order], counts[order]
+    starts = np.flatnonzero(np.r_[True, group_ids[1:] != group_ids[:-1]])
+    ends = np.r_[starts[1:], group_ids.size]
+    groups = group_ids[starts]
+
+    # Midpoints on one global cumulative axis, so a single searchsorted covers every group
+    cumulative = np.cumsum(counts)
+    midpoints = cumulative - counts / 2
+    offset = cumulative[starts] - counts[starts]
+    totals = cumulative[ends - 1] - offset
+    targets = offset[:, None] + qs[None, :] * totals[:, None]
+
+    hi = np.searchsorted(midpoints, targets, side="left")
+    hi = np.clip(hi, starts[:, None], (ends - 1)[:, None])
+    lo = np.maximum(hi - 1, starts[:, None])
+    span = midpoints[hi] - midpoints[lo]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        fraction = np.where(span > 0, (targets - midpoints[lo]) / span, 0.0)
+    fraction = np.clip(fraction, 0.0, 1.0)
+    result[groups] = means[lo] + fraction * (means[hi] - means[lo])
+    return result
@@ -0,0 +1,258 @@
+import fnmatch
+import json
+import re
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Optional, List, Sequence, Union, Tuple
+
+import numpy as np
+import pandas as pd
+
+from lre_client.analytics.run_comparison import RunAnalytics
+from lre_client.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+# Comparison the metric value must satisfy for the rule to pass
+SLA_OPERATORS = ("<", "<=", ">", ">=", "==")
+REGEX_PREFIX = "re:"
+
+
+@dataclass
+class SLARule:
+    """
+    One SLA check: ``<metric> <op> <threshold>`` for every matching transaction.
+
+    ``transaction`` and ``script`` are glob patterns, or regular expressions
+    when prefixed with ``re:``; the default ``*`` matches everything.
+    """
+    name: str
+    metric: str
+    op: str
+    threshold: float
+    transaction: str = "*"
+    script: str = "*"
+
+    def __post_init__(self):
+        if self.op not in SLA_OPERATORS:
+            raise ValueError(f"SLA rule '{self.name}': unknown operator '{self.op}'")
+        self.threshold = float(self.threshold)
+
+
+def load_sla_rules(path: Union[str, Path]) -> List[SLARule]:
+    """
+    Load SLA rules from a JSON file (a list, or an object with a ``rules`` list) or a CSV file.
+
+    Columns/keys: name, metric, op, threshold, and optionally transaction and script.
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".csv":
+        records = pd.read_csv(path, dtype={"name": str, "transaction": str, "script": str}) \
+            .dropna(axis=1, how="all").to_dict("records")
+        records = [{k: v for k, v in r.items() if not (isinstance(v, float) and np.isnan(v))} for r in records]
+    else:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        records = data["rules"] if isinstance(data, dict) else data
+    rules = [SLARule(**record) for record in records]
+    log.info(f"Loaded {len(rules):,} SLA rules from {path}")
+    return rules
+
+
+_REGEX_SPECIAL = set(".^$*+?{}[]\\|()")
+
+
+def _compile_pattern(pattern: str) -> Tuple[Optional[re.Pattern], str]:
+    """
+    Regex for a glob/``re:`` pattern (None when it is a literal name) and the
+    literal prefix every match must start with.
+    """
+    if pattern.startswith(REGEX_PREFIX):
+        source = pattern[len(REGEX_PREFIX):]
+        if "|" in source:
+            return re.compile(source), ""
+        prefix = ""
+        for i, ch in enumerate(source):
+            if ch in _REGEX_SPECIAL:
+                # A quantifier applies to the character before it
+                if ch in "*?+{":
+                    prefix = prefix[:-1]
+                break
+            prefix += ch
+        return re.compile(source), prefix
+    cut = min((i for i in (pattern.find(ch) for ch in "*?[") if i >= 0), default=-1)
+    if cut < 0:
+        return None, pattern
+    return re.compile(fnmatch.translate(pattern)), pattern[:cut]
+
+
+def _match_patterns(patterns: Sequence[str], compiled: Sequence[Tuple[Optional[re.Pattern], str]],
+                    names: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Match every unique pattern once against ``names``.
+
+    Literal names are a dict lookup. Globs and regexes are matched against the
+    unique names only, and only against those sharing the pattern's literal
+    prefix, found by binary search in the sorted names.
+
+    :param compiled: _compile_pattern() of each pattern
+    :return: (flat matched row positions, offsets) where pattern i matched
+             positions[offsets[i]:offsets[i + 1]]
+    """
+    codes, uniques = pd.factorize(names, sort=True)
+    order = np.argsort(codes, kind="stable")
+    rows_by_name = np.split(order, np.cumsum(np.bincount(codes, minlength=len(uniques)))[:-1])
+    sorted_names = np.asarray(uniques, dtype=str)
+    unique_names = sorted_names.tolist()
+
+    matched: List[np.ndarray] = []
+    for pattern, (regex, prefix) in zip(patterns, compiled):
+        if pattern == "*":
+            matched.append(np.arange(len(names)))
+            continue
+        lo = int(np.searchsorted(sorted_names, prefix, side="left"))
+        if regex is None:
+            hit = [lo] if lo < len(unique_names) and unique_names[lo] == pattern else []
+        else:
+            hi = int(np.searchsorted(sorted_names, prefix + "\U0010ffff", side="left")) if prefix else len(unique_names)
+            fullmatch = regex.fullmatch
+            hit = [i for i in range(lo, hi) if fullmatch(unique_names[i])]
+        matched.append(np.sort(np.concatenate([rows_by_name[i] for i in hit])) if hit else np.empty(0, dtype=np.int64))
+
+    offsets = np.zeros(len(matched) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([m.size for m in matched])
+    flat = np.concatenate(matched) if matched else np.empty(0, dtype=np.int64)
+    return flat.astype(np.int64), offsets
+
+
+def _expand(offsets: np.ndarray, groups: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Flat positions of ``groups`` in a (flat, offsets) layout and the group owning each.
+
+    :return: (owner index into ``groups``, position into the flat array)
+    """
+    starts, lengths = offsets[groups], offsets[groups + 1] - offsets[groups]
+    owner = np.repeat(np.arange(groups.size), lengths)
+    within = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    return owner, starts[owner] + within
+
+
+class SLAEngine:
+    """
+    Evaluates many SLA rules against a LoadTestAnalyticsManager result in one pass.
+
+    Rules are compiled once into integer arrays (metric, operator, threshold,
+    pattern ids). At evaluation time each unique (script, transaction) pattern
+    pair is matched against the transactions once, the matches are expanded to
+    (rule, transaction) pairs with array arithmetic, and all values are compared
+    with their thresholds in a handful of vectorized operations.
+    """
+
+    def __init__(self, rules: Sequence[SLARule]):
+        self.rules = list(rules)
+        self._frame = pd.DataFrame([asdict(r) for r in self.rules],
+                                   columns=["name", "metric", "op", "threshold", "transaction", "script"])
+        self._op_codes = pd.Categorical(self._frame["op"], categories=SLA_OPERATORS).codes
+        self._thresholds = self._frame["threshold"].to_numpy(dtype=float)
+        self._metric_codes, self._metrics = pd.factorize(self._frame["metric"], sort=False)
+        self._txn_codes, self._txn_patterns = pd.factorize(self._frame["transaction"], sort=False)
+        self._script_codes, self._script_patterns = pd.factorize(self._frame["script"], sort=False)
+        # Compiled once here, which also fails fast on invalid regexes
+        self._txn_compiled = [_compile_pattern(p) for p in self._txn_patterns]
+        self._script_compiled = [_compile_pattern(p) for p in self._script_patterns]
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path]) -> "SLAEngine":
+        return cls(load_sla_rules(path))
+
+    def evaluate(self, analytics: Union[RunAnalytics, pd.DataFrame],
+                 duration_seconds: Optional[float] = None) -> pd.DataFrame:
+        """
+        Evaluate every rule against every transaction it matches.
+
+        :param analytics: RunAnalytics, or a LoadTestAnalyticsManager DataFrame
+        :param duration_seconds: Run duration, needed for tps rules on a plain DataFrame
+        :return: One row per (rule, matched transaction) with the value, threshold and
+                 status (pass/fail/no_data); rules matching nothing get one
+                 ``no_match`` row
+        """
+        if isinstance(analytics, pd.DataFrame):
+            analytics = RunAnalytics("run", analytics, duration_seconds)
+        frame = analytics.metrics_frame().reset_index()
+        if not len(self.rules):
+            return pd.DataFrame(columns=["rule", "Script_Name", "Transaction_Name", "metric",
+                                         "op", "threshold", "value", "status", "passed"])
+
+        unknown = [m for m in self._metrics if m not in frame.columns]
+        if unknown:
+            raise ValueError(f"SLA rules reference unknown metrics: {unknown}")
+        values = frame[list(self._metrics)].to_numpy(dtype=float).T  # (metric, transaction)
+
+        # Transactions matching each unique (script pattern, transaction pattern) pair
+        txn_flat, txn_offsets = _match_patterns(self._txn_patterns, self._txn_compiled,
+                                                 frame["Transaction_Name"])
+        script_flat, script_offsets = _match_patterns(self._script_patterns, self._script_compiled,
+                                                       frame["Script_Name"])
+        pair_codes, pairs = pd.factorize(pd.MultiIndex.from_arrays([self._script_codes, self._txn_codes]))
+        in_script = np.zeros(len(frame), dtype=bool)
+        combo: List[np.ndarray] = []
+        for script_code, txn_code in pairs:
+            txns = txn_flat[txn_offsets[txn_code]:txn_offsets[txn_code + 1]]
+            if self._script_patterns[script_code] != "*":
+                scripts = script_flat[script_offsets[script_code]:script_offsets[script_code + 1]]
+                in_script[scripts] = True
+                txns = txns[in_script[txns]]
+                in_script[scripts] = False
+            combo.append(txns)
+        combo_offsets = np.zeros(len(combo) + 1, dtype=np.int64)
+        combo_offsets[1:] = np.cumsum([c.size for c in combo])
+        combo_flat = np.concatenate(combo) if combo else np.empty(0, dtype=np.int64)
+
+        # Expand to (rule, transaction) pairs and compare all at once
+        rule_ids, positions = _expand(combo_offsets, pair_codes.astype(np.int64))
+        txn_ids = combo_flat[positions]
+        value = values[self._metric_codes[rule_ids], txn_ids]
+        threshold = self._thresholds[rule_ids]
+        op = self._op_codes[rule_ids]
+        passed = np.select(
+            [op == 0, op == 1, op == 2, op == 3, op == 4],
+            [value < threshold, value <= threshold, value > threshold, value >= threshold, value == threshold],
+            default=False,
+        )
+        status = np.where(np.isnan(value), "no_data", np.where(passed, "pass", "fail"))
+
+        result = pd.DataFrame({
+            "rule": self._frame["name"].to_numpy()[rule_ids],
+            "Script_Name": frame["Script_Name"].to_numpy()[txn_ids],
+            "Transaction_Name": frame["Transaction_Name"].to_numpy()[txn_ids],
+            "metric": self._frame["metric"].to_numpy()[rule_ids],
+            "op": self._frame["op"].to_numpy()[rule_ids],
+            "threshold": threshold,
+            "value": value,
+            "status": status,
+            "passed": status == "pass",
+        })
+
+        unmatched = np.setdiff1d(np.arange(len(self.rules)), rule_ids)
+        if unmatched.size:
+            rules = self._frame.iloc[unmatched]
+            result = pd.concat([result, pd.DataFrame({
+                "rule": rules["name"].to_numpy(),
+                "metric": rules["metric"].to_numpy(),
+                "op": rules["op"].to_numpy(),
+                "threshold": rules["threshold"].to_numpy(),
+                "status": "no_match",
+                "passed": False,
+            })], ignore_index=True)
+
+        failed = int((result["status"] == "fail").sum())
+        log.info(f"SLA: {len(self.rules):,} rules, {len(result):,} checks, {failed:,} failed")
+        return result
+
+    @staticmethod
+    def summary(result: pd.DataFrame) -> pd.DataFrame:
+        """Per-rule counts of passed, failed and no-data checks."""
+        counts = pd.crosstab(result["rule"], result["status"])
+        for status in ("pass", "fail", "no_data", "no_match"):
+            if status not in counts:
+                counts[status] = 0
+        return counts[["pass", "fail", "no_data", "no_match"]].reset_index()
@@ -0,0 +1,125 @@
+from contextlib import asynccontextmanager
+from typing import Optional
+from urllib.parse import urljoin
+
+import aiohttp
+from lre_client.config import get_settings
+from lre_client.http_layer.async_session_factory import AsyncHttpSessionFactory
+from lre_client.http_layer.async_request_executor import AsyncLRERequestExecutor
+from lre_client.api.auth import AsyncLREAuthenticator
+from lre_client.api.hosts_api import AsyncLREHostsAPI
+from lre_client.api.runs_api import AsyncLRERunsAPI
+from lre_client.api.results_api import AsyncLREResultsAPI
+from lre_client.api.exceptions import LREAuthenticationError, LREError
+from lre_client.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+
+class AsyncLREClient:
+    """
+    Asyncio client for all LRE APIs with automatic authentication.
+
+    All requests share one connection pool and a semaphore bounding in-flight
+    requests to ``settings.lre_max_concurrency``. Use as an async context manager:
+
+        async with AsyncLREClient() as lre:
+            statuses = await asyncio.gather(*(lre.runs.get_run_status(i) for i in run_ids))
+    """
+
+    def __init__(self, settings=None, max_concurrency: Optional[int] = None):
+        self.settings = settings or get_settings()
+        self.max_concurrency = max_concurrency or self.settings.lre_max_concurrency
+        log.debug("Initializing AsyncLREClient with settings: %s", self.settings)
+
+        # The session binds to the running loop, so it is created on entry
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.executor: Optional[AsyncLRERequestExecutor] = None
+        self.auth = AsyncLREAuthenticator(self)
+
+        # Initialize API modules
+        self.hosts = AsyncLREHostsAPI(self)
+        self.runs = AsyncLRERunsAPI(self)
+        self.results = AsyncLREResultsAPI(self)
+
+    def build_url(self, endpoint: str) -> str:
+        url = urljoin(self.settings.base_url + "/", endpoint.lstrip("/"))
+        return url
+
+    def _open(self) -> None:
+        if self.session is None:
+            self.session = AsyncHttpSessionFactory.create(self.settings, self.max_concurrency)
+            self.executor = AsyncLRERequestExecutor(self.session, self.settings, self.max_concurrency)
+
+    async def _ensure_authenticated(self):
+        """Authenticate automatically if not already authenticated."""
+        self._open()
+        if not self.auth.authenticated:
+            log.debug("Automatically logging in...")
+            try:
+                await self.auth.login_with_client_credentials()
+            except LREAuthenticationError as e:
+                log.error(f"Automatic login failed: {e}")
+                raise
+
+    async def request(self, method: str, endpoint: str, **kwargs) -> aiohttp.ClientResponse:
+        """Generic API request method with automatic authentication."""
+        await self._ensure_authenticated()
+        url = self.build_url(endpoint)
+        log.debug("Preparing %s request for endpoint: %s", method, endpoint)
+
+        try:
+            response = await self.executor.execute(method, url, **kwargs)
+            log.debug("Response received (HTTP %s)", response.status)
+            return response
+        except LREError as e:
+            log.error(f"Request to {url} failed: {e}")
+            raise
+
+    @asynccontextmanager
+    async def stream(self, method: str, endpoint: str, **kwargs):
+        """Streamed API request; yields the unread response."""
+        await self._ensure_authenticated()
+        url = self.build_url(endpoint)
+        log.debug("Preparing streamed %s request for endpoint: %s", method, endpoint)
+
+        async with self.executor.stream(method, url, **kwargs) as response:
+            yield response
+
+    # Convenience methods
+    async def get(self, endpoint, **kwargs):
+        return await self.request("GET", endpoint, **kwargs)
+
+    async def post(self, endpoint, **kwargs):
+        return await self.request("POST", endpoint, **kwargs)
+
+    async def put(self, endpoint, **kwargs):
+        return await self.request("PUT", endpoint, **kwargs)
+
+    async def delete(self, endpoint, **kwargs):
+        return await self.request("DELETE", endpoint, **kwargs)
+
+    async def close(self) -> None:
+        if self.session is not None:
+            log.debug("Closing HTTP session...")
+            await self.session.close()
+            self.session = None
+            self.executor = None
+
+    async def __aenter__(self):
+        """Context manager entry - authenticate immediately."""
+        log.debug("Entering AsyncLREClient context manager")
+        await self._ensure_authenticated()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Logout automatically on context exit."""
+        log.debug("Exiting AsyncLREClient context manager")
+        try:
+            if self.auth.authenticated:
+                log.debug("Automatically logging out...")
+                await self.auth.logout()
+        except Exception as e:
+            log.warning(f"Error during logout: {e}")
+        finally:
+            await self.close()
@@ -1,14 +1,43 @@
+import asyncio
+import threading
+
 from lre_client.utils.logger import get_logger
-from lre_client.api.exceptions import LREAuthenticationError
+from lre_client.api.exceptions import LREAuthenticationError, LREAPIError, LREError
 from lre_client.api.endpoints import AUTHENTICATION_POINT, WEB_LOGIN, LOGOUT
 
 log = get_logger(__name__)
 
+# Lower-cased fragments of error bodies LRE returns once the session cookie has expired
+SESSION_EXPIRED_MARKERS = (
+    "session expired",
+    "session has expired",
+    "session timed out",
+    "not authenticated",
+    "authentication required",
+)
+
+
+def is_session_expired(error: LREError) -> bool:
+    """
+    Return True if the error indicates the LRE session is no longer valid.
+
+    Only HTTP 401 and the session-expired error bodies count; a 403 is a
+    permission denial that a fresh login would not fix.
+    """
+    if not isinstance(error, (LREAuthenticationError, LREAPIError)):
+        return False
+    message = str(error).lower()
+    return "http 401" in message or any(m in message for m in SESSION_EXPIRED_MARKERS)
 
-class LREAuthenticator:
-    """Handles login/logout for LoadRunner Enterprise using client credentials and project context."""
 
+class LREAuthenticator:
+    """
+    Handles login/logout for LoadRunner Enterprise using client credentials and project context.
 
+    Safe to share across threads: all state changes happen under a re-entrant lock, and
+    ``generation`` is bumped after each completed login so concurrent callers can tell
+    whether an expired session has already been renewed.
+    """
 
     def __init__(self, api):
         self.api = api
@@ -17,31 +46,140 @@ class LREAuthenticator:
         self.session = api.session
         self.authenticated = False
         self.web_logged_in = False
+        self.generation = 0
+        self._lock = threading.RLock()
+
+    @property
+    def is_logged_in(self) -> bool:
+        """True once both client authentication and project login have completed."""
+        return self.authenticated and self.web_logged_in
 
     def login_with_client_credentials(self) -> None:
         """Authenticate with LRE using client credentials and log into the project."""
-        if self.authenticated:
-            log.debug("Already authenticated; skipping authentication.")
-            return
+        with self._lock:
+            if self.authenticated:
+                log.debug("Already authenticated; skipping authentication.")
+                return
 
-        log.debug("Logging into LRE using client credentials...")
-        url = self.api.build_url(AUTHENTICATION_POINT)
+            log.debug("Logging into LRE using client credentials...")
+            url = self.api.build_url(AUTHENTICATION_POINT)
 
-        payload = {
-            "ClientIdKey": self.settings.lre_client_id,
-            "ClientSecretKey": self.settings.lre_client_secret,
-        }
+            payload = {
+                "ClientIdKey": self.settings.lre_client_id,
+                "ClientSecretKey": self.settings.lre_client_secret,
+            }
 
-        try:
-            self.executor.execute("POST", url, json=payload)
-            self.authenticated = True
-            log.debug("LRE authentication succeeded.")
-            self.login_to_project()
-        except Exception as e:
-            log.error(f"LRE authentication failed: {e}")
-            raise LREAuthenticationError(f"Authentication failed: {e}")
+            try:
+                self.executor.execute("POST", url, json=payload)
+                self.authenticated = True
+                log.debug("LRE authentication succeeded.")
+                self.login_to_project()
+                self.generation += 1
+            except Exception as e:
+                self.authenticated = False
+                log.error(f"LRE authentication failed: {e}")
+                raise LREAuthenticationError(f"Authentication failed: {e}")
 
     def login_to_project(self) -> None:
+        """Login to specific domain/project after authenticating."""
+        with self._lock:
+            if not self.authenticated:
+                raise LREAuthenticationError("Cannot log in to project before authenticating.")
+            if self.web_logged_in:
+                log.debug("Already logged into project; skipping.")
+                return
+
+            url = self.api.build_url(WEB_LOGIN)
+            params = {
+                "domain": self.settings.lre_domain,
+                "project": self.settings.lre_project,
+            }
+
+            log.debug(f"Logging into project (domain={params['domain']}, project={params['project']})")
+            try:
+                self.executor.execute("GET", url, params=params)
+                self.web_logged_in = True
+                log.debug("Successfully logged into LRE project.")
+            except Exception as e:
+                log.error(f"Failed to log into project: {e}")
+                raise LREAuthenticationError(f"Project login failed: {e}")
+
+    def reauthenticate(self, stale_generation: int) -> None:
+        """
+        Replace an expired session, at most once per expiry.
+
+        ``stale_generation`` is the ``generation`` the caller observed before its request
+        failed. If another thread has completed a login since then, this returns without
+        logging in again; otherwise the cookies are dropped and a fresh login is made
+        while other callers block on the lock.
+        """
+        with self._lock:
+            if self.generation != stale_generation and self.is_logged_in:
+                log.debug("Session already renewed by another thread; skipping re-authentication.")
+                return
+
+            log.info("LRE session expired; re-authenticating...")
+            self.session.cookies.clear()
+            self.authenticated = False
+            self.web_logged_in = False
+            self.login_with_client_credentials()
+
+    def logout(self) -> None:
+        """Logout from LRE and clear session cookies."""
+        with self._lock:
+            if not self.authenticated:
+                log.debug("Logout skipped: not authenticated.")
+                return
+
+            log.debug("Logging out from LRE...")
+            url = self.api.build_url(LOGOUT)
+            try:
+                self.executor.execute("GET", url)
+                log.debug("Successfully logged out from LRE.")
+            except Exception as e:
+                log.warning(f"Logout encountered an issue: {e}")
+            finally:
+                self.session.cookies.clear()
+                self.authenticated = False
+                self.web_logged_in = False
+
+
+class AsyncLREAuthenticator:
+    """Asyncio counterpart of LREAuthenticator sharing the same login/logout flow."""
+
+    def __init__(self, api):
+        self.api = api
+        self.settings = api.settings
+        self.authenticated = False
+        self.web_logged_in = False
+        self._lock = asyncio.Lock()
+
+    async def login_with_client_credentials(self) -> None:
+        """Authenticate with LRE using client credentials and log into the project."""
+        # Concurrent first requests must not trigger parallel logins
+        async with self._lock:
+            if self.authenticated:
+                log.debug("Already authenticated; skipping authentication.")
+                return
+
+            log.debug("Logging into LRE using client credentials...")
+            url = self.api.build_url(AUTHENTICATION_POINT)
+
+            payload = {
+                "ClientIdKey": self.settings.lre_client_id,
+                "ClientSecretKey": self.settings.lre_client_secret,
+            }
+
+            try:
+                await self.api.executor.execute("POST", url, json=payload)
+                self.authenticated = True
+                log.debug("LRE authentication succeeded.")
+                await self.login_to_project()
+            except Exception as e:
+                log.error(f"LRE authentication failed: {e}")
+                raise LREAuthenticationError(f"Authentication failed: {e}")
+
+    async def login_to_project(self) -> None:
         """Login to specific domain/project after authenticating."""
         if not self.authenticated:
             raise LREAuthenticationError("Cannot log in to project before authenticating.")
@@ -57,14 +195,14 @@ class LREAuthenticator:
 
         log.debug(f"Logging into project (domain={params['domain']}, project={params['project']})")
         try:
-            self.executor.execute("GET", url, params=params)
+            await self.api.executor.execute("GET", url, params=params)
             self.web_logged_in = True
             log.debug("Successfully logged into LRE project.")
         except Exception as e:
             log.error(f"Failed to log into project: {e}")
             raise LREAuthenticationError(f"Project login failed: {e}")
 
-    def logout(self) -> None:
+    async def logout(self) -> None:
         """Logout from LRE and clear session cookies."""
         if not self.authenticated:
             log.debug("Logout skipped: not authenticated.")
@@ -73,11 +211,11 @@ class LREAuthenticator:
         log.debug("Logging out from LRE...")
         url = self.api.build_url(LOGOUT)
         try:
-            self.executor.execute("GET", url)
+            await self.api.executor.execute("GET", url)
             log.debug("Successfully logged out from LRE.")
         except Exception as e:
             log.warning(f"Logout encountered an issue: {e}")
         finally:
-            self.session.cookies.clear()
+            self.api.session.cookie_jar.clear()
             self.authenticated = False
             self.web_logged_in = False
@@ -13,7 +13,7 @@ class LREBaseAPI:
 
     def __init__(self, settings=None):
         self.settings = settings or get_settings()
-        log.debug(f"Initializing LREBaseAPI with settings: {self.settings}")
+        log.debug("Initializing LREBaseAPI with settings: %s", self.settings)
 
         self.session = HttpSessionFactory.create(self.settings)
         self.executor = LRERequestExecutor(self.session, self.settings)
@@ -26,11 +26,11 @@ class LREBaseAPI:
     def request(self, method: str, endpoint: str, **kwargs):
         """Generic API request method - authentication is handled at context level."""
         url = self.build_url(endpoint)
-        log.debug(f"Preparing {method} request for endpoint: {endpoint}")
+        log.debug("Preparing %s request for endpoint: %s", method, endpoint)
 
         try:
             response = self.executor.execute(method, url, **kwargs)
-            log.debug(f"Response received (HTTP {response.status_code})")
+            log.debug("Response received (HTTP %s)", response.status_code)
             return response
         except Exception as e:
             log.error(f"Request to {url} failed: {e}")
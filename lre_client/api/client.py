@@ -2,7 +2,8 @@ from lre_client.api.base_api import LREBaseAPI
 from lre_client.api.hosts_api import LREHostsAPI
 from lre_client.api.runs_api import LRERunsAPI
 from lre_client.utils.logger import get_logger
-from lre_client.api.exceptions import LREAuthenticationError
+from lre_client.api.exceptions import LREAuthenticationError, LREError
+from lre_client.api.auth import is_session_expired
 from lre_client.api.results_api import LREResultsAPI
 
 log = get_logger(__name__)
@@ -19,7 +20,7 @@ class LREClient(LREBaseAPI):
 
     def _ensure_authenticated(self):
         """Authenticate automatically if not already authenticated."""
-        if not self.auth.authenticated:
+        if not self.auth.is_logged_in:
             log.debug("Automatically logging in...")
             try:
                 self.auth.login_with_client_credentials()
@@ -28,8 +29,23 @@ class LREClient(LREBaseAPI):
                 raise
 
     def request(self, method: str, endpoint: str, **kwargs):
-        """Override base request to ensure authentication automatically."""
+        """
+        Override base request to ensure authentication automatically.
+
+        If the session has expired (HTTP 401 or a session-expired error body), the
+        client re-authenticates once - shared by all threads that hit the same expiry -
+        and replays the request a single time.
+        """
         self._ensure_authenticated()
+        generation = self.auth.generation
+        try:
+            return super().request(method, endpoint, **kwargs)
+        except LREError as e:
+            if not is_session_expired(e):
+                raise
+            log.warning(f"Session expired during {method} {endpoint}; re-authenticating and retrying")
+
+        self.auth.reauthenticate(generation)
         return super().request(method, endpoint, **kwargs)
 
     def __enter__(self):
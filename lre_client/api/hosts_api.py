@@ -1,16 +1,22 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Iterable, List, Optional, Union
+
 from lre_client.api.base_api import LREBaseAPI
 from lre_client.api.exceptions import LREAPIError
+from lre_client.models.bulk import BulkItemResult, summarize_bulk
 from lre_client.utils.logger import get_logger
 from lre_client.api.endpoints import HOSTS_BASE
-log = get_logger(__name__)
 
+if TYPE_CHECKING:
+    from lre_client.api.async_client import AsyncLREClient
 
-class LREHostsAPI:
-    """Provides access to the LRE Hosts Management API."""
+log = get_logger(__name__)
 
 
+class _HostsAPIBase:
+    """Endpoint paths shared by LREHostsAPI and AsyncLREHostsAPI."""
 
-    def __init__(self, base_api: LREBaseAPI):
+    def __init__(self, base_api: Union[LREBaseAPI, "AsyncLREClient"]):
         self.api = base_api
         self.settings = base_api.settings
 
@@ -21,6 +27,10 @@ class LREHostsAPI:
             project=self.settings.lre_project,
         ) + suffix
 
+
+class LREHostsAPI(_HostsAPIBase):
+    """Provides access to the LRE Hosts Management API."""
+
     def list_hosts(self):
         """Get a list of all hosts."""
         endpoint = self._path()
@@ -55,3 +65,97 @@ class LREHostsAPI:
         log.debug(f"Deleting host: {host_id}")
         response = self.api.delete(endpoint)
         return response.status_code == 200
+
+    # -------------------- BULK OPERATIONS --------------------
+
+    def _run_bulk(self, operation: str, fn: Callable[[Any], Any], items: List[Any],
+                  keys: List[Any], max_workers: Optional[int]) -> List[BulkItemResult]:
+        """
+        Run ``fn`` over items on a bounded thread pool sharing the client's session.
+
+        Failures are captured per item rather than aborting the batch; results keep input order.
+        Requests still pass through the executor's shared rate limiter.
+        """
+        max_workers = max_workers or self.settings.lre_max_concurrency
+
+        def call(index: int) -> BulkItemResult:
+            try:
+                return BulkItemResult(key=keys[index], result=fn(items[index]))
+            except Exception as e:
+                log.warning(f"{operation} failed for {keys[index]}: {e}")
+                return BulkItemResult(key=keys[index], error=e)
+
+        log.info(f"{operation}: {len(items)} hosts with up to {max_workers} workers")
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="lre-hosts") as pool:
+            results = list(pool.map(call, range(len(items))))
+
+        summary = summarize_bulk(results)
+        log.info(f"{operation}: {summary['succeeded']} succeeded, {summary['failed']} failed")
+        return results
+
+    def add_hosts(self, hosts: Iterable[Union[str, dict]],
+                  max_workers: Optional[int] = None) -> List[BulkItemResult]:
+        """
+        Add many hosts concurrently.
+
+        :param hosts: Host names, or dicts with "name" and optional "description"
+        :param max_workers: Concurrent requests (default settings.lre_max_concurrency)
+        :return: One BulkItemResult per host, keyed by host name
+        """
+        specs = [h if isinstance(h, dict) else {"name": h} for h in hosts]
+        return self._run_bulk(
+            "add_hosts",
+            lambda spec: self.add_host(spec["name"], spec.get("description", "")),
+            specs,
+            [spec["name"] for spec in specs],
+            max_workers,
+        )
+
+    def get_hosts(self, host_ids: Iterable[int], max_workers: Optional[int] = None) -> List[BulkItemResult]:
+        """Fetch details for many hosts concurrently; results are keyed by host ID."""
+        ids = list(host_ids)
+        return self._run_bulk("get_hosts", self.get_host, ids, ids, max_workers)
+
+    def delete_hosts(self, host_ids: Iterable[int], max_workers: Optional[int] = None) -> List[BulkItemResult]:
+        """Delete many hosts concurrently; each result is True if the host was deleted."""
+        ids = list(host_ids)
+        return self._run_bulk("delete_hosts", self.delete_host, ids, ids, max_workers)
+
+
+class AsyncLREHostsAPI(_HostsAPIBase):
+    """Asyncio counterpart of LREHostsAPI."""
+
+    async def list_hosts(self):
+        """Get a list of all hosts."""
+        endpoint = self._path()
+        log.debug(f"Fetching host list: {endpoint}")
+        response = await self.api.get(endpoint)
+        return await response.json()
+
+    async def get_host(self, host_id: int):
+        """Get host details by ID."""
+        endpoint = self._path(f"/{host_id}")
+        log.debug(f"Fetching host details for host_id={host_id}")
+        response = await self.api.get(endpoint)
+        return await response.json()
+
+    async def add_host(self, name: str, description: str = ""):
+        """Add a new host to LRE."""
+        endpoint = self._path()
+        payload = {
+            "name": name,
+            "description": description,
+        }
+
+        log.debug(f"Adding new host: {payload}")
+        response = await self.api.post(endpoint, json=payload)
+        if response.status not in (200, 201):
+            raise LREAPIError(f"Failed to add host: {await response.text()}")
+        return await response.json()
+
+    async def delete_host(self, host_id: int):
+        """Delete a host by ID."""
+        endpoint = self._path(f"/{host_id}")
+        log.debug(f"Deleting host: {host_id}")
+        response = await self.api.delete(endpoint)
+        return response.status == 200
@@ -1,6 +1,7 @@
+import asyncio
 import zipfile
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING, Union
 
 from lre_client.api.base_api import LREBaseAPI
 from lre_client.api.endpoints import RUN_RESULTS_LIST, RESULT_DATA_DOWNLOAD
@@ -8,6 +9,9 @@ from lre_client.api.exceptions import LREAPIError
 from lre_client.models.results import RunResultsCollection
 from lre_client.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from lre_client.api.async_client import AsyncLREClient
+
 log = get_logger(__name__)
 
 
@@ -34,10 +38,20 @@ def extract_result_data(zip_path: Path, extract_dir: Optional[Path] = None) -> P
         raise LREAPIError(f"Failed to extract zip file: {str(e)}")
 
 
-class LREResultsAPI:
-    """Access LRE Results API with typed models."""
+def find_analysis_db(extract_dir: Path) -> Path:
+    """Locate the SQLite analysis database inside an extracted analyzed result."""
+    candidates = sorted(Path(extract_dir).rglob("*.db"), key=lambda p: p.stat().st_size, reverse=True)
+    if not candidates:
+        raise LREAPIError(f"No analysis database (*.db) found in {extract_dir}")
+    if len(candidates) > 1:
+        log.debug(f"Found {len(candidates)} databases in {extract_dir}; using largest {candidates[0]}")
+    return candidates[0]
+
+
+class _ResultsAPIBase:
+    """URL building and argument defaults shared by LREResultsAPI and AsyncLREResultsAPI."""
 
-    def __init__(self, base_api: LREBaseAPI):
+    def __init__(self, base_api: Union[LREBaseAPI, "AsyncLREClient"]):
         self.api = base_api
         self.settings = base_api.settings
 
@@ -56,12 +70,29 @@ class LREResultsAPI:
             result_id=result_id
         )
 
-    def get_run_results(self, run_id: Optional[int] = None) -> RunResultsCollection:
+    def _resolve_run_id(self, run_id: Optional[int]) -> int:
         if run_id is None:
             run_id = getattr(self.settings, "lre_run_id", None)
             if not run_id:
                 raise ValueError("Run ID not provided and not found in settings.")
+        return run_id
 
+    @staticmethod
+    def _result_output_path(run_id: int, output_path: Optional[Path]) -> Path:
+        if output_path is None:
+            output_dir = Path.cwd() / "lre_results"
+            output_dir.mkdir(exist_ok=True)
+            return output_dir / f"Results_{run_id}.zip"
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        return output_path
+
+
+class LREResultsAPI(_ResultsAPIBase):
+    """Access LRE Results API with typed models."""
+
+    def get_run_results(self, run_id: Optional[int] = None) -> RunResultsCollection:
+        run_id = self._resolve_run_id(run_id)
         url = self._build_results_list_url(run_id)
         log.info(f"Fetching results for run {run_id}")
         response = self.api.get(url)
@@ -75,20 +106,10 @@ class LREResultsAPI:
 
     def download_result_data(self, result_id: int, run_id: Optional[int] = None,
                              output_path: Optional[Path] = None) -> Path:
-        if run_id is None:
-            run_id = getattr(self.settings, "lre_run_id", None)
-            if not run_id:
-                raise ValueError("Run ID not provided and not found in settings.")
-
+        run_id = self._resolve_run_id(run_id)
         url = self._build_result_download_url(run_id, result_id)
 
-        if output_path is None:
-            output_dir = Path.cwd() / "lre_results"
-            output_dir.mkdir(exist_ok=True)
-            output_path = output_dir / f"Results_{run_id}.zip"
-        else:
-            output_path = Path(output_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path = self._result_output_path(run_id, output_path)
 
         log.info(f"Downloading result data for result {result_id} to {output_path}")
 
@@ -125,3 +146,64 @@ class LREResultsAPI:
             return extract_result_data(zip_path)
 
         return zip_path
+
+
+class AsyncLREResultsAPI(_ResultsAPIBase):
+    """Asyncio counterpart of LREResultsAPI."""
+
+    async def get_run_results(self, run_id: Optional[int] = None) -> RunResultsCollection:
+        run_id = self._resolve_run_id(run_id)
+        url = self._build_results_list_url(run_id)
+        log.info(f"Fetching results for run {run_id}")
+        response = await self.api.get(url)
+        if response.status != 200:
+            raise LREAPIError(f"Failed to fetch run results: {await response.text()}")
+
+        data = await response.json()
+        collection = RunResultsCollection.from_api_response(run_id, data)
+        log.debug(f"Found {len(collection.results)} results for run {run_id}")
+        return collection
+
+    async def download_result_data(self, result_id: int, run_id: Optional[int] = None,
+                                   output_path: Optional[Path] = None) -> Path:
+        run_id = self._resolve_run_id(run_id)
+        url = self._build_result_download_url(run_id, result_id)
+
+        output_path = self._result_output_path(run_id, output_path)
+
+        log.info(f"Downloading result data for result {result_id} to {output_path}")
+
+        try:
+            async with self.api.stream("GET", url) as response:
+                if response.status != 200:
+                    raise LREAPIError(f"Failed to download result data: {await response.text()}")
+
+                with open(output_path, 'wb') as f:
+                    async for chunk in response.content.iter_chunked(8192):
+                        f.write(chunk)
+
+            if output_path.exists() and output_path.stat().st_size > 0:
+                log.info(f"Successfully downloaded result data to {output_path} ({output_path.stat().st_size} bytes)")
+                return output_path
+            else:
+                raise LREAPIError("Downloaded file is empty or doesn't exist")
+        except Exception as e:
+            if output_path.exists():
+                output_path.unlink()
+            raise LREAPIError(f"Failed to download result data: {str(e)}")
+
+    async def download_analyzed_result(self, run_id: Optional[int] = None,
+                                       output_path: Optional[Path] = None,
+                                       extract: bool = False) -> Path:
+        collection = await self.get_run_results(run_id)
+        result = collection.latest_analyzed
+        if not result:
+            raise LREAPIError(f"No analyzed result found for run {run_id or self.settings.lre_run_id}")
+
+        zip_path = await self.download_result_data(result.id, run_id, output_path)
+
+        if extract:
+            # Extraction is CPU/disk bound; keep it off the event loop
+            return await asyncio.to_thread(extract_result_data, zip_path)
+
+        return zip_path
@@ -0,0 +1,230 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from lre_client.api.exceptions import LREError
+from lre_client.api.results_api import extract_result_data, find_analysis_db
+from lre_client.models.results import RunResultsCollection
+from lre_client.models.runs import FINAL_RUN_STATES, FINISHED_STATE, FINISHING_RUN_STATES
+from lre_client.utils.common_utils import safe_parse_time
+from lre_client.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+RunCallback = Callable[[dict, RunResultsCollection], Any]
+
+
+def download_and_analyze(client, run: dict, collection: RunResultsCollection, trend_store=None):
+    """
+    Default RunWatcher action: download and extract the analyzed result, run
+    analytics and append the run to the trend history.
+
+    :param trend_store: TrendStore to append to; defaults to one built from client.settings
+    :return: Analytics frame of the run
+    """
+    from lre_client.data.trend_store import TrendStore
+    from lre_client.pipeline.batch_extractor import analyze_run, analyze_run_args, record_analyzed_run
+
+    run_id = collection.run_id
+    zip_path = client.results.download_result_data(collection.latest_analyzed.id, run_id)
+    extract_dir = extract_result_data(zip_path)
+    parts = analyze_run(*analyze_run_args(find_analysis_db(extract_dir), client.settings))
+    record_analyzed_run(run_id, run, parts, trend_store=trend_store or TrendStore(settings=client.settings))
+    return parts["analytics"]
+
+
+@dataclass
+class _WatchedRun:
+    run_id: int
+    expected_end: Optional[datetime]
+    interval: float
+    next_poll: float = 0.0
+    state: str = ""
+
+
+class RunWatcher:
+    """
+    Watches many LRE runs and fires a callback once each has an analyzed result.
+
+    Every poll fetches the state of all due runs with one bulk runs request.
+    Each run keeps its own poll interval: the minimum while it is in a
+    post-test state or close to its expected end, doubling up to the maximum
+    otherwise. A Finished run is handed to ``on_ready`` as soon as
+    ``get_run_results`` lists an analyzed result for it; callbacks run on a
+    small thread pool so a slow download/analysis does not hold up polling.
+    """
+
+    def __init__(
+            self,
+            client,
+            on_ready: Optional[RunCallback] = None,
+            min_interval: float = 5.0,
+            max_interval: float = 300.0,
+            end_window: timedelta = timedelta(minutes=2),
+            max_workers: int = 2,
+    ):
+        """
+        :param client: Authenticated LREClient
+        :param on_ready: Called with (run, results) when a run is analyzed; defaults to
+                         download_and_analyze() with a TrendStore shared by all runs
+        :param min_interval: Shortest poll interval (sec), used near the end of a run
+        :param max_interval: Longest poll interval (sec) reached by backoff
+        :param end_window: How long before the expected end to switch to min_interval
+        :param max_workers: on_ready callbacks run concurrently
+        """
+        self.client = client
+        if on_ready is None:
+            from lre_client.data.trend_store import TrendStore
+
+            # One store for all callbacks: TrendStore serializes writes per instance
+            trend_store = TrendStore(settings=client.settings)
+            on_ready = lambda run, results: download_and_analyze(client, run, results, trend_store)
+        self.on_ready = on_ready
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.end_window = end_window
+        self.max_workers = max_workers
+        self._stop = threading.Event()
+
+    def stop(self) -> None:
+        """Ask a running watch() to return after the current poll."""
+        self._stop.set()
+
+    def _near_end(self, watched: _WatchedRun) -> bool:
+        if watched.state in FINISHING_RUN_STATES or watched.state == FINISHED_STATE:
+            return True
+        return watched.expected_end is not None and datetime.now() >= watched.expected_end - self.end_window
+
+    def _schedule(self, watched: _WatchedRun, now: float) -> None:
+        if self._near_end(watched):
+            watched.interval = self.min_interval
+        else:
+            watched.interval = min(self.max_interval, watched.interval * 2)
+        watched.next_poll = now + watched.interval
+
+    def _retry_later(self, watched: _WatchedRun, now: float) -> None:
+        """Back off after a failed poll, even for runs near their end."""
+        watched.interval = min(self.max_interval, max(self.min_interval, watched.interval * 2))
+        watched.next_poll = now + watched.interval
+
+    @staticmethod
+    def _expected_end(run: dict, duration: Optional[timedelta]) -> Optional[datetime]:
+        start = safe_parse_time(run.get("Start") or "")
+        return start + duration if start and duration else None
+
+    def watch(
+            self,
+            run_ids: Iterable[int],
+            expected_durations: Optional[Dict[int, timedelta]] = None,
+            timeout: Optional[float] = None,
+    ) -> Dict[int, Any]:
+        """
+        Block until every run is analyzed, has failed, or the timeout expires.
+
+        Callbacks already started are waited for (until the timeout); a callback
+        still running at the timeout is left to finish in the background and has no outcome.
+
+        :param run_ids: Runs to watch
+        :param expected_durations: Planned test duration per run ID, used to poll faster near the end
+        :param timeout: Give up after this many seconds
+        :return: on_ready return value per run ID (the exception, if the callback raised)
+        """
+        expected_durations = expected_durations or {}
+        pending = {
+            int(run_id): _WatchedRun(int(run_id), None, self.min_interval / 2)
+            for run_id in run_ids
+        }
+        callbacks: Dict[int, Future] = {}
+        deadline = time.monotonic() + timeout if timeout else None
+        self._stop.clear()
+
+        log.info(f"Watching {len(pending)} runs")
+        pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="lre-watch")
+        try:
+            self._poll(pending, callbacks, expected_durations, deadline, pool)
+            remaining = max(0.0, deadline - time.monotonic()) if deadline else None
+            _, not_done = wait(callbacks.values(), timeout=remaining)
+            if not_done:
+                log.warning(f"{len(not_done)} run actions still running at the watch timeout")
+        finally:
+            pool.shutdown(wait=False)
+
+        outcomes: Dict[int, Any] = {}
+        for run_id, future in callbacks.items():
+            if future.done():
+                outcomes[run_id] = future.exception() or future.result()
+        return outcomes
+
+    def _poll(self, pending: Dict[int, _WatchedRun], callbacks: Dict[int, Future],
+              expected_durations: Dict[int, timedelta], deadline: Optional[float],
+              pool: ThreadPoolExecutor) -> None:
+        """Poll due runs until none are pending, stop() is called or the deadline passes."""
+        while pending and not self._stop.is_set():
+            now = time.monotonic()
+            if deadline and now >= deadline:
+                log.warning(f"Run watch timed out with {len(pending)} runs pending: {sorted(pending)}")
+                break
+
+            due = [w for w in pending.values() if w.next_poll <= now]
+            if not due:
+                wake = min(w.next_poll for w in pending.values())
+                if deadline:
+                    wake = min(wake, deadline)
+                self._stop.wait(max(0.0, wake - now))
+                continue
+
+            try:
+                runs = self.client.runs.get_runs_status([w.run_id for w in due])
+            except LREError as e:
+                log.warning(f"Polling {len(due)} runs failed: {e}; retrying")
+                now = time.monotonic()
+                for watched in due:
+                    self._retry_later(watched, now)
+                continue
+            now = time.monotonic()
+
+            for watched in due:
+                run = runs.get(watched.run_id)
+                if run is None:
+                    log.warning(f"Run {watched.run_id} not found; still watching")
+                    self._schedule(watched, now)
+                    continue
+
+                if watched.state != run.get("State"):
+                    log.debug(f"Run {watched.run_id}: {watched.state or '-'} -> {run.get('State')}")
+                watched.state = run.get("State") or ""
+                if watched.expected_end is None:
+                    watched.expected_end = self._expected_end(run, expected_durations.get(watched.run_id))
+
+                if watched.state == FINISHED_STATE:
+                    try:
+                        collection = self.client.results.get_run_results(watched.run_id)
+                    except LREError as e:
+                        log.warning(f"Fetching results of run {watched.run_id} failed: {e}; retrying")
+                        self._retry_later(watched, now)
+                        continue
+                    if collection.latest_analyzed:
+                        del pending[watched.run_id]
+                        callbacks[watched.run_id] = self._fire(pool, run, collection)
+                        continue
+                    log.debug(f"Run {watched.run_id} finished; analyzed result not available yet")
+                elif watched.state in FINAL_RUN_STATES:
+                    log.warning(f"Run {watched.run_id} ended in state '{watched.state}'; not processing")
+                    del pending[watched.run_id]
+                    continue
+
+                self._schedule(watched, now)
+
+    def _fire(self, pool: ThreadPoolExecutor, run: dict, collection: RunResultsCollection) -> Future:
+        log.info(f"Run {collection.run_id} analyzed; triggering action")
+        future = pool.submit(self.on_ready, run, collection)
+        future.add_done_callback(lambda f: self._log_failure(collection.run_id, f))
+        return future
+
+    @staticmethod
+    def _log_failure(run_id: int, future: Future) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            log.error(f"Action for run {run_id} failed: {future.exception()}")
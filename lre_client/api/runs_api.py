@@ -1,21 +1,60 @@
-from typing import Optional
+from typing import Optional, TYPE_CHECKING, Dict, Iterable, Iterator, List, Union
 
 from lre_client.api.base_api import LREBaseAPI
 from lre_client.api.endpoints import RUN_STATUS
 from lre_client.api.exceptions import LREAPIError
+from lre_client.utils.common_utils import chunk_list
 from lre_client.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from lre_client.api.async_client import AsyncLREClient
+
 log = get_logger(__name__)
 
 
-class LRERunsAPI:
+class _RunsAPIBase:
+    """Query payloads and argument defaults shared by LRERunsAPI and AsyncLRERunsAPI."""
+
+    def __init__(self, base_api: Union[LREBaseAPI, "AsyncLREClient"]):
+        self.api = base_api
+        self.settings = base_api.settings  # settings contains username, password, run_id, etc.
+
+    @staticmethod
+    def _runs_query(filters: List[dict], sorting: Optional[List[dict]] = None,
+                    page_index: int = -1, page_size: int = 0) -> dict:
+        """Runs query payload; PageIndex -1 with PageSize 0 returns every match."""
+        return {
+            "Filters": filters,
+            "Sorting": sorting or [],
+            "PageIndex": page_index,
+            "PageSize": page_size
+        }
+
+    def _resolve_run_id(self, run_id: Optional[int]) -> int:
+        # Use run_id from settings if not explicitly provided
+        if run_id is None:
+            run_id = getattr(self.settings, "lre_run_id", None)
+            if run_id is None:
+                raise ValueError("Run ID not provided and not found in settings.")
+        return run_id
+
+
+class LRERunsAPI(_RunsAPIBase):
     """Provides access to the LRE Runs API."""
 
     BASE_PATH = "loadTest/rest-pcweb/Runs"
+    STATUS_BATCH_SIZE = 100
+    DEFAULT_PAGE_SIZE = 200
 
-    def __init__(self, base_api: LREBaseAPI):
-        self.api = base_api
-        self.settings = base_api.settings  # settings contains username, password, run_id, etc.
+    def _query_runs(self, filters: List[dict], sorting: Optional[List[dict]] = None,
+                    page_index: int = -1, page_size: int = 0) -> List[dict]:
+        """POST a runs query; PageIndex -1 with PageSize 0 returns every match."""
+        payload = self._runs_query(filters, sorting, page_index, page_size)
+        response = self.api.post(RUN_STATUS, json=payload)
+        if response.status_code != 200:
+            raise LREAPIError(f"Failed to fetch runs: {response.text}")
+
+        return response.json() or []
 
     def get_run_status(self, run_id: Optional[int] = None) -> Optional[dict]:
         """
@@ -24,26 +63,85 @@ class LRERunsAPI:
         :param run_id: Optional run ID to filter
         :return: First run dict from the API response, or None if not found
         """
-        # Use run_id from settings if not explicitly provided
-        if run_id is None:
-            run_id = getattr(self.settings, "lre_run_id", None)
-            if run_id is None:
-                raise ValueError("Run ID not provided and not found in settings.")
+        run_id = self._resolve_run_id(run_id)
+        log.info(f"Fetching run status for id {run_id}")
 
-        payload = {
-            "Filters": [{"Field": "Id", "Type": "EqualTo", "Values": [run_id]}],
-            "Sorting": [],
-            "PageIndex": -1,
-            "PageSize": 0
-        }
+        data = self._query_runs([{"Field": "Id", "Type": "EqualTo", "Values": [run_id]}])
+        if not data:
+            log.warning(f"No runs found for run_id={run_id}")
+            return None
+
+        return data[0]
+
+    def get_runs_status(self, run_ids: Iterable[int], batch_size: Optional[int] = None) -> Dict[int, dict]:
+        """
+        Get many runs with one filtered request per batch of IDs.
+
+        :param run_ids: Run IDs to fetch
+        :param batch_size: IDs per request (default STATUS_BATCH_SIZE)
+        :return: Run dicts keyed by run ID; IDs unknown to the server are omitted
+        """
+        ids = list(dict.fromkeys(int(run_id) for run_id in run_ids))
+        batch_size = batch_size or self.STATUS_BATCH_SIZE
+        runs: Dict[int, dict] = {}
+
+        log.info(f"Fetching run status for {len(ids)} runs in batches of {batch_size}")
+
+        for batch in chunk_list(ids, batch_size):
+            filters = [{"Field": "Id", "Type": "EqualTo", "Values": batch}]
+            for run in self._query_runs(filters):
+                runs[int(run["Id"])] = run
+
+        missing = len(ids) - len(runs)
+        if missing:
+            log.warning(f"No runs found for {missing} of {len(ids)} requested run IDs")
+
+        return runs
+
+    def iter_runs(self, filters: Optional[List[dict]] = None, page_size: Optional[int] = None,
+                  sorting: Optional[List[dict]] = None) -> Iterator[dict]:
+        """
+        Lazily iterate over runs matching the filters, one page per request.
+
+        :param filters: LRE run filters, e.g. [{"Field": "TestId", "Type": "EqualTo", "Values": [5]}]
+        :param page_size: Runs per page (default DEFAULT_PAGE_SIZE)
+        :param sorting: LRE sorting clauses; defaults to ascending run ID so pages are stable
+        :return: Iterator of run dicts, yielded as each page arrives
+        """
+        page_size = page_size or self.DEFAULT_PAGE_SIZE
+        sorting = sorting or [{"Field": "Id", "Direction": "Ascending"}]
+        page_index = 0
+
+        while True:
+            log.debug("Fetching runs page %s (size %s)", page_index, page_size)
+            page = self._query_runs(filters or [], sorting, page_index, page_size)
+            yield from page
+
+            if len(page) < page_size:
+                return
+            page_index += 1
+
+
+class AsyncLRERunsAPI(_RunsAPIBase):
+    """Asyncio counterpart of LRERunsAPI."""
+
+    async def get_run_status(self, run_id: Optional[int] = None) -> Optional[dict]:
+        """
+        Get a single run by ID (default to settings.run_id).
+
+        :param run_id: Optional run ID to filter
+        :return: First run dict from the API response, or None if not found
+        """
+        run_id = self._resolve_run_id(run_id)
+        payload = self._runs_query([{"Field": "Id", "Type": "EqualTo", "Values": [run_id]}])
 
         log.info(f"Fetching run status for id {run_id}")
 
-        response = self.api.post(RUN_STATUS, json=payload)
-        if response.status_code != 200:
-            raise LREAPIError(f"Failed to fetch run: {response.text}")
+        response = await self.api.post(RUN_STATUS, json=payload)
+        if response.status != 200:
+            raise LREAPIError(f"Failed to fetch run: {await response.text()}")
 
-        data = response.json()
+        data = await response.json()
         if not data:
             log.warning(f"No runs found for run_id={run_id}")
             return None
@@ -1,21 +1,31 @@
 import ssl
+from typing import TYPE_CHECKING
 from .constants import PROJECT_ROOT, ENV_FILE_PATH
 from .manager import SettingsManager
-from .settings import BaseLRESettings
 from .ssl_context import SSLContextFactory
 
+if TYPE_CHECKING:
+    from .settings import BaseLRESettings
+
 # Global settings manager
 _settings_manager = SettingsManager(PROJECT_ROOT)
 
-def get_settings() -> BaseLRESettings:
+def __getattr__(name: str):
+    """Import BaseLRESettings (and with it pydantic) only when it is first used."""
+    if name == "BaseLRESettings":
+        from .settings import BaseLRESettings
+        return BaseLRESettings
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def get_settings() -> "BaseLRESettings":
     """Get the settings instance."""
     return _settings_manager.get_settings()
 
-def create_ssl_context(settings: BaseLRESettings) -> ssl.SSLContext | None:
+def create_ssl_context(settings: "BaseLRESettings") -> ssl.SSLContext | None:
     """Create SSL context from settings."""
     return SSLContextFactory.create(settings)
 
-def get_ssl_verify_setting(settings: BaseLRESettings) -> bool | str:
+def get_ssl_verify_setting(settings: "BaseLRESettings") -> bool | str:
     """Get SSL verify setting for requests."""
     return SSLContextFactory.get_verify_setting(settings)
 
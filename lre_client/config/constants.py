@@ -4,3 +4,7 @@ from pathlib import Path
 PACKAGE_ROOT: Path = resources.files("lre_client")
 PROJECT_ROOT: Path = PACKAGE_ROOT.parent
 ENV_FILE_PATH: Path = PROJECT_ROOT / "resources" / ".env"
+
+# Upper bucket edges in seconds; one more open-ended bucket collects everything above the last edge
+DEFAULT_HISTOGRAM_EDGES = (0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 8.0, 10.0, 15.0, 20.0, 30.0, 60.0)
+DEFAULT_APDEX_THRESHOLD = 1.0
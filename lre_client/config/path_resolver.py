@@ -1,6 +1,8 @@
 from pathlib import Path
-from typing import Optional
-from .settings import BaseLRESettings
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .settings import BaseLRESettings
 
 
 class PathResolver:
@@ -26,6 +28,6 @@ class PathResolver:
             raise ValueError(f"{file_type} file not found: {path}")
 
     @staticmethod
-    def validate_ssl_files(settings: BaseLRESettings) -> None:
+    def validate_ssl_files(settings: "BaseLRESettings") -> None:
         """Validate CA certificate path if provided."""
         PathResolver.validate_file_exists(settings.lre_ca_cert_path, "CA certificate")
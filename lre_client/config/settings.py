@@ -1,8 +1,8 @@
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Dict, List
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from .constants import ENV_FILE_PATH
+from .constants import ENV_FILE_PATH, DEFAULT_HISTOGRAM_EDGES, DEFAULT_APDEX_THRESHOLD
 
 
 class BaseLRESettings(BaseSettings):
@@ -31,6 +31,53 @@ class BaseLRESettings(BaseSettings):
     lre_timeout: int = Field(30, ge=1, le=300, description="Timeout (sec)")
     lre_max_retries: int = Field(3, ge=0, le=10, description="Max retry attempts")
     lre_retry_backoff: float = Field(1.0, ge=0.1, le=10.0, description="Retry backoff factor")
+    lre_max_concurrency: int = Field(10, ge=1, le=200, description="Max in-flight requests and connection pool size")
+    lre_min_concurrency: int = Field(1, ge=1, le=200, description="Floor for the adaptive in-flight request limit")
+    lre_adaptive_concurrency: bool = Field(True, description="Shrink/grow in-flight requests on throttling (AIMD)")
+    lre_rate_limit: float = Field(0.0, ge=0.0, description="Max requests/sec across all workers (0 = unlimited)")
+    lre_rate_burst: int = Field(10, ge=1, description="Token bucket burst size")
+
+    # Response cache
+    lre_cache_enabled: bool = Field(False, description="Cache GET responses of results-list/host endpoints")
+    lre_cache_dir: Optional[Path] = Field(None, description="Directory for the on-disk response cache (memory only if unset)")
+    lre_cache_ttls: Dict[str, int] = Field(default_factory=dict, description="TTL overrides (sec) keyed by endpoint template")
+
+    # Metrics
+    lre_metrics_enabled: bool = Field(True, description="Record per-endpoint HTTP metrics")
+    lre_metrics_path: Optional[Path] = Field(None, description="Dump metrics here at exit (.json for JSON, else Prometheus text)")
+
+    # Analytics profiling
+    lre_profile_memory: bool = Field(False, description="Trace peak memory per analytics stage (tracemalloc)")
+    lre_profile_cprofile: bool = Field(False, description="Capture a cProfile of each analytics run")
+
+    # Analytics
+    lre_histogram_edges: List[float] = Field(
+        default_factory=lambda: list(DEFAULT_HISTOGRAM_EDGES),
+        description="Response-time histogram bucket edges (sec); empty disables histograms and Apdex")
+    lre_apdex_threshold: float = Field(DEFAULT_APDEX_THRESHOLD, gt=0, description="Apdex T (sec)")
+    lre_analytics_chunksize: int = Field(100_000, ge=1_000, description="Rows per chunk when streaming analysis DB tables")
+    lre_error_top_k: int = Field(200, ge=1, description="Error message templates tracked per run")
+    lre_error_bucket_seconds: float = Field(60.0, gt=0, description="Time bucket width (sec) of error breakdowns")
+    lre_monitor_bucket_seconds: float = Field(60.0, gt=0, description="Time bucket width (sec) of monitor series")
+
+    # Local storage
+    lre_run_mirror_path: Optional[Path] = Field(None, description="SQLite file for the local run-metadata mirror")
+    lre_results_store_path: Optional[Path] = Field(None, description="Directory for per-run results snapshots")
+    lre_results_store_max_runs: int = Field(256, description="Runs kept in memory by the results store")
+    lre_trend_store_path: Optional[Path] = Field(None, description="Directory for the cross-run trend history")
+    lre_trend_history_runs: int = Field(200, description="Runs kept per test in the trend history")
+
+    # Export
+    lre_export_dir: Optional[Path] = Field(None, description="Export analytics results here as Parquet/Arrow (off if unset)")
+    lre_export_format: str = Field("parquet", pattern="^(parquet|arrow)$", description="Export format: parquet or arrow (IPC)")
+    lre_export_compression: str = Field("zstd", description="Export compression codec, or none")
+    lre_export_samples: bool = Field(False, description="Also dump every transaction sample of each run")
+
+    # Local analytics service
+    lre_service_host: str = Field("127.0.0.1", description="Analytics service bind address")
+    lre_service_port: int = Field(8765, ge=0, le=65535, description="Analytics service port")
+    lre_service_workers: int = Field(2, ge=1, description="Analytics worker processes of the service")
+    lre_service_cache_runs: int = Field(32, ge=1, description="Analyzed runs the service keeps in memory")
 
     # HTTP
     lre_user_agent: str = Field("LRE-Python-Client/1.0.0", description="HTTP User-Agent")
@@ -1,13 +1,15 @@
 import ssl
-from typing import Optional
-from .settings import BaseLRESettings
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .settings import BaseLRESettings
 
 
 class SSLContextFactory:
     """Factory for creating SSLContext objects based on configuration."""
 
     @staticmethod
-    def create(settings: BaseLRESettings) -> Optional[ssl.SSLContext]:
+    def create(settings: "BaseLRESettings") -> Optional[ssl.SSLContext]:
         """
         Create and configure an SSL context.
 
@@ -25,7 +27,7 @@ class SSLContextFactory:
         return context
 
     @staticmethod
-    def get_verify_setting(settings: BaseLRESettings) -> bool | str:
+    def get_verify_setting(settings: "BaseLRESettings") -> bool | str:
         """
         Get the correct "verify" value for `requests` (bool, path string).
         """
@@ -0,0 +1,248 @@
+import os
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+
+from lre_client.db.database_manager import SQLiteDBManager
+from lre_client.db.query_store import QueryStore
+from lre_client.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+EXPORT_FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+
+# Result frames of an analytics run: export name -> (attribute, optional sub-attribute)
+RUN_FRAMES = {
+    "analytics": ("analytics", None),
+    "rollups": ("rollups", None),
+    "sketches": ("sketches", None),
+    "histograms": ("histograms", None),
+    "apdex": ("apdex", None),
+    "errors_top": ("errors", "top_errors"),
+    "errors_breakdown": ("errors", "breakdown"),
+    "errors_timeline": ("errors", "timeline"),
+    "monitors_summary": ("monitors", "summary"),
+    "monitors_series": ("monitors", "series"),
+}
+
+
+class _DictionaryEncoder:
+    """
+    Converts frames to Arrow tables with string columns dictionary-encoded.
+
+    Each column keeps one growing dictionary across all frames of a stream,
+    so later batches only add dictionary entries: Arrow IPC files accept
+    dictionary deltas but not replacements, and the schema stays identical
+    for every Parquet row group.
+    """
+
+    def __init__(self, seed_empty: bool = False):
+        """
+        :param seed_empty: Give a dictionary that would start out empty (an all-null
+                           first chunk) a "" placeholder; IPC files reject a delta
+                           on top of an empty first dictionary
+        """
+        self.seed_empty = seed_empty
+        self.schema: Optional[pa.Schema] = None
+        self._dictionaries: Dict[str, Dict[Any, int]] = {}
+        self._values: Dict[str, List[str]] = {}
+
+    @staticmethod
+    def _is_string(series: pd.Series) -> bool:
+        if pd.api.types.is_object_dtype(series.dtype):
+            # An all-null object column would become Arrow's null type, which no later
+            # chunk can be cast to; such columns are string columns in the query results
+            sample = series.dropna()
+            return sample.empty or isinstance(sample.iloc[0], str)
+        return pd.api.types.is_string_dtype(series.dtype)
+
+    def _encode_column(self, name: str, series: pd.Series) -> pa.DictionaryArray:
+        first = name not in self._dictionaries
+        if first:
+            self._dictionaries[name], self._values[name] = {}, []
+        dictionary = self._dictionaries[name]
+        values = self._values[name]
+        codes, uniques = pd.factorize(series, sort=False)
+        if first and not len(uniques) and self.seed_empty:
+            dictionary[""] = 0
+            values.append("")
+        ids = np.empty(len(uniques), dtype=np.int32)
+        for i, value in enumerate(uniques):
+            index = dictionary.get(value)
+            if index is None:
+                index = dictionary[value] = len(values)
+                values.append(str(value))
+            ids[i] = index
+        indices = ids[np.maximum(codes, 0)] if len(uniques) else np.zeros(len(codes), dtype=np.int32)
+        return pa.DictionaryArray.from_arrays(pa.array(indices, mask=codes < 0, type=pa.int32()),
+                                              pa.array(values, type=pa.string()))
+
+    def encode(self, frame: pd.DataFrame) -> pa.Table:
+        """Arrow table for ``frame``; the first frame fixes the schema of the stream."""
+        frame = frame.reset_index(drop=True)
+        arrays = []
+        for name in frame.columns:
+            series = frame[name]
+            if self.schema is not None:
+                encode = pa.types.is_dictionary(self.schema.field(str(name)).type)
+            else:
+                encode = self._is_string(series)
+            arrays.append(self._encode_column(str(name), series) if encode else pa.array(series, from_pandas=True))
+        table = pa.Table.from_arrays(arrays, names=[str(c) for c in frame.columns])
+        if self.schema is None:
+            self.schema = table.schema
+        elif table.schema != self.schema:
+            table = table.select(self.schema.names).cast(self.schema)
+        return table
+
+
+class TableWriter:
+    """
+    Streams frames into one Parquet or Arrow IPC file.
+
+    Every ``write()`` becomes its own Parquet row group or IPC record batch and
+    is flushed as it is produced, so large outputs are never collected in
+    memory. The file is written under a temporary name and renamed on
+    ``close()``; it is only created once the first frame arrives.
+    """
+
+    def __init__(self, path: Path, fmt: str = "parquet", compression: Optional[str] = "zstd"):
+        self.path = Path(path)
+        self.fmt = fmt
+        self.compression = compression
+        self.rows = 0
+        self._tmp = self.path.with_name(f".{self.path.name}.tmp")
+        self._encoder = _DictionaryEncoder(seed_empty=fmt == "arrow")
+        self._writer = None
+
+    def __enter__(self) -> "TableWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _open(self, schema: pa.Schema) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.fmt == "parquet":
+            self._writer = pq.ParquetWriter(self._tmp, schema, compression=self.compression or "none",
+                                            use_dictionary=True)
+        else:
+            options = ipc.IpcWriteOptions(compression=self.compression, emit_dictionary_deltas=True)
+            self._writer = ipc.new_file(self._tmp, schema, options=options)
+
+    def write(self, frame: pd.DataFrame) -> None:
+        """Append ``frame`` as one row group / record batch."""
+        # An empty first frame still fixes the schema, so the file always has one
+        if frame is None or (frame.empty and self._writer is not None):
+            return
+        table = self._encoder.encode(frame)
+        if self._writer is None:
+            self._open(table.schema)
+        if self.fmt == "parquet":
+            self._writer.write_table(table, row_group_size=max(len(table), 1))
+        else:
+            for batch in table.to_batches():
+                self._writer.write_batch(batch)
+        self.rows += len(table)
+
+    def close(self) -> Optional[Path]:
+        """Finish the file; returns its path, or None when nothing was written."""
+        if self._writer is None:
+            return None
+        self._writer.close()
+        self._writer = None
+        os.replace(self._tmp, self.path)
+        return self.path
+
+    def abort(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        self._tmp.unlink(missing_ok=True)
+
+
+class ResultsExporter:
+    """
+    Writes analytics results as Parquet or Arrow IPC files.
+
+    String columns are dictionary-encoded and files are compressed (zstd by
+    default). Arrow IPC files can be memory-mapped by downstream tools
+    (``pyarrow.ipc.open_file(pa.memory_map(path))``); Parquet files keep the
+    dictionary type in their Arrow schema.
+    """
+
+    def __init__(self, out_dir: Optional[Union[str, Path]] = None, fmt: Optional[str] = None,
+                 compression: Optional[str] = None, settings=None):
+        """
+        :param out_dir: Export directory; defaults to settings.lre_export_dir or ./lre_results/export
+        :param fmt: ``parquet`` or ``arrow``; defaults to settings.lre_export_format
+        :param compression: Codec (zstd, lz4, snappy, gzip, ...) or "none"; defaults to
+                            settings.lre_export_compression
+        :param settings: LRE settings used for the defaults above
+        """
+        self.out_dir = Path(out_dir or getattr(settings, "lre_export_dir", None)
+                            or Path.cwd() / "lre_results" / "export")
+        self.fmt = fmt or getattr(settings, "lre_export_format", None) or "parquet"
+        if self.fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format '{self.fmt}', expected one of {list(EXPORT_FORMATS)}")
+        compression = compression or getattr(settings, "lre_export_compression", None) or "zstd"
+        self.compression = None if compression == "none" else compression
+
+    def path(self, name: str, subdir: Optional[Union[str, Path]] = None) -> Path:
+        directory = self.out_dir / subdir if subdir is not None else self.out_dir
+        return directory / f"{name}{EXPORT_FORMATS[self.fmt]}"
+
+    def writer(self, name: str, subdir: Optional[Union[str, Path]] = None) -> TableWriter:
+        """Streaming writer for ``name``; use as a context manager and call ``write()`` per batch."""
+        return TableWriter(self.path(name, subdir), self.fmt, self.compression)
+
+    def write(self, name: str, frame: pd.DataFrame, subdir: Optional[Union[str, Path]] = None) -> Path:
+        """Write one frame in a single pass."""
+        with self.writer(name, subdir) as writer:
+            writer.write(frame)
+        return writer.path
+
+    def export_run(self, source, subdir: Optional[Union[str, Path]] = None) -> Dict[str, Path]:
+        """
+        Export every result frame of a run.
+
+        :param source: RunOutcome, or a LoadTestAnalyticsManager after run() (``last_*`` attributes)
+        :param subdir: Subdirectory, e.g. the run ID
+        :return: Export name -> written file
+        """
+        prefix = "last_" if hasattr(source, "last_sketches") else ""
+        written: Dict[str, Path] = {}
+        for name, (attribute, part) in RUN_FRAMES.items():
+            value = getattr(source, prefix + attribute, None)
+            if value is not None and part is not None:
+                value = getattr(value, part, None)
+            if isinstance(value, pd.DataFrame) and not value.empty:
+                written[name] = self.write(name, value, subdir)
+
+        report = getattr(source, "last_report" if prefix else "profile", None)
+        if report is not None:
+            directory = self.out_dir / subdir if subdir is not None else self.out_dir
+            written["profile"] = report.write_json(directory / "profile.json")
+        log.info(f"Exported {len(written)} result files to {self.out_dir / subdir if subdir else self.out_dir}")
+        return written
+
+    def export_samples(self, db_path: Union[str, Path], subdir: Optional[Union[str, Path]] = None,
+                       chunksize: int = 500_000) -> Optional[Path]:
+        """
+        Dump every transaction sample (script, transaction, status, end time,
+        response time, count) from an analysis DB, one row group per DB chunk.
+        """
+        with self.writer("samples", subdir) as writer, \
+                SQLiteDBManager(str(db_path), default_chunk_size=chunksize) as db:
+            for chunk in db.query(QueryStore.SQL_TRANSACTION_SAMPLES):
+                writer.write(chunk)
+        log.info(f"Exported {writer.rows:,} samples to {writer.path}")
+        return writer.path if writer.rows else None
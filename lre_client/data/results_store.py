@@ -1,44 +1,258 @@
-from typing import Optional, Dict, Any
-from dataclasses import dataclass, field
+import json
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict, Any, List, TYPE_CHECKING
+
+from lre_client.models.results import RunResult, RunResultsCollection
 from lre_client.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 log = get_logger(__name__)
 
+_META_FILE = "meta.json"
+_ANALYTICS_FILE = "analytics.parquet"
 
-@dataclass
-class ResultsStore:
-    """Stores and manages LRE results data."""
 
+@dataclass
+class RunEntry:
+    """Everything the store knows about one run."""
+    run_id: int
     run_status: Optional[Dict[str, Any]] = None
     hosts: list = field(default_factory=list)
-    test_results: list = field(default_factory=list)
-    results_info: Optional[Dict[str, Any]] = None
-
-    def update_run_status(self, run_status: Dict[str, Any]) -> None:
-        """Update run status and log the change."""
-        self.run_status = run_status
-        log.debug(f"Run status updated: {run_status.get('State', 'Unknown')}")
-
-    def update_hosts(self, hosts: list) -> None:
-        """Update hosts list."""
-        self.hosts = hosts
-        log.info(f"Hosts updated: {len(hosts)} hosts")
-
-    def get_run_status_summary(self) -> str:
-        """Get a summary of the run status."""
-        if not self.run_status:
+    results: Optional[RunResultsCollection] = None
+    analytics: Optional["pd.DataFrame"] = field(default=None, repr=False)
+    has_analytics: bool = False
+    updated_at: Optional[str] = None
+
+    def to_meta(self) -> Dict[str, Any]:
+        return {
+            "run_id": self.run_id,
+            "run_status": self.run_status,
+            "hosts": self.hosts,
+            "results": [asdict(r) for r in self.results.results] if self.results else None,
+            "has_analytics": self.has_analytics,
+            "updated_at": self.updated_at,
+        }
+
+    @classmethod
+    def from_meta(cls, meta: Dict[str, Any]) -> "RunEntry":
+        results = meta.get("results")
+        return cls(
+            run_id=int(meta["run_id"]),
+            run_status=meta.get("run_status"),
+            hosts=meta.get("hosts") or [],
+            results=RunResultsCollection(int(meta["run_id"]), [RunResult(**r) for r in results])
+            if results is not None else None,
+            has_analytics=bool(meta.get("has_analytics")),
+            updated_at=meta.get("updated_at"),
+        )
+
+
+class ResultsStore:
+    """
+    Stores and manages LRE results data for many runs.
+
+    Entries are keyed by run ID and kept in a bounded in-memory LRU. With a
+    store directory every update is snapshotted to ``<store_dir>/<run_id>/``:
+    compact JSON for run status, hosts and the results listing, and Parquet for
+    the analytics DataFrame. A later process (a resumed batch or a report) loads
+    those snapshots instead of going back to the server and the analysis DB.
+    Analytics frames are read from disk only when asked for.
+    """
+
+    def __init__(self, store_dir: Optional[str | Path] = None, max_entries: Optional[int] = None,
+                 settings=None, persist: bool = True):
+        """
+        :param store_dir: Snapshot directory; defaults to settings.lre_results_store_path
+                          or ./lre_results/store
+        :param max_entries: Runs kept in memory; defaults to settings.lre_results_store_max_runs
+        :param settings: LRE settings used for the defaults above
+        :param persist: False for an in-memory store with no snapshots
+        """
+        if persist:
+            store_dir = store_dir or getattr(settings, "lre_results_store_path", None) \
+                        or Path.cwd() / "lre_results" / "store"
+            self.store_dir: Optional[Path] = Path(store_dir)
+            self.store_dir.mkdir(parents=True, exist_ok=True)
+        else:
+            self.store_dir = None
+        self.max_entries = max_entries or getattr(settings, "lre_results_store_max_runs", None) or 256
+
+        self._entries: OrderedDict[int, RunEntry] = OrderedDict()
+        self._lock = threading.RLock()
+
+    # -------------------- ENTRIES --------------------
+
+    def _run_dir(self, run_id: int) -> Path:
+        return self.store_dir / str(run_id)
+
+    def _remember(self, entry: RunEntry) -> None:
+        self._entries[entry.run_id] = entry
+        self._entries.move_to_end(entry.run_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _load(self, run_id: int) -> Optional[RunEntry]:
+        if not self.store_dir:
+            return None
+        meta_path = self._run_dir(run_id) / _META_FILE
+        try:
+            return RunEntry.from_meta(json.loads(meta_path.read_text(encoding="utf-8")))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            log.warning(f"Ignoring unreadable snapshot for run {run_id}: {e}")
+            return None
+
+    def get(self, run_id: int) -> Optional[RunEntry]:
+        """Entry for a run from memory or its snapshot, or None if the run is unknown."""
+        run_id = int(run_id)
+        with self._lock:
+            entry = self._entries.get(run_id)
+            if entry is None:
+                entry = self._load(run_id)
+                if entry is None:
+                    return None
+            self._remember(entry)
+            return entry
+
+    def entry(self, run_id: int) -> RunEntry:
+        """Entry for a run, created empty if the run is unknown."""
+        with self._lock:
+            return self.get(run_id) or self._create(int(run_id))
+
+    def _create(self, run_id: int) -> RunEntry:
+        entry = RunEntry(run_id)
+        self._remember(entry)
+        return entry
+
+    def __contains__(self, run_id: int) -> bool:
+        return self.get(run_id) is not None
+
+    def run_ids(self) -> List[int]:
+        """IDs of all runs in memory or on disk."""
+        with self._lock:
+            ids = set(self._entries)
+        if self.store_dir:
+            ids.update(int(p.parent.name) for p in self.store_dir.glob(f"*/{_META_FILE}") if p.parent.name.isdigit())
+        return sorted(ids)
+
+    # -------------------- SNAPSHOTS --------------------
+
+    def _save_meta(self, entry: RunEntry) -> None:
+        entry.updated_at = datetime.now().isoformat(timespec="seconds")
+        if not self.store_dir:
+            return
+        run_dir = self._run_dir(entry.run_id)
+        run_dir.mkdir(parents=True, exist_ok=True)
+        tmp = run_dir / f".{_META_FILE}.tmp"
+        tmp.write_text(json.dumps(entry.to_meta(), separators=(",", ":"), default=str), encoding="utf-8")
+        os.replace(tmp, run_dir / _META_FILE)
+
+    # -------------------- UPDATES --------------------
+
+    def update_run_status(self, run_status: Dict[str, Any], run_id: Optional[int] = None) -> RunEntry:
+        """Update run status (keyed by its Id unless run_id is given) and snapshot it."""
+        run_id = int(run_id if run_id is not None else run_status["Id"])
+        with self._lock:
+            entry = self.entry(run_id)
+            entry.run_status = run_status
+            self._save_meta(entry)
+        log.debug("Run %s status updated: %s", run_id, run_status.get('State', 'Unknown'))
+        return entry
+
+    def update_hosts(self, run_id: int, hosts: list) -> RunEntry:
+        """Update the hosts list of a run."""
+        with self._lock:
+            entry = self.entry(run_id)
+            entry.hosts = hosts
+            self._save_meta(entry)
+        log.info(f"Run {run_id} hosts updated: {len(hosts)} hosts")
+        return entry
+
+    def update_run_results(self, results: RunResultsCollection) -> RunEntry:
+        """Update the results listing of a run."""
+        with self._lock:
+            entry = self.entry(results.run_id)
+            entry.results = results
+            self._save_meta(entry)
+        return entry
+
+    def update_analytics(self, run_id: int, analytics: "pd.DataFrame") -> RunEntry:
+        """Store a run's analytics DataFrame and snapshot it as Parquet."""
+        with self._lock:
+            entry = self.entry(run_id)
+            if self.store_dir:
+                run_dir = self._run_dir(entry.run_id)
+                run_dir.mkdir(parents=True, exist_ok=True)
+                tmp = run_dir / f".{_ANALYTICS_FILE}.tmp"
+                analytics.to_parquet(tmp, index=False)
+                os.replace(tmp, run_dir / _ANALYTICS_FILE)
+            entry.analytics = analytics
+            entry.has_analytics = True
+            self._save_meta(entry)
+        log.debug("Run %s analytics stored (%d rows)", run_id, len(analytics))
+        return entry
+
+    # -------------------- READS --------------------
+
+    def has_analytics(self, run_id: int) -> bool:
+        entry = self.get(run_id)
+        return bool(entry and entry.has_analytics)
+
+    def get_analytics(self, run_id: int) -> Optional["pd.DataFrame"]:
+        """Analytics DataFrame of a run, read from its Parquet snapshot on first access."""
+        with self._lock:
+            entry = self.get(run_id)
+            if entry is None or not entry.has_analytics:
+                return None
+            if entry.analytics is None and self.store_dir:
+                import pandas as pd
+                try:
+                    entry.analytics = pd.read_parquet(self._run_dir(entry.run_id) / _ANALYTICS_FILE)
+                except (OSError, ValueError) as e:
+                    # pyarrow's ArrowInvalid (corrupt or truncated file) is a ValueError
+                    log.warning(f"Analytics snapshot for run {run_id} could not be read: {e}")
+                    entry.has_analytics = False
+            return entry.analytics
+
+    def get_run_status_summary(self, run_id: int) -> str:
+        """Get a summary of a run's status."""
+        entry = self.get(run_id)
+        if not entry or not entry.run_status:
             return "No run status available"
 
-        status = self.run_status.get('State', 'Unknown')
-        run_id = self.run_status.get('Id', 'Unknown')
+        status = entry.run_status.get('State', 'Unknown')
         return f"Run id {run_id} status: {status}"
 
-    def update_run_results(self, results_info):
-        self.results_info = results_info
+    # -------------------- REMOVAL --------------------
+
+    def remove(self, run_id: int) -> None:
+        """Drop a run from memory and disk."""
+        run_id = int(run_id)
+        with self._lock:
+            self._entries.pop(run_id, None)
+            if self.store_dir:
+                shutil.rmtree(self._run_dir(run_id), ignore_errors=True)
+
+    def evict(self) -> None:
+        """Drop in-memory entries; snapshots stay on disk."""
+        with self._lock:
+            self._entries.clear()
 
     def clear(self) -> None:
-        """Clear all stored results."""
-        self.run_status = None
-        self.hosts.clear()
-        self.test_results.clear()
+        """Clear all stored results, including snapshots."""
+        with self._lock:
+            self._entries.clear()
+            if self.store_dir:
+                for run_dir in self.store_dir.iterdir():
+                    if run_dir.is_dir() and run_dir.name.isdigit():
+                        shutil.rmtree(run_dir, ignore_errors=True)
         log.debug("Results store cleared")
@@ -0,0 +1,233 @@
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from lre_client.analytics.sketches import SKETCH_MEANS, SKETCH_COUNTS, merge_centroids, sketch_quantiles
+from lre_client.utils.common_utils import safe_parse_time
+from lre_client.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+KEY_COLUMNS = ["test_id", "run_id", "start_time", "Script_Name", "Transaction_Name"]
+TXN_KEY = ["Script_Name", "Transaction_Name"]
+
+
+class TrendStore:
+    """
+    Local columnar history of per-transaction analytics across runs.
+
+    Each test has one Parquet file holding a row per (run, transaction): the
+    LoadTestAnalyticsManager output columns plus the run's t-digest centroids
+    (see analytics.sketches). Rows are ordered by run start time, so trend and
+    baseline queries read one file and slice it; loaded frames are cached in
+    memory until the file changes. Only the most recent ``max_runs_per_test``
+    runs of a test are kept.
+
+    Writes are serialized within a process; do not append to the same store
+    from several processes at once.
+    """
+
+    def __init__(self, store_dir: Optional[str | Path] = None, settings=None,
+                 max_runs_per_test: Optional[int] = None):
+        """
+        :param store_dir: Directory for the history files; defaults to
+                          settings.lre_trend_store_path or ./lre_results/trends
+        :param settings: LRE settings used for the defaults
+        :param max_runs_per_test: Runs kept per test; defaults to settings.lre_trend_history_runs
+        """
+        store_dir = store_dir or getattr(settings, "lre_trend_store_path", None) \
+                    or Path.cwd() / "lre_results" / "trends"
+        self.store_dir = Path(store_dir)
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        self.max_runs_per_test = max_runs_per_test or getattr(settings, "lre_trend_history_runs", None) or 200
+
+        self._frames: Dict[int, Tuple[float, pd.DataFrame]] = {}
+        self._lock = threading.RLock()
+
+    # -------------------- FILES --------------------
+
+    def _path(self, test_id: int) -> Path:
+        return self.store_dir / f"test_{int(test_id)}.parquet"
+
+    def _frame(self, test_id: int) -> pd.DataFrame:
+        """Full history of a test, from the in-memory cache when the file is unchanged."""
+        path = self._path(test_id)
+        with self._lock:
+            try:
+                mtime = path.stat().st_mtime
+            except FileNotFoundError:
+                return pd.DataFrame(columns=KEY_COLUMNS)
+            cached = self._frames.get(test_id)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+            frame = pd.read_parquet(path)
+            self._frames[test_id] = (mtime, frame)
+            return frame
+
+    def test_ids(self) -> List[int]:
+        return sorted(int(p.stem.split("_", 1)[1]) for p in self.store_dir.glob("test_*.parquet"))
+
+    # -------------------- WRITE --------------------
+
+    def append_run(self, run: Dict[str, Any], analytics: pd.DataFrame,
+                   sketches: Optional[pd.DataFrame] = None) -> int:
+        """
+        Append the analytics of a run as returned by the runs endpoint.
+
+        :param run: Run dict with at least Id and TestId (Start is used for ordering)
+        :param analytics: LoadTestAnalyticsManager.run() output
+        :param sketches: LoadTestAnalyticsManager.last_sketches for the same run
+        :return: Number of transaction rows stored
+        """
+        return self.append(
+            test_id=int(run["TestId"]),
+            run_id=int(run["Id"]),
+            start_time=safe_parse_time(run.get("Start") or ""),
+            analytics=analytics,
+            sketches=sketches,
+        )
+
+    def append(self, test_id: int, run_id: int, start_time: Optional[datetime],
+               analytics: pd.DataFrame, sketches: Optional[pd.DataFrame] = None) -> int:
+        """Store (or replace) one run's per-transaction rows in the test's history."""
+        rows = analytics.copy()
+        if sketches is not None and not sketches.empty:
+            rows = rows.merge(sketches[TXN_KEY + [SKETCH_MEANS, SKETCH_COUNTS]], on=TXN_KEY, how="left")
+        rows.insert(0, "start_time", pd.Timestamp(start_time) if start_time else pd.NaT)
+        rows.insert(0, "run_id", int(run_id))
+        rows.insert(0, "test_id", int(test_id))
+
+        with self._lock:
+            history = self._frame(test_id)
+            if not history.empty:
+                history = history[history["run_id"] != int(run_id)]
+                rows = pd.concat([history, rows], ignore_index=True) if not history.empty else rows
+            rows["start_time"] = pd.to_datetime(rows["start_time"])
+            rows = rows.sort_values(["start_time", "run_id"], na_position="first", kind="stable")
+
+            kept_runs = rows["run_id"].drop_duplicates().iloc[-self.max_runs_per_test:]
+            rows = rows[rows["run_id"].isin(kept_runs)].reset_index(drop=True)
+
+            path = self._path(test_id)
+            tmp = path.with_suffix(".parquet.tmp")
+            rows.to_parquet(tmp, index=False)
+            os.replace(tmp, path)
+            self._frames[int(test_id)] = (path.stat().st_mtime, rows)
+
+        log.info(f"Trend store: run {run_id} of test {test_id} stored ({len(analytics):,} transactions, "
+                 f"{len(kept_runs)} runs in history)")
+        return len(analytics)
+
+    # -------------------- QUERIES --------------------
+
+    def runs(self, test_id: int) -> pd.DataFrame:
+        """Runs in a test's history, oldest first, with their transaction counts."""
+        history = self._frame(test_id)
+        if history.empty:
+            return pd.DataFrame(columns=["run_id", "start_time", "transactions"])
+        return (history.groupby(["run_id", "start_time"], sort=False, dropna=False)
+                .size().rename("transactions").reset_index())
+
+    def history(
+            self,
+            test_id: int,
+            transactions: Optional[Sequence[str]] = None,
+            last_n: Optional[int] = None,
+            since: Optional[datetime] = None,
+            before_run_id: Optional[int] = None,
+            with_sketches: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Per-transaction rows of a test, oldest run first.
+
+        :param transactions: Only these transaction names
+        :param last_n: Only the most recent N runs (after the other run filters)
+        :param since: Only runs that started at or after this time
+        :param before_run_id: Only runs that started before this run
+        :param with_sketches: Include the centroid list columns
+        """
+        history = self._frame(test_id)
+        if history.empty:
+            return history
+
+        run_ids = history["run_id"].drop_duplicates()
+        if before_run_id is not None:
+            position = np.flatnonzero(run_ids.to_numpy() == int(before_run_id))
+            run_ids = run_ids.iloc[:position[0]] if position.size else run_ids.iloc[:0]
+        if since is not None:
+            starts = history.drop_duplicates("run_id").set_index("run_id")["start_time"]
+            run_ids = run_ids[starts.loc[run_ids].to_numpy() >= pd.Timestamp(since)]
+        if last_n is not None:
+            run_ids = run_ids.iloc[-last_n:]
+
+        mask = history["run_id"].isin(run_ids)
+        if transactions is not None:
+            mask &= history["Transaction_Name"].isin(list(transactions))
+        result = history[mask]
+        if not with_sketches:
+            result = result.drop(columns=[SKETCH_MEANS, SKETCH_COUNTS], errors="ignore")
+        return result.reset_index(drop=True)
+
+    def metric_trend(self, test_id: int, transaction: str, metric: str = "p95",
+                     last_n: int = 50, script: Optional[str] = None) -> pd.DataFrame:
+        """``metric`` of one transaction over the last N runs: run_id, start_time, Script_Name, value."""
+        history = self.history(test_id, transactions=[transaction], last_n=last_n)
+        if history.empty:
+            return pd.DataFrame(columns=["run_id", "start_time", "Script_Name", "value"])
+        if script is not None:
+            history = history[history["Script_Name"] == script]
+        return history[["run_id", "start_time", "Script_Name", metric]].rename(columns={metric: "value"})
+
+    def baseline(self, test_id: int, before_run_id: Optional[int] = None, last_n: int = 10,
+                 quantiles: Sequence[float] = (0.50, 0.90, 0.95, 0.99)) -> pd.DataFrame:
+        """
+        Pooled baseline per transaction over the last N runs (before ``before_run_id``).
+
+        Percentiles come from merging the runs' sketches, i.e. they describe all
+        samples of the window together rather than an average of per-run values.
+        """
+        history = self.history(test_id, last_n=last_n, before_run_id=before_run_id, with_sketches=True)
+        columns = TXN_KEY + ["runs", "samples"] + [f"p{round(q * 100):g}" for q in quantiles]
+        if history.empty or SKETCH_MEANS not in history:
+            return pd.DataFrame(columns=columns)
+
+        rows = []
+        for (script, txn), group in history.groupby(TXN_KEY, sort=False):
+            sketched = group[group[SKETCH_MEANS].notna()]
+            means, counts = merge_centroids(sketched[SKETCH_MEANS], sketched[SKETCH_COUNTS])
+            rows.append([script, txn, group["run_id"].nunique(), counts.sum(),
+                         *sketch_quantiles(means, counts, quantiles)])
+        return pd.DataFrame(rows, columns=columns)
+
+    def regressions(self, test_id: int, run_id: int, metric: str = "p95", window: int = 10,
+                    threshold: float = 0.10, min_runs: int = 3) -> pd.DataFrame:
+        """
+        Compare a run's ``metric`` with the rolling median of the previous ``window`` runs.
+
+        :param threshold: Relative increase over the baseline that counts as a regression
+        :param min_runs: Baseline runs a transaction needs before it can be flagged
+        :return: One row per transaction of the run with baseline, delta, ratio and a regression flag
+        """
+        current = self.history(test_id)
+        if current.empty:
+            return pd.DataFrame(columns=TXN_KEY + [metric, "baseline", "baseline_runs", "delta", "ratio", "regression"])
+        current = current[current["run_id"] == int(run_id)][TXN_KEY + [metric]]
+        previous = self.history(test_id, last_n=window, before_run_id=run_id)
+
+        if previous.empty:
+            baseline = pd.DataFrame(columns=TXN_KEY + ["baseline", "baseline_runs"])
+        else:
+            baseline = (previous.groupby(TXN_KEY)[metric]
+                        .agg(baseline="median", baseline_runs="count").reset_index())
+
+        result = current.merge(baseline, on=TXN_KEY, how="left")
+        result["baseline_runs"] = result["baseline_runs"].fillna(0).astype(int)
+        result["delta"] = result[metric] - result["baseline"]
+        result["ratio"] = result[metric] / result["baseline"].where(result["baseline"] > 0)
+        result["regression"] = (result["baseline_runs"] >= min_runs) & (result["ratio"] > 1 + threshold)
+        return result.sort_values("ratio", ascending=False, na_position="last").reset_index(drop=True)
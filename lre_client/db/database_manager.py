@@ -1,6 +1,6 @@
 import sqlite3
 import pandas as pd
-from typing import Optional, Dict, Any, Iterator
+from typing import Optional, Dict, Any, Iterator, List, Sequence
 from contextlib import contextmanager
 from lre_client.utils.logger import get_logger
 
@@ -42,6 +42,17 @@ class SQLiteDBManager:
         self.default_chunk_size = default_chunk_size
         self._conn: Optional[sqlite3.Connection] = None
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
     @contextmanager
     def connection(self):
         """Context manager for database connection with optimizations."""
@@ -60,6 +71,29 @@ class SQLiteDBManager:
                 conn.close()
                 log.debug("Database connection closed")
 
+    def has_tables(self, *names: str) -> bool:
+        """True when every named table exists in the database."""
+        with self.connection() as conn:
+            found = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        return all(name in found for name in names)
+
+    def missing_columns(self, required: Dict[str, Sequence[str]]) -> List[str]:
+        """
+        Check tables for the columns a query reads.
+
+        :param required: Column names per table
+        :return: Missing ``table.column`` names (``table`` when the whole table is absent)
+        """
+        missing = []
+        with self.connection() as conn:
+            for table, columns in required.items():
+                present = {row[1] for row in conn.execute(f'PRAGMA table_info("{table}")')}
+                if not present:
+                    missing.append(table)
+                    continue
+                missing.extend(f"{table}.{column}" for column in columns if column not in present)
+        return missing
+
     def query(
             self,
             sql: str,
@@ -72,7 +106,7 @@ class SQLiteDBManager:
         actual_chunk_size = chunk_size if chunk_size is not None else self.default_chunk_size
 
         with self.connection() as conn:
-            log.debug(f"Executing query with chunk size {actual_chunk_size}")
+            log.debug("Executing query with chunk size %s", actual_chunk_size)
             yield from pd.read_sql_query(sql, conn, params=params, chunksize=actual_chunk_size)
 
     def query_single(
@@ -84,7 +118,7 @@ class SQLiteDBManager:
         Convenience method for when you want a single DataFrame.
         Still uses chunked processing internally but returns combined result.
         """
-        log.debug(f"Executing single-result query: {sql[:100]}...")
+        log.debug("Executing single-result query: %.100s...", sql)
         chunks = self.query(sql, params, chunk_size=None)
         result_chunks = []
 
@@ -93,7 +127,7 @@ class SQLiteDBManager:
 
         if result_chunks:
             result = pd.concat(result_chunks, ignore_index=True)
-            log.debug(f"Single query returned {len(result)} rows")
+            log.debug("Single query returned %d rows", len(result))
             return result
         else:
             log.debug("Single query returned empty result")
@@ -28,6 +28,26 @@ class QueryStore:
     """
 
 
+    # Raw weighted samples with their end time and status, for sample dumps
+    SQL_TRANSACTION_SAMPLES = """
+    SELECT
+        vg."Group Name" AS Script_Name,
+        EMAP."Event Name" AS Transaction_Name,
+        TES."Transaction End Status" AS Status,
+        EM."End Time" AS End_Time,
+        EM.Value - COALESCE(EM."Think Time", 0) AS Response_Times,
+        EM.Acount AS Counts
+    FROM Event_meter EM
+    JOIN Event_map EMAP
+        ON EM."Event Name" = EMAP."Event Name"
+        AND EMAP."Event Type" = 'Transaction'
+    JOIN TransactionEndStatus TES
+        ON EM.Status1 = TES.Status1
+    JOIN VuserGroup vg
+        ON EM."Group ID" = vg."Group ID"
+    ;
+    """
+
     SQL_TRANSACTION_SUMMARY = """
     SELECT
         vg."Group Name" AS Script_Name,
@@ -76,4 +96,69 @@ class QueryStore:
     
     GROUP BY vg."Group Name", EMAP."Event Name"
     ORDER BY vg."Group Name", EMAP."Event Name";
-    """
\ No newline at end of file
+    """
+
+    # Error_meter holds one row per error occurrence; messages are normalized via ErrorMessage
+    SQL_ERROR_TABLES = ("Error_meter", "ErrorMessage", "VuserGroup", "Host")
+
+    # Columns SQL_ERROR_EVENTS reads, checked before the query so a schema change skips the stage
+    SQL_ERROR_COLUMNS = {
+        "Error_meter": ("Error Message ID", "Group ID", "Host ID", "End Time", "Error Code"),
+        "ErrorMessage": ("Error Message ID", "Error Message"),
+        "VuserGroup": ("Group ID", "Group Name"),
+        "Host": ("Host ID", "Host Name"),
+    }
+
+    SQL_ERROR_EVENTS = """
+    SELECT
+        vg."Group Name" AS Script_Name,
+        COALESCE(h."Host Name", CAST(ERM."Host ID" AS TEXT)) AS Injector,
+        ERM."End Time" AS End_Time,
+        ERM."Error Code" AS Error_Code,
+        EMSG."Error Message" AS Error_Message
+    FROM Error_meter ERM
+    JOIN ErrorMessage EMSG
+        ON ERM."Error Message ID" = EMSG."Error Message ID"
+    JOIN VuserGroup vg
+        ON ERM."Group ID" = vg."Group ID"
+    LEFT JOIN Host h
+        ON ERM."Host ID" = h."Host ID"
+    ;
+    """
+
+
+    # Monitor_meter holds one sample per monitor measurement; rows are read by integer codes
+    # and named afterwards from Event_map and Host
+    SQL_MONITOR_TABLES = ("Monitor_meter", "Event_map", "Host")
+
+    # Columns the monitor queries read, checked like SQL_ERROR_COLUMNS
+    SQL_MONITOR_COLUMNS = {
+        "Monitor_meter": ("Host ID", "Event ID", "End Time", "Value"),
+        "Event_map": ("Event ID", "Event Type", "Event Name"),
+        "Host": ("Host ID", "Host Name"),
+    }
+
+    SQL_MONITOR_VALUES = """
+    SELECT
+        MM."Host ID" AS Host_ID,
+        MM."Event ID" AS Event_ID,
+        MM."End Time" AS End_Time,
+        MM.Value AS Value
+    FROM Monitor_meter MM
+    WHERE MM.Value IS NOT NULL
+    ;
+    """
+
+    SQL_MONITOR_NAMES = """
+    SELECT
+        EMAP."Event ID" AS Event_ID,
+        EMAP."Event Type" AS Monitor,
+        EMAP."Event Name" AS Metric
+    FROM Event_map EMAP
+    WHERE EMAP."Event ID" IN (SELECT DISTINCT "Event ID" FROM Monitor_meter)
+    ;
+    """
+
+    SQL_HOST_NAMES = """
+    SELECT "Host ID" AS Host_ID, "Host Name" AS Host FROM Host;
+    """
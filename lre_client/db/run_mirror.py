@@ -0,0 +1,243 @@
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Iterable
+
+from lre_client.models.runs import FINAL_RUN_STATES
+from lre_client.utils.common_utils import safe_parse_time
+from lre_client.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+# (column, run dict key, type) for every field RunSummary reads
+_RUN_COLUMNS = [
+    ("run_id", "Id", int),
+    ("name", "Name", str),
+    ("test_id", "TestId", int),
+    ("test_name", "TestName", str),
+    ("test_instance_id", "TestInstanceId", int),
+    ("state", "State", str),
+    ("start_time", "Start", "time"),
+    ("end_time", "End", "time"),
+    ("controller", "Controller", str),
+    ("vusers_involved", "VusersInvolved", int),
+    ("trans_passed", "TransPassed", int),
+    ("trans_failed", "TransFailed", int),
+    ("errors", "Errors", int),
+    ("trans_per_sec", "TransPerSec", float),
+    ("hits_per_sec", "HitsPerSec", float),
+    ("throughput_avg", "ThroughputAvg", float),
+    ("lgs", "LGs", str),
+]
+
+
+class RunMirrorQueries:
+    """SQL used by the local run-metadata mirror."""
+
+    SQL_CREATE = """
+    CREATE TABLE IF NOT EXISTS runs (
+        run_id            INTEGER PRIMARY KEY,
+        name              TEXT,
+        test_id           INTEGER,
+        test_name         TEXT,
+        test_instance_id  INTEGER,
+        state             TEXT,
+        start_time        TEXT,
+        end_time          TEXT,
+        controller        TEXT,
+        vusers_involved   INTEGER,
+        trans_passed      INTEGER,
+        trans_failed      INTEGER,
+        errors            INTEGER,
+        trans_per_sec     REAL,
+        hits_per_sec      REAL,
+        throughput_avg    REAL,
+        lgs               TEXT,
+        raw               TEXT NOT NULL,
+        synced_at         TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_runs_test_start ON runs (test_id, start_time);
+    CREATE INDEX IF NOT EXISTS idx_runs_state ON runs (state);
+    CREATE INDEX IF NOT EXISTS idx_runs_start ON runs (start_time);
+    CREATE INDEX IF NOT EXISTS idx_runs_end ON runs (end_time);
+    """
+
+    SQL_UPSERT = f"""
+    INSERT OR REPLACE INTO runs ({", ".join(c for c, _, _ in _RUN_COLUMNS)}, raw, synced_at)
+    VALUES ({", ".join(":" + c for c, _, _ in _RUN_COLUMNS)}, :raw, :synced_at);
+    """
+
+    SQL_MAX_RUN_ID = "SELECT MAX(run_id) FROM runs;"
+
+    SQL_OPEN_RUN_IDS = f"""
+    SELECT run_id FROM runs
+    WHERE state IS NULL OR state NOT IN ({", ".join("?" for _ in FINAL_RUN_STATES)});
+    """
+
+
+def _coerce(value: Any, kind) -> Any:
+    """Convert a raw API value to the column type, mapping blanks/garbage to NULL."""
+    if value is None or value == "":
+        return None
+    try:
+        if kind == "time":
+            parsed = value if isinstance(value, datetime) else safe_parse_time(str(value))
+            return parsed.isoformat() if parsed else None
+        return kind(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class RunMetadataMirror:
+    """
+    Local SQLite mirror of LRE run metadata with incremental sync.
+
+    The mirror is filled from the runs endpoint and kept current with two small
+    delta requests per sync: runs with an ID above the highest mirrored ID, and a
+    bulk refresh of mirrored runs that had not reached a final state yet.
+    Queries are then answered locally from indexed columns.
+    """
+
+    def __init__(self, db_path: Optional[str | Path] = None, settings=None):
+        if db_path is None:
+            db_path = getattr(settings, "lre_run_mirror_path", None) or Path.cwd() / "lre_results" / "runs_mirror.db"
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL;")
+        self._conn.execute("PRAGMA synchronous=NORMAL;")
+        self._conn.executescript(RunMirrorQueries.SQL_CREATE)
+        log.debug(f"Run metadata mirror opened at {self.db_path}")
+
+    # -------------------- WRITE --------------------
+
+    def upsert_runs(self, runs: Iterable[Dict[str, Any]]) -> int:
+        """Insert or replace runs as returned by the runs endpoint."""
+        synced_at = datetime.now().isoformat(timespec="seconds")
+        rows = []
+        for run in runs:
+            row = {column: _coerce(run.get(key), kind) for column, key, kind in _RUN_COLUMNS}
+            if row["run_id"] is None:
+                continue
+            row["raw"] = json.dumps(run, separators=(",", ":"), default=str)
+            row["synced_at"] = synced_at
+            rows.append(row)
+
+        if rows:
+            with self._lock, self._conn:
+                self._conn.executemany(RunMirrorQueries.SQL_UPSERT, rows)
+        return len(rows)
+
+    def sync(self, runs_api, filters: Optional[List[dict]] = None, page_size: Optional[int] = None) -> int:
+        """
+        Bring the mirror up to date using an LRERunsAPI.
+
+        :param runs_api: LRERunsAPI (e.g. ``LREClient().runs``)
+        :param filters: Extra LRE run filters applied to the new-run scan
+        :param page_size: Page size for the new-run scan
+        :return: Number of runs inserted or refreshed
+        """
+        max_id = self.max_run_id()
+        open_ids = self.open_run_ids()
+        log.info(f"Syncing run mirror (last run id {max_id}, {len(open_ids)} unfinished runs)")
+
+        updated = 0
+        if open_ids:
+            updated += self.upsert_runs(runs_api.get_runs_status(open_ids).values())
+
+        new_filters = list(filters or [])
+        if max_id is not None:
+            new_filters.append({"Field": "Id", "Type": "GreaterThan", "Values": [max_id]})
+
+        batch = []
+        for run in runs_api.iter_runs(new_filters, page_size=page_size):
+            batch.append(run)
+            if len(batch) >= 1000:
+                updated += self.upsert_runs(batch)
+                batch.clear()
+        updated += self.upsert_runs(batch)
+
+        log.info(f"Run mirror sync complete: {updated} runs inserted or refreshed")
+        return updated
+
+    # -------------------- READ --------------------
+
+    def max_run_id(self) -> Optional[int]:
+        with self._lock:
+            return self._conn.execute(RunMirrorQueries.SQL_MAX_RUN_ID).fetchone()[0]
+
+    def open_run_ids(self) -> List[int]:
+        """IDs of mirrored runs that may still change on the server."""
+        with self._lock:
+            cursor = self._conn.execute(RunMirrorQueries.SQL_OPEN_RUN_IDS, tuple(FINAL_RUN_STATES))
+            return [row[0] for row in cursor]
+
+    def get_run(self, run_id: int) -> Optional[Dict[str, Any]]:
+        """Return the mirrored run dict in the API's own shape, or None."""
+        with self._lock:
+            row = self._conn.execute("SELECT raw FROM runs WHERE run_id = ?;", (run_id,)).fetchone()
+        return json.loads(row["raw"]) if row else None
+
+    def query_runs(
+            self,
+            test_id: Optional[int] = None,
+            state: Optional[str] = None,
+            since: Optional[datetime] = None,
+            until: Optional[datetime] = None,
+            min_trans_failed: Optional[int] = None,
+            limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Query mirrored runs, newest first.
+
+        :param test_id: Only runs of this test
+        :param state: Only runs in this state
+        :param since: Only runs that started at or after this time
+        :param until: Only runs that started before this time
+        :param min_trans_failed: Only runs with at least this many failed transactions
+        :param limit: Maximum number of runs returned
+        :return: Row dicts with the mirror's column names
+        """
+        clauses, params = [], []
+        if test_id is not None:
+            clauses.append("test_id = ?")
+            params.append(test_id)
+        if state is not None:
+            clauses.append("state = ?")
+            params.append(state)
+        if since is not None:
+            clauses.append("start_time >= ?")
+            params.append(since.isoformat())
+        if until is not None:
+            clauses.append("start_time < ?")
+            params.append(until.isoformat())
+        if min_trans_failed is not None:
+            clauses.append("trans_failed >= ?")
+            params.append(min_trans_failed)
+
+        sql = "SELECT * FROM runs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY start_time DESC, run_id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [{k: row[k] for k in row.keys() if k != "raw"} for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
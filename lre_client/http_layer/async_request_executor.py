@@ -0,0 +1,147 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import aiohttp
+from lre_client.http_layer.rate_limiter import parse_retry_after
+from lre_client.utils.logger import get_logger
+from lre_client.api.exceptions import (
+    LREConnectionError,
+    LREAuthenticationError,
+    LREAPIError,
+)
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class AsyncLRERequestExecutor:
+    """Executes asyncio HTTP requests with bounded concurrency, retries and error translation."""
+
+    def __init__(self, session: aiohttp.ClientSession, settings, max_concurrency: int | None = None):
+        self.session = session
+        self.settings = settings
+        self.semaphore = asyncio.Semaphore(max_concurrency or settings.lre_max_concurrency)
+        self.logger = get_logger(__name__)
+
+    def _backoff(self, attempt: int, response: aiohttp.ClientResponse | None = None) -> float:
+        """Return the delay before the next attempt, honouring Retry-After like urllib3's Retry."""
+        if response is not None:
+            # Zero or past values fall through to the backoff rather than retrying hot
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after:
+                return retry_after
+        if attempt <= 1:
+            return 0.0
+        return self.settings.lre_retry_backoff * (2 ** (attempt - 1))
+
+    async def _send(self, method: str, url: str, **kwargs) -> aiohttp.ClientResponse:
+        """Send a request, retrying on connection errors and retryable statuses."""
+        max_retries = self.settings.lre_max_retries
+        attempt = 0
+
+        while True:
+            try:
+                response = await self.session.request(method, url, **kwargs)
+            except aiohttp.ClientConnectionError as e:
+                if attempt >= max_retries:
+                    raise LREConnectionError(f"Connection error: {e}")
+                attempt += 1
+                await asyncio.sleep(self._backoff(attempt))
+                continue
+
+            if response.status in RETRY_STATUSES and attempt < max_retries:
+                attempt += 1
+                delay = self._backoff(attempt, response)
+                response.release()
+                self.logger.debug("HTTP %s %s returned %s; retry %s in %.1fs",
+                                  method, url, response.status, attempt, delay)
+                await asyncio.sleep(delay)
+                continue
+
+            return response
+
+    async def _raise_for_status(self, response: aiohttp.ClientResponse) -> None:
+        if response.status < 400:
+            return
+
+        status = response.status
+        body = (await response.text()).strip() or response.reason
+        response.release()
+
+        if status in (401, 403):
+            raise LREAuthenticationError(f"Authentication failed: HTTP {status}")
+        raise LREAPIError(f"HTTP {status}: {body}")
+
+    def _prepare(self, headers, params, json, timeout) -> dict:
+        timeout = timeout or self.settings.lre_timeout
+        request_kwargs = {
+            "headers": headers,
+            "params": {k: str(v) for k, v in params.items()} if params else None,
+            "json": json,
+            "timeout": aiohttp.ClientTimeout(total=timeout),
+        }
+        return request_kwargs
+
+    async def execute(
+            self,
+            method: str,
+            url: str,
+            headers: dict | None = None,
+            params: dict | None = None,
+            json: dict | None = None,
+            timeout: float | None = None,
+            **kwargs,
+    ) -> aiohttp.ClientResponse:
+        """
+        Execute an HTTP request and read its body so it can be used after the connection is released.
+        """
+        request_kwargs = {**self._prepare(headers, params, json, timeout), **kwargs}
+
+        self.logger.debug(
+            "HTTP %s %s | params=%s | json=%s | timeout=%s",
+            method, url, params, json, timeout or self.settings.lre_timeout
+        )
+
+        async with self.semaphore:
+            try:
+                response = await self._send(method, url, **request_kwargs)
+                await self._raise_for_status(response)
+                await response.read()
+                return response
+            except asyncio.TimeoutError:
+                raise LREConnectionError(f"Timeout after {request_kwargs['timeout'].total}s")
+            except aiohttp.ClientError as e:
+                raise LREConnectionError(f"Connection error: {e}")
+
+    @asynccontextmanager
+    async def stream(
+            self,
+            method: str,
+            url: str,
+            headers: dict | None = None,
+            params: dict | None = None,
+            timeout: float | None = None,
+            **kwargs,
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        Execute a streamed HTTP request; the concurrency slot is held until the body is consumed.
+        """
+        request_kwargs = {**self._prepare(headers, params, None, timeout), **kwargs}
+        # Downloads may legitimately run longer than a single API call
+        request_kwargs["timeout"] = aiohttp.ClientTimeout(sock_read=request_kwargs["timeout"].total)
+
+        self.logger.debug("HTTP %s %s (stream) | params=%s", method, url, params)
+
+        async with self.semaphore:
+            try:
+                response = await self._send(method, url, **request_kwargs)
+                await self._raise_for_status(response)
+            except asyncio.TimeoutError:
+                raise LREConnectionError(f"Timeout after {request_kwargs['timeout'].sock_read}s")
+            except aiohttp.ClientError as e:
+                raise LREConnectionError(f"Connection error: {e}")
+
+            try:
+                yield response
+            finally:
+                response.release()
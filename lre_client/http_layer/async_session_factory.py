@@ -0,0 +1,44 @@
+from typing import Optional
+
+import aiohttp
+from lre_client.config import get_settings, create_ssl_context
+
+
+class AsyncHttpSessionFactory:
+    """Factory for creating configured asyncio HTTP sessions."""
+
+    @staticmethod
+    def create(settings=None, max_concurrency: Optional[int] = None) -> aiohttp.ClientSession:
+        """
+        Create an aiohttp session with a shared connection pool.
+
+        Must be called from within a running event loop.
+
+        :param max_concurrency: Connection pool size; defaults to settings.lre_max_concurrency
+        """
+        settings = settings or get_settings()
+        max_concurrency = max_concurrency or settings.lre_max_concurrency
+
+        # SSL configuration (False disables verification, None uses aiohttp defaults)
+        ssl_context = create_ssl_context(settings)
+        ssl = ssl_context if ssl_context is not None else False
+
+        connector = aiohttp.TCPConnector(
+            limit=max_concurrency,
+            limit_per_host=max_concurrency,
+            ssl=ssl,
+        )
+
+        # LRE servers are frequently addressed by IP, which the default jar ignores
+        cookie_jar = aiohttp.CookieJar(unsafe=True)
+
+        return aiohttp.ClientSession(
+            connector=connector,
+            cookie_jar=cookie_jar,
+            timeout=aiohttp.ClientTimeout(total=settings.lre_timeout),
+            headers={
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+                "User-Agent": settings.lre_user_agent,
+            },
+        )
@@ -0,0 +1,41 @@
+import re
+from typing import List, Tuple
+from urllib.parse import urlsplit
+
+from lre_client.api import endpoints
+
+
+def template_pattern(template: str) -> re.Pattern:
+    """Compile an endpoint template such as '.../Runs/{run_id}/Results' into a path regex."""
+    parts = re.split(r"\{[^}]+\}", template.strip("/"))
+    body = "[^/]+".join(re.escape(p) for p in parts)
+    return re.compile(rf"/{body}/?$", re.IGNORECASE)
+
+
+def _known_templates() -> List[str]:
+    templates = [v for k, v in vars(endpoints).items() if k.isupper() and isinstance(v, str)]
+    # Item paths are not constants of their own
+    templates.append(endpoints.HOSTS_BASE + "/{host_id}")
+    return templates
+
+
+class EndpointTemplateMatcher:
+    """Maps request URLs back to the endpoint template constants they were built from."""
+
+    OTHER = "other"
+
+    def __init__(self):
+        # Longer templates first so '.../Results/{result_id}/data' wins over '.../Results'
+        self._patterns: List[Tuple[re.Pattern, str]] = [
+            (template_pattern(t), t) for t in sorted(set(_known_templates()), key=len, reverse=True)
+        ]
+        self._cache = {}
+
+    def match(self, url: str) -> str:
+        path = urlsplit(url).path
+        template = self._cache.get(path)
+        if template is None:
+            template = next((t for p, t in self._patterns if p.search(path)), self.OTHER)
+            if len(self._cache) < 10_000:
+                self._cache[path] = template
+        return template
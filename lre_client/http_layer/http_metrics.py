@@ -0,0 +1,68 @@
+import requests
+from lre_client.http_layer.endpoint_templates import EndpointTemplateMatcher
+from lre_client.utils.metrics import MetricsRegistry, get_metrics_registry
+
+REQUESTS_TOTAL = "lre_http_requests_total"
+REQUEST_DURATION = "lre_http_request_duration_seconds"
+TIME_TO_FIRST_BYTE = "lre_http_time_to_first_byte_seconds"
+REQUEST_BYTES = "lre_http_request_bytes_total"
+RESPONSE_BYTES = "lre_http_response_bytes_total"
+RETRIES_TOTAL = "lre_http_retries_total"
+CACHE_HITS = "lre_http_cache_hits_total"
+
+
+class HttpMetrics:
+    """Records per-endpoint-template HTTP metrics into a MetricsRegistry."""
+
+    def __init__(self, registry: MetricsRegistry | None = None):
+        self.registry = registry or get_metrics_registry()
+        self.matcher = EndpointTemplateMatcher()
+        self.registry.describe(REQUESTS_TOTAL, "HTTP requests by endpoint template, method and status")
+        self.registry.describe(REQUEST_DURATION, "Time from send to complete response (headers for streams)")
+        self.registry.describe(TIME_TO_FIRST_BYTE, "Time to response headers for streamed downloads")
+        self.registry.describe(REQUEST_BYTES, "Request body bytes sent")
+        self.registry.describe(RESPONSE_BYTES, "Response body bytes received")
+        self.registry.describe(RETRIES_TOTAL, "Retries made by the transport and the throttling back-off")
+        self.registry.describe(CACHE_HITS, "Requests answered from the response cache")
+
+    def labels(self, method: str, url: str) -> dict:
+        return {"endpoint": self.matcher.match(url), "method": method.upper()}
+
+    def record(self, labels: dict, status, duration: float, retries: int,
+               response: requests.Response | None = None, streamed: bool = False) -> None:
+        registry = self.registry
+        registry.inc(REQUESTS_TOTAL, {**labels, "status": status})
+        registry.observe(REQUEST_DURATION, duration, labels)
+        if retries:
+            registry.inc(RETRIES_TOTAL, labels, retries)
+        if response is None:
+            return
+
+        body = response.request.body if response.request is not None else None
+        if body:
+            registry.inc(REQUEST_BYTES, labels, len(body))
+
+        if streamed:
+            registry.observe(TIME_TO_FIRST_BYTE, response.elapsed.total_seconds(), labels)
+            self._count_streamed_bytes(response, labels)
+        elif response.content:
+            registry.inc(RESPONSE_BYTES, labels, len(response.content))
+
+    def record_cache_hit(self, labels: dict) -> None:
+        self.registry.inc(CACHE_HITS, labels)
+
+    def _count_streamed_bytes(self, response: requests.Response, labels: dict) -> None:
+        """Wrap iter_content so bytes are counted as the caller consumes the stream."""
+        iter_content = response.iter_content
+        registry = self.registry
+
+        def counting_iter_content(*args, **kwargs):
+            received = 0
+            try:
+                for chunk in iter_content(*args, **kwargs):
+                    received += len(chunk)
+                    yield chunk
+            finally:
+                registry.inc(RESPONSE_BYTES, labels, received)
+
+        response.iter_content = counting_iter_content
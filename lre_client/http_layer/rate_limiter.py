@@ -0,0 +1,179 @@
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from lre_client.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+# Statuses the LRE server uses to signal overload
+THROTTLE_STATUSES = frozenset({429, 503})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds from now."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """Thread-safe token bucket; a rate of 0 disables rate limiting."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for ``seconds`` (global Retry-After)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = self._paused_until - now
+                if wait <= 0:
+                    if self.rate <= 0:
+                        return
+                    self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD limit on in-flight requests.
+
+    The limit grows by one after a full window of healthy responses (additive
+    increase) and is halved on throttling responses, timeouts or latency spikes
+    (multiplicative decrease), at most once per window so a burst of 429s counts
+    as one congestion event.
+    """
+
+    def __init__(self, initial: int, minimum: int = 1, maximum: Optional[int] = None,
+                 latency_spike_factor: float = 3.0, warmup_samples: int = 20):
+        self.maximum = maximum or initial
+        self.minimum = max(1, min(minimum, self.maximum))
+        self.limit = max(self.minimum, min(initial, self.maximum))
+        self.latency_spike_factor = latency_spike_factor
+        self.warmup_samples = warmup_samples
+
+        self._in_flight = 0
+        self._successes = 0
+        self._samples = 0
+        self._latency_ewma: Optional[float] = None
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self._in_flight >= self.limit:
+                self._cond.wait()
+            self._in_flight += 1
+
+    def release(self) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify()
+
+    def _decrease(self, reason: str) -> None:
+        now = time.monotonic()
+        window = self._latency_ewma or 1.0
+        if now - self._last_decrease < window:
+            return
+        self._last_decrease = now
+        self._successes = 0
+        old = self.limit
+        self.limit = max(self.minimum, self.limit // 2)
+        log.info("Concurrency limit %d -> %d (%s)", old, self.limit, reason)
+
+    def on_congestion(self, reason: str) -> None:
+        with self._cond:
+            self._decrease(reason)
+
+    def on_success(self, latency: float) -> None:
+        with self._cond:
+            self._samples += 1
+            if self._latency_ewma is None:
+                self._latency_ewma = latency
+            elif (self._samples > self.warmup_samples
+                  and latency > self._latency_ewma * self.latency_spike_factor):
+                # Spikes are not folded into the baseline so a slow server keeps shrinking the limit
+                self._decrease(f"latency {latency:.2f}s vs baseline {self._latency_ewma:.2f}s")
+                return
+            else:
+                self._latency_ewma = 0.9 * self._latency_ewma + 0.1 * latency
+
+            self._successes += 1
+            if self._successes >= self.limit and self.limit < self.maximum:
+                self._successes = 0
+                self.limit += 1
+                self._cond.notify()
+                log.debug("Concurrency limit raised to %d", self.limit)
+
+
+class AdaptiveRateLimiter:
+    """Shared token bucket plus AIMD concurrency limiter for one HTTP session."""
+
+    def __init__(self, settings):
+        self.bucket = TokenBucket(settings.lre_rate_limit, settings.lre_rate_burst)
+        self.concurrency = AdaptiveConcurrencyLimiter(
+            initial=settings.lre_max_concurrency,
+            minimum=settings.lre_min_concurrency,
+            maximum=settings.lre_max_concurrency,
+        )
+        self.adaptive = settings.lre_adaptive_concurrency
+
+    def acquire(self) -> None:
+        """Block until a rate token and a concurrency slot are available."""
+        self.bucket.acquire()
+        self.concurrency.acquire()
+
+    def release(self, status: Optional[int], latency: float, retry_after: Optional[str] = None) -> None:
+        """
+        Release the slot and feed the outcome back into the limits.
+
+        :param status: HTTP status, or None if the request failed without a response
+        :param latency: Seconds from send to response headers
+        :param retry_after: Raw Retry-After header, if any
+        """
+        try:
+            if status in THROTTLE_STATUSES:
+                delay = parse_retry_after(retry_after)
+                if delay:
+                    log.warning("Server asked to retry after %.1fs; pausing all requests", delay)
+                    self.bucket.pause(delay)
+                if self.adaptive:
+                    self.concurrency.on_congestion(f"HTTP {status}")
+            elif status is None:
+                if self.adaptive:
+                    self.concurrency.on_congestion("no response")
+            elif status < 500 and self.adaptive:
+                self.concurrency.on_success(latency)
+        finally:
+            self.concurrency.release()
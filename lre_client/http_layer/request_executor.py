@@ -1,3 +1,6 @@
+import logging
+import time
+
 from lre_client.utils.logger import get_logger
 import requests
 from lre_client.api.exceptions import (
@@ -5,18 +8,72 @@ from lre_client.api.exceptions import (
     LREAuthenticationError,
     LREAPIError,
 )
+from lre_client.http_layer.rate_limiter import (
+    AdaptiveRateLimiter,
+    THROTTLE_STATUSES,
+    parse_retry_after,
+)
+from lre_client.http_layer.response_cache import ResponseCache
+from lre_client.http_layer.http_metrics import HttpMetrics
 
 
+class LRERequestExecutor:
+    """
+    Executes HTTP requests with consistent error handling and defaults.
 
+    All requests pass through a shared AdaptiveRateLimiter, so every thread using
+    this executor backs off together when the server throttles (429/503) instead
+    of retrying independently.
 
-class LRERequestExecutor:
-    """Executes HTTP requests with consistent error handling and defaults."""
+    When ``settings.lre_cache_enabled`` is set, GET responses of cacheable
+    endpoints are served from a ResponseCache and revalidated with conditional
+    requests once their TTL expires.
+
+    Every request is recorded in the process metrics registry per endpoint
+    template (latency, status, retries, bytes, time-to-first-byte for streams)
+    unless ``settings.lre_metrics_enabled`` is off.
+    """
 
     def __init__(self, session: requests.Session, settings):
         self.session = session
         self.settings = settings
+        self.limiter = AdaptiveRateLimiter(settings)
+        self.cache = ResponseCache(
+            ttls=settings.lre_cache_ttls,
+            cache_dir=settings.lre_cache_dir,
+        ) if settings.lre_cache_enabled else None
+        self.metrics = HttpMetrics() if settings.lre_metrics_enabled else None
         self.logger = get_logger(__name__)
 
+    def _send(self, method: str, url: str, **kwargs) -> tuple[requests.Response, int]:
+        """
+        Send through the limiter, retrying throttled responses after a shared back-off.
+
+        Returns the response and the number of throttling retries made.
+        """
+        attempt = 0
+        while True:
+            self.limiter.acquire()
+            status, retry_after = None, None
+            start = time.monotonic()
+            try:
+                response = self.session.request(method=method, url=url, **kwargs)
+                status = response.status_code
+                retry_after = response.headers.get("Retry-After")
+            finally:
+                self.limiter.release(status, time.monotonic() - start, retry_after)
+
+            if status not in THROTTLE_STATUSES or attempt >= self.settings.lre_max_retries:
+                return response, attempt
+
+            attempt += 1
+            response.close()
+            self.logger.debug("HTTP %s %s throttled (%s); retry %s", method, url, status, attempt)
+            if not parse_retry_after(retry_after):
+                # A positive Retry-After already pauses the shared bucket; a missing, zero or
+                # past one would retry hot, so use exponential backoff instead
+                time.sleep(self.settings.lre_retry_backoff * (2 ** (attempt - 1)))
+
     def execute(
             self,
             method: str,
@@ -31,25 +88,60 @@ class LRERequestExecutor:
         Execute an HTTP request with retries, timeouts, and error translation.
         """
 
-        headers = {**self.session.headers, **(headers or {})}
+        # The session merges its own default headers; only per-request headers are passed
         timeout = timeout or self.settings.lre_timeout
 
-        self.logger.debug(
-            "HTTP %s %s | headers=%s | params=%s | json=%s | timeout=%s",
-            method, url, headers, params, json, timeout
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "HTTP %s %s | headers=%s | params=%s | json=%s | timeout=%s",
+                method, url, {**self.session.headers, **(headers or {})}, params, json, timeout
+            )
+
+        labels = self.metrics.labels(method, url) if self.metrics is not None else None
+        streamed = bool(kwargs.get("stream"))
 
+        cache_key, ttl, entry = None, None, None
+        if self.cache is not None and method.upper() == "GET" and not streamed:
+            ttl = self.cache.ttl_for(url)
+        if ttl is not None:
+            cache_key = self.cache.make_key(url, params)
+            entry = self.cache.get(cache_key)
+            if entry is not None and entry.is_fresh:
+                self.logger.debug("HTTP %s %s served from cache", method, url)
+                if labels is not None:
+                    self.metrics.record_cache_hit(labels)
+                return entry.to_response()
+            if entry is not None:
+                headers = {**(headers or {}), **entry.validators}
+
+        response, status, retries = None, "error", 0
+        start = time.perf_counter()
         try:
-            response = self.session.request(
-                method=method,
-                url=url,
+            response, retries = self._send(
+                method,
+                url,
                 headers=headers,
                 params=params,
                 json=json,
                 timeout=timeout,
                 **kwargs,
             )
+            status = response.status_code
+            raw_retries = getattr(response.raw, "retries", None)
+            retries += len(getattr(raw_retries, "history", ()) or ())
+
+            if self.cache is not None and method.upper() != "GET" and self.cache.affects(url):
+                self.cache.invalidate(url)
+
+            if entry is not None and response.status_code == 304:
+                self.logger.debug("HTTP %s %s not modified; refreshed cache entry", method, url)
+                self.cache.touch(cache_key, entry)
+                return entry.to_response()
+
             response.raise_for_status()
+
+            if cache_key is not None and response.status_code == 200:
+                self.cache.store(cache_key, response, ttl)
             return response
 
         except requests.exceptions.ConnectionError as e:
@@ -60,9 +152,14 @@ class LRERequestExecutor:
 
         except requests.exceptions.HTTPError as e:
             resp = e.response
-            status = resp.status_code if resp else "unknown"
-            body = resp.text.strip() if resp and resp.text else str(e)
+            # Response.__bool__ is False for 4xx/5xx, so compare against None explicitly
+            status = resp.status_code if resp is not None else "unknown"
+            body = resp.text.strip() if resp is not None and resp.text else str(e)
 
             if status in (401, 403):
                 raise LREAuthenticationError(f"Authentication failed: HTTP {status}")
             raise LREAPIError(f"HTTP {status}: {body}")
+
+        finally:
+            if labels is not None:
+                self.metrics.record(labels, status, time.perf_counter() - start, retries, response, streamed)
@@ -0,0 +1,213 @@
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Optional, Dict, List, Tuple
+from urllib.parse import urlsplit, urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from lre_client.api.endpoints import RUN_RESULTS_LIST, HOSTS_BASE
+from lre_client.http_layer.endpoint_templates import template_pattern
+from lre_client.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+# Default TTL (seconds) per cacheable GET endpoint template; override with settings.lre_cache_ttls
+DEFAULT_CACHE_TTLS: Dict[str, int] = {
+    RUN_RESULTS_LIST: 300,
+    HOSTS_BASE: 300,
+    HOSTS_BASE + "/{host_id}": 300,
+}
+
+# Response headers kept with a cached body
+_KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+@dataclass
+class CacheEntry:
+    """A cached GET response and its freshness metadata."""
+    url: str
+    status_code: int
+    headers: Dict[str, str]
+    body: bytes = field(repr=False)
+    stored_at: float
+    ttl: float
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() - self.stored_at < self.ttl
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers derived from the stored ETag/Last-Modified."""
+        conditional = {}
+        if self.headers.get("ETag"):
+            conditional["If-None-Match"] = self.headers["ETag"]
+        if self.headers.get("Last-Modified"):
+            conditional["If-Modified-Since"] = self.headers["Last-Modified"]
+        return conditional
+
+    def to_response(self) -> requests.Response:
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.body
+        response.url = self.url
+        response.encoding = "utf-8"
+        response.from_cache = True
+        return response
+
+
+class ResponseCache:
+    """
+    In-memory LRU plus optional on-disk store for GET responses.
+
+    Only URLs matching a configured endpoint template are cached, each with its
+    own TTL. Stale entries that carry validators are revalidated with a
+    conditional request, and any non-GET request to a cacheable resource (or an
+    item of a cacheable collection) drops the cached entries for that resource,
+    its sub-resources and its parent collection.
+
+    The on-disk entries are indexed in memory (file -> URL) when the cache is
+    opened, so invalidation never rescans the cache directory.
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, int]] = None, cache_dir: Optional[Path] = None,
+                 max_entries: int = 1024):
+        merged = {**DEFAULT_CACHE_TTLS, **(ttls or {})}
+        self._rules: List[Tuple[re.Pattern, int]] = [
+            (template_pattern(template), ttl) for template, ttl in merged.items() if ttl > 0
+        ]
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_index: Dict[Path, str] = self._scan_disk() if self.cache_dir else {}
+
+    def _scan_disk(self) -> Dict[Path, str]:
+        """URL of every persisted entry, keyed by its file path without suffix."""
+        index = {}
+        for meta_file in self.cache_dir.glob("*.json"):
+            try:
+                index[meta_file.with_suffix("")] = json.loads(meta_file.read_text(encoding="utf-8"))["url"]
+            except (OSError, ValueError, KeyError):
+                continue
+        return index
+
+    @staticmethod
+    def make_key(url: str, params: Optional[dict] = None) -> str:
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted(params.items()), doseq=True)}"
+
+    def ttl_for(self, url: str) -> Optional[int]:
+        """TTL for a URL, or None if it is not cacheable."""
+        path = urlsplit(url).path
+        for pattern, ttl in self._rules:
+            if pattern.search(path):
+                return ttl
+        return None
+
+    def affects(self, url: str) -> bool:
+        """True if a write to ``url`` can make cached responses stale."""
+        path = urlsplit(url).path.rstrip("/")
+        parent = path.rsplit("/", 1)[0]
+        return any(pattern.search(path) or pattern.search(parent) for pattern, _ in self._rules)
+
+    def _disk_path(self, key: str) -> Path:
+        return self.cache_dir / hashlib.sha256(key.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+
+        if not self.cache_dir:
+            return None
+        base = self._disk_path(key)
+        try:
+            meta = json.loads(base.with_suffix(".json").read_text(encoding="utf-8"))
+            entry = CacheEntry(body=base.with_suffix(".body").read_bytes(), **meta)
+        except (OSError, ValueError, TypeError):
+            return None
+        self._remember(key, entry)
+        return entry
+
+    def _remember(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def store(self, key: str, response: requests.Response, ttl: int) -> CacheEntry:
+        headers = {h: response.headers[h] for h in _KEPT_HEADERS if h in response.headers}
+        entry = CacheEntry(
+            url=response.url or key,
+            status_code=response.status_code,
+            headers=headers,
+            body=response.content,
+            stored_at=time.time(),
+            ttl=ttl,
+        )
+        self._remember(key, entry)
+        self._persist(key, entry)
+        return entry
+
+    def touch(self, key: str, entry: CacheEntry) -> None:
+        """Mark an entry fresh again after a 304 Not Modified."""
+        entry.stored_at = time.time()
+        self._persist(key, entry)
+
+    def _persist(self, key: str, entry: CacheEntry) -> None:
+        if not self.cache_dir:
+            return
+        base = self._disk_path(key)
+        meta = {k: v for k, v in asdict(entry).items() if k != "body"}
+        try:
+            base.with_suffix(".body").write_bytes(entry.body)
+            base.with_suffix(".json").write_text(json.dumps(meta), encoding="utf-8")
+            with self._lock:
+                self._disk_index[base] = entry.url
+        except OSError as e:
+            log.warning(f"Could not persist cache entry for {key}: {e}")
+
+    def invalidate(self, url: str) -> None:
+        """Drop entries for the resource at ``url``, its sub-resources and its parent collection."""
+        target = urlsplit(url).path.rstrip("/").lower()
+
+        def related(key: str) -> bool:
+            path = urlsplit(key).path.rstrip("/").lower()
+            return path == target or path.startswith(target + "/") or target.startswith(path + "/")
+
+        with self._lock:
+            stale = [key for key in self._entries if related(key)]
+            for key in stale:
+                del self._entries[key]
+            stale_files = [base for base, key in self._disk_index.items() if related(key)]
+            for base in stale_files:
+                del self._disk_index[base]
+
+        for base in stale_files:
+            base.with_suffix(".json").unlink(missing_ok=True)
+            base.with_suffix(".body").unlink(missing_ok=True)
+
+        if stale:
+            log.debug("Invalidated %d cached responses for %s", len(stale), target)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._disk_index.clear()
+        if self.cache_dir:
+            for path in self.cache_dir.glob("*"):
+                path.unlink(missing_ok=True)
@@ -12,16 +12,23 @@ class HttpSessionFactory:
         settings = settings or get_settings()
         session = requests.Session()
 
-        # Retry configuration
+        # Retry configuration; 429/503 and Retry-After are left to LRERequestExecutor
+        # so the shared rate limiter sees throttling and backs off for all workers
         retry = Retry(
             total=settings.lre_max_retries,
-            status_forcelist=[429, 500, 502, 503, 504],
+            status_forcelist=[500, 502, 504],
             allowed_methods=["HEAD", "GET", "OPTIONS", "POST", "PUT", "DELETE"],
             backoff_factor=settings.lre_retry_backoff,
-            respect_retry_after_header=True
+            respect_retry_after_header=False
         )
 
-        adapter = HTTPAdapter(max_retries=retry, pool_connections=10, pool_maxsize=10)
+        # One pooled connection per allowed in-flight request
+        adapter = HTTPAdapter(
+            max_retries=retry,
+            pool_connections=10,
+            pool_maxsize=settings.lre_max_concurrency,
+            pool_block=True,
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
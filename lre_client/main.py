@@ -1,29 +1,31 @@
-from lre_client.api.exceptions import LREAuthenticationError, LREAPIError
-from lre_client.utils.common_utils import RunSummary, TablePrinter
+import argparse
+import sys
+
+from lre_client.api.exceptions import LREAuthenticationError, LREAPIError, LREConnectionError
+from lre_client.utils.common_utils import RunSummary, TablePrinter, parse_run_ids
 from lre_client.utils.logger import get_logger
 from lre_client.api.client import LREClient
 from lre_client.data.results_store import ResultsStore
+from lre_client.config import get_settings
+from lre_client.utils.metrics import get_metrics_registry
 
 log = get_logger(__name__)
 
 
-def process_results(store: ResultsStore) -> None:
+def process_results(store: ResultsStore, run_id: int) -> None:
     """Example function that uses the stored results."""
     log.info("Processing stored results...")
+    log.info(store.get_run_status_summary(run_id))
 
-    if store.run_status:
-        status = store.run_status.get('State')
-        log.info(f"Current run status: {status}")
-
-
-def main():
-    results_store = ResultsStore()
 
+def run_single():
+    """Process settings.lre_run_id: print the run summary, then download and extract its result."""
     try:
         with LREClient() as lre:
+            results_store = ResultsStore(settings=lre.settings)
 
             run_status = lre.runs.get_run_status()
-            results_store.update_run_status(run_status)
+            entry = results_store.update_run_status(run_status, lre.settings.lre_run_id)
 
             summary = RunSummary(run_status, settings=lre.settings)
             rows = summary.build_rows()
@@ -33,7 +35,7 @@ def main():
 
             lre.results.download_analyzed_result(extract=True)
 
-            process_results(results_store)
+            process_results(results_store, entry.run_id)
 
     except LREAuthenticationError as auth_err:
         log.error("Authentication failed: %s", auth_err)
@@ -43,5 +45,94 @@ def main():
         log.error("Unexpected error: %s", e)
 
 
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="lre_client", description="Extract LoadRunner Enterprise run results.")
+    parser.add_argument("--runs", type=parse_run_ids,
+                        help="Batch mode: run IDs/ranges to process, e.g. '101-110,115'")
+    parser.add_argument("--download-workers", type=int, default=4, help="Concurrent downloads in batch mode")
+    parser.add_argument("--extract-workers", type=int, default=2, help="Concurrent zip extractions in batch mode")
+    parser.add_argument("--analytics-workers", type=int, default=2, help="Analytics processes in batch mode")
+    parser.add_argument("--serve", action="store_true",
+                        help="Run the local analytics HTTP service (lre_service_host/lre_service_port)")
+    return parser.parse_args(argv)
+
+
+def run_batch(args: argparse.Namespace) -> bool:
+    """Download, extract and analyze many runs through the staged pipeline; True if every run succeeded."""
+    # Imported here so status-only invocations do not pay for pandas/tdigest
+    from lre_client.pipeline.batch_extractor import BatchExtractionPipeline
+    from lre_client.data.trend_store import TrendStore
+    from lre_client.data.exporter import ResultsExporter
+
+    run_ids = args.runs
+    log.info(f"Batch mode: {len(run_ids)} runs")
+
+    with LREClient() as lre:
+        pipeline = BatchExtractionPipeline(
+            lre,
+            download_workers=args.download_workers,
+            extract_workers=args.extract_workers,
+            analytics_workers=args.analytics_workers,
+            store=ResultsStore(settings=lre.settings),
+            trend_store=TrendStore(settings=lre.settings),
+            exporter=ResultsExporter(settings=lre.settings) if lre.settings.lre_export_dir else None,
+        )
+        outcomes = pipeline.run(run_ids)
+
+    for outcome in outcomes:
+        if outcome.ok:
+            log.info(f"Run {outcome.run_id}: {len(outcome.analytics):,} transactions, "
+                     f"timings {', '.join(f'{k}={v:.1f}s' for k, v in outcome.timings.items())}")
+        else:
+            log.error(f"Run {outcome.run_id}: failed during {outcome.failed_stage}: {outcome.error}")
+    return all(outcome.ok for outcome in outcomes)
+
+
+def run_service() -> None:
+    """Serve run status, downloads and analytics over local HTTP until interrupted."""
+    from lre_client.service.server import AnalyticsService, create_server
+
+    with LREClient() as lre:
+        service = AnalyticsService(lre)
+        server = create_server(service)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            log.info("Analytics service stopping")
+        finally:
+            server.server_close()
+            service.close()
+
+
+def dump_metrics() -> None:
+    """Write the HTTP metrics collected during this process, if a metrics path is configured."""
+    metrics_path = get_settings().lre_metrics_path
+    if metrics_path:
+        path = get_metrics_registry().dump(metrics_path)
+        log.info(f"Metrics written to {path}")
+
+
+def main(argv=None) -> int:
+    """Run the CLI; returns the process exit code (non-zero when the LRE server could not be used)."""
+    args = parse_args(argv)
+    try:
+        if args.serve:
+            run_service()
+        elif args.runs:
+            return 0 if run_batch(args) else 1
+        else:
+            run_single()
+        return 0
+    except LREAuthenticationError as auth_err:
+        log.error("Authentication failed: %s", auth_err)
+    except LREConnectionError as conn_err:
+        log.error("Could not reach LRE server: %s", conn_err)
+    except LREAPIError as api_err:
+        log.error("API request error: %s", api_err)
+    finally:
+        dump_metrics()
+    return 1
+
+
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from typing import Any, Optional, List, Dict
+
+
+@dataclass
+class BulkItemResult:
+    """Outcome of one item in a bulk API operation."""
+    key: Any
+    result: Any = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def summarize_bulk(results: List[BulkItemResult]) -> Dict[str, Any]:
+    """Count successes/failures of a bulk operation and list the failed keys."""
+    failed = [r.key for r in results if not r.ok]
+    return {
+        'total': len(results),
+        'succeeded': len(results) - len(failed),
+        'failed': len(failed),
+        'failed_keys': failed,
+    }
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any
 
 
@@ -18,7 +18,7 @@ def normalize_result_type(value: str) -> str:
     return mapping.get(value, value)
 
 
-@dataclass
+@dataclass(slots=True)
 class RunResult:
     """Represents a single test result in a run."""
     id: int
@@ -63,48 +63,72 @@ class RunResult:
         return self.type == "LOG"
 
 
-@dataclass
+@dataclass(slots=True)
 class RunResultsCollection:
-    """Collection of results for a specific run."""
+    """
+    Collection of results for a specific run.
+
+    A type index and an ID map are built once at construction, so the per-type
+    properties and lookups do not re-scan ``results``. Each per-type list is
+    ordered newest first by result ID (LRE assigns increasing IDs), which is what
+    ``latest_*`` refers to. The collection is a snapshot: rebuild it rather than
+    mutating ``results``.
+    """
     run_id: int
     results: List[RunResult]
+    _by_type: Dict[str, List[RunResult]] = field(init=False, repr=False, compare=False)
+    _by_id: Dict[int, RunResult] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._by_type = {}
+        self._by_id = {}
+        for result in sorted(self.results, key=lambda r: r.id, reverse=True):
+            self._by_type.setdefault(result.type, []).append(result)
+            self._by_id.setdefault(result.id, result)
 
     @classmethod
     def from_api_response(cls, run_id: int, data: List[Dict[str, Any]]) -> 'RunResultsCollection':
         results = [RunResult.from_api_response(item) for item in data]
         return cls(run_id=run_id, results=results)
 
+    def _of_type(self, result_type: str) -> List[RunResult]:
+        return list(self._by_type.get(result_type, ()))
+
+    def _latest(self, result_type: str) -> Optional[RunResult]:
+        results = self._by_type.get(result_type)
+        return results[0] if results else None
+
     @property
     def analyzed(self) -> List[RunResult]:
-        return [r for r in self.results if r.is_analyzed]
+        return self._of_type("ANALYZED")
 
     @property
     def raw(self) -> List[RunResult]:
-        return [r for r in self.results if r.is_raw]
+        return self._of_type("RAW")
 
     @property
     def html(self) -> List[RunResult]:
-        return [r for r in self.results if r.is_html]
+        return self._of_type("HTML")
 
     @property
     def rich(self) -> List[RunResult]:
-        return [r for r in self.results if r.is_rich]
+        return self._of_type("RICH")
 
     @property
     def error(self) -> List[RunResult]:
-        return [r for r in self.results if r.is_error]
+        return self._of_type("ERROR")
 
     @property
     def log(self) -> List[RunResult]:
-        return [r for r in self.results if r.is_log]
+        return self._of_type("LOG")
 
     @property
     def latest_analyzed(self) -> Optional[RunResult]:
-        return self.analyzed[0] if self.analyzed else None
+        return self._latest("ANALYZED")
 
     @property
     def latest_html(self) -> Optional[RunResult]:
-        return self.html[0] if self.html else None
+        return self._latest("HTML")
 
     def get_analyzed_result_id(self) -> Optional[int]:
         result = self.latest_analyzed
@@ -115,23 +139,25 @@ class RunResultsCollection:
         return result.id if result else None
 
     def get_result_by_id(self, result_id: int) -> Optional[RunResult]:
-        return next((r for r in self.results if r.id == result_id), None)
+        return self._by_id.get(result_id)
 
     def get_results_by_type(self, result_type: str) -> List[RunResult]:
-        type_normalized = normalize_result_type(result_type)
-        return [r for r in self.results if r.type == type_normalized]
+        return self._of_type(normalize_result_type(result_type))
+
+    def count(self, result_type: str) -> int:
+        return len(self._by_type.get(normalize_result_type(result_type), ()))
 
     def summary(self) -> Dict[str, Any]:
         return {
             'run_id': self.run_id,
             'total_results': len(self.results),
-            'analyzed_count': len(self.analyzed),
-            'raw_count': len(self.raw),
-            'html_count': len(self.html),
-            'rich_count': len(self.rich),
-            'error_count': len(self.error),
-            'log_count': len(self.log),
+            'analyzed_count': self.count("ANALYZED"),
+            'raw_count': self.count("RAW"),
+            'html_count': self.count("HTML"),
+            'rich_count': self.count("RICH"),
+            'error_count': self.count("ERROR"),
+            'log_count': self.count("LOG"),
             'analyzed_result_id': self.get_analyzed_result_id(),
             'html_result_id': self.get_html_result_id(),
-            'available_types': list({r.type for r in self.results})
+            'available_types': list(self._by_type)
         }
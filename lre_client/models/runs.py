@@ -0,0 +1,24 @@
+"""
+Run state names reported by the LRE runs endpoint.
+"""
+
+FINISHED_STATE = "Finished"
+
+# States after which LRE no longer updates a run
+FINAL_RUN_STATES = frozenset({
+    FINISHED_STATE,
+    "Aborted",
+    "Canceled",
+    "Run Failure",
+    "Failed Collating Results",
+    "Failed Creating Analysis Data",
+})
+
+# Post-test states: the run is winding down and will soon be final
+FINISHING_RUN_STATES = frozenset({
+    "Stopping",
+    "Before Collating Results",
+    "Collating Results",
+    "Before Creating Analysis Data",
+    "Creating Analysis Data",
+})
@@ -0,0 +1,278 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Any, Dict, Iterable, List
+
+import pandas as pd
+from lre_client.analytics.analytics_manager import LoadTestAnalyticsManager
+from lre_client.analytics.errors import ErrorReport
+from lre_client.analytics.monitors import MonitorReport
+from lre_client.analytics.profiling import ProfilingReport
+from lre_client.api.exceptions import LREAPIError
+from lre_client.api.results_api import extract_result_data, find_analysis_db
+from lre_client.data.results_store import ResultsStore
+from lre_client.data.trend_store import TrendStore
+from lre_client.data.exporter import ResultsExporter
+from lre_client.models.runs import FINISHED_STATE
+from lre_client.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+
+def analyze_run(db_path: str, chunksize: int, trace_memory: bool = False, cprofile: bool = False,
+             histogram_edges: Optional[List[float]] = None, apdex_threshold: float = 1.0,
+             error_top_k: int = 200, error_bucket_seconds: float = 60.0,
+             monitor_bucket_seconds: float = 60.0) -> Dict[str, Any]:
+    """
+    Analytics stage entry point shared by the batch pipeline and the analytics
+    service; module-level so it can run in a worker process.
+
+    :return: RunOutcome fields set by the analytics stage
+    """
+    manager = LoadTestAnalyticsManager(db_path, chunksize=chunksize, trace_memory=trace_memory, cprofile=cprofile,
+                                       histogram_edges=histogram_edges, apdex_threshold=apdex_threshold,
+                                       error_top_k=error_top_k, error_bucket_seconds=error_bucket_seconds,
+                                       monitor_bucket_seconds=monitor_bucket_seconds)
+    df, report = manager.run_with_report()
+    return {
+        "analytics": df,
+        "profile": report,
+        "sketches": manager.last_sketches,
+        "rollups": manager.last_rollups,
+        "histograms": manager.last_histograms,
+        "apdex": manager.last_apdex,
+        "errors": manager.last_errors,
+        "monitors": manager.last_monitors,
+    }
+
+
+def analyze_run_args(db_path: Path, settings, chunksize: Optional[int] = None) -> tuple:
+    """Positional analyze_run() arguments for ``db_path`` taken from LRE settings."""
+    return (str(db_path), chunksize or settings.lre_analytics_chunksize,
+            settings.lre_profile_memory, settings.lre_profile_cprofile,
+            settings.lre_histogram_edges, settings.lre_apdex_threshold,
+            settings.lre_error_top_k, settings.lre_error_bucket_seconds,
+            settings.lre_monitor_bucket_seconds)
+
+
+def record_analyzed_run(run_id: int, run_status: Optional[dict], parts: Dict[str, Any],
+                        store: Optional[ResultsStore] = None, trend_store: Optional[TrendStore] = None) -> None:
+    """
+    Post-analysis step shared by the batch pipeline, the analytics service and
+    the run watcher: save the analytics frame to the ResultsStore and append
+    the run to its test's trend history. Failures are logged, not raised.
+
+    :param run_status: Run dict from the runs endpoint; without a TestId the trend append is skipped
+    :param parts: analyze_run() output
+    """
+    if store is not None:
+        try:
+            store.update_analytics(run_id, parts["analytics"])
+        except Exception as e:
+            log.warning(f"Could not store analytics for run {run_id}: {e}")
+    if trend_store is not None and run_status and run_status.get("TestId") is not None:
+        try:
+            trend_store.append_run({**run_status, "Id": run_id}, parts["analytics"], parts.get("sketches"))
+        except Exception as e:
+            log.warning(f"Could not add run {run_id} to the trend store: {e}")
+
+
+@dataclass
+class RunOutcome:
+    """Result of pushing one run through the batch pipeline."""
+    run_id: int
+    run_status: Optional[dict] = None
+    zip_path: Optional[Path] = None
+    extract_dir: Optional[Path] = None
+    analytics: Optional[pd.DataFrame] = field(default=None, repr=False)
+    profile: Optional[ProfilingReport] = field(default=None, repr=False)
+    sketches: Optional[pd.DataFrame] = field(default=None, repr=False)
+    rollups: Optional[pd.DataFrame] = field(default=None, repr=False)
+    histograms: Optional[pd.DataFrame] = field(default=None, repr=False)
+    apdex: Optional[pd.DataFrame] = field(default=None, repr=False)
+    errors: Optional[ErrorReport] = field(default=None, repr=False)
+    monitors: Optional[MonitorReport] = field(default=None, repr=False)
+    failed_stage: Optional[str] = None
+    error: Optional[Exception] = None
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class BatchExtractionPipeline:
+    """
+    Staged download -> extract -> analyze pipeline over many runs.
+
+    Each stage has its own bounded pool: threads for downloads and zip
+    extraction, processes for analytics. Stages are chained with future
+    callbacks, so run N+1 downloads while run N is being analyzed. A semaphore
+    bounds how many runs are in flight at once so finished downloads cannot
+    pile up ahead of a slower analytics stage. All downloads share the
+    client's authenticated session; a failure only affects its own run.
+
+    With a ResultsStore, runs whose analytics are already stored are loaded
+    from it instead of being processed again, and every new status, results
+    listing and analytics frame is saved to it, so an interrupted batch resumes
+    where it stopped. With a TrendStore, each newly analyzed run is appended
+    to its test's history. With a ResultsExporter, each newly analyzed run's
+    result frames are written to ``<export dir>/<run_id>/``.
+    """
+
+    def __init__(
+            self,
+            client,
+            download_workers: int = 4,
+            extract_workers: int = 2,
+            analytics_workers: int = 2,
+            max_in_flight: Optional[int] = None,
+            output_dir: Optional[Path] = None,
+            chunksize: Optional[int] = None,
+            store: Optional[ResultsStore] = None,
+            trend_store: Optional[TrendStore] = None,
+            exporter: Optional[ResultsExporter] = None,
+    ):
+        self.client = client
+        self.download_workers = download_workers
+        self.extract_workers = extract_workers
+        self.analytics_workers = analytics_workers
+        self.max_in_flight = max_in_flight or (download_workers + extract_workers + analytics_workers) * 2
+        self.output_dir = Path(output_dir) if output_dir else Path.cwd() / "lre_results"
+        self.chunksize = chunksize or client.settings.lre_analytics_chunksize
+        self.store = store
+        self.trend_store = trend_store
+        self.exporter = exporter
+
+    def run(self, run_ids: Iterable[int]) -> List[RunOutcome]:
+        """Process all runs and return one RunOutcome per run, in input order."""
+        run_ids = list(dict.fromkeys(int(r) for r in run_ids))
+        outcomes = {run_id: RunOutcome(run_id) for run_id in run_ids}
+        if not run_ids:
+            return []
+
+        pending = [run_id for run_id in run_ids if not self._load_stored(outcomes[run_id])]
+        if not pending:
+            return [outcomes[run_id] for run_id in run_ids]
+
+        statuses = self.client.runs.get_runs_status(pending)
+        if self.store is not None:
+            for run_id, run_status in statuses.items():
+                self.store.update_run_status(run_status, run_id)
+        settings = self.client.settings
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        slots = threading.BoundedSemaphore(self.max_in_flight)
+        remaining = len(pending)
+        all_done = threading.Event()
+        lock = threading.Lock()
+        started = time.perf_counter()
+
+        def finish(outcome: RunOutcome, stage: Optional[str] = None, error: Optional[Exception] = None):
+            nonlocal remaining
+            if error is not None:
+                outcome.failed_stage, outcome.error = stage, error
+                log.error(f"Run {outcome.run_id} failed during {stage}: {error}")
+            else:
+                log.info(f"Run {outcome.run_id} done ({len(outcome.analytics):,} transaction rows)")
+            slots.release()
+            with lock:
+                remaining -= 1
+                if remaining == 0:
+                    all_done.set()
+
+        def timed(outcome: RunOutcome, stage: str, fn, *args):
+            start = time.perf_counter()
+            try:
+                return fn(*args)
+            finally:
+                outcome.timings[stage] = time.perf_counter() - start
+
+        with ThreadPoolExecutor(self.download_workers, thread_name_prefix="lre-download") as download_pool, \
+                ThreadPoolExecutor(self.extract_workers, thread_name_prefix="lre-extract") as extract_pool, \
+                ProcessPoolExecutor(self.analytics_workers) as analytics_pool:
+
+            def on_analyzed(outcome: RunOutcome, submitted: float, future: Future):
+                outcome.timings["analytics"] = time.perf_counter() - submitted
+                try:
+                    parts = future.result()
+                    for name, value in parts.items():
+                        setattr(outcome, name, value)
+                except Exception as e:
+                    return finish(outcome, "analytics", e)
+                self._save_analytics(outcome, parts)
+                finish(outcome)
+
+            def on_extracted(outcome: RunOutcome, future: Future):
+                try:
+                    outcome.extract_dir = future.result()
+                    db_path = find_analysis_db(outcome.extract_dir)
+                    submitted = time.perf_counter()
+                    analytics_pool.submit(
+                        analyze_run, *analyze_run_args(db_path, settings, self.chunksize),
+                    ).add_done_callback(lambda f: on_analyzed(outcome, submitted, f))
+                except Exception as e:
+                    finish(outcome, "extract", e)
+
+            def on_downloaded(outcome: RunOutcome, future: Future):
+                try:
+                    outcome.zip_path = future.result()
+                    extract_pool.submit(timed, outcome, "extract", extract_result_data, outcome.zip_path) \
+                        .add_done_callback(lambda f: on_extracted(outcome, f))
+                except Exception as e:
+                    finish(outcome, "download", e)
+
+            for run_id in pending:
+                outcome = outcomes[run_id]
+                outcome.run_status = statuses.get(run_id)
+                slots.acquire()
+
+                state = (outcome.run_status or {}).get("State")
+                if state != FINISHED_STATE:
+                    finish(outcome, "status", LREAPIError(f"Run {run_id} is not finished (state: {state})"))
+                    continue
+
+                download_pool.submit(timed, outcome, "download", self._download, run_id) \
+                    .add_done_callback(lambda f, o=outcome: on_downloaded(o, f))
+
+            all_done.wait()
+
+        succeeded = sum(o.ok for o in outcomes.values())
+        log.info(f"Batch finished in {time.perf_counter() - started:.1f}s: "
+                 f"{succeeded} succeeded, {len(run_ids) - succeeded} failed")
+        return [outcomes[run_id] for run_id in run_ids]
+
+    def _load_stored(self, outcome: RunOutcome) -> bool:
+        """Fill an outcome from the store if its analytics were computed before."""
+        if self.store is None or not self.store.has_analytics(outcome.run_id):
+            return False
+        analytics = self.store.get_analytics(outcome.run_id)
+        if analytics is None:
+            return False
+        outcome.analytics = analytics
+        outcome.run_status = self.store.get(outcome.run_id).run_status
+        log.info(f"Run {outcome.run_id} loaded from results store ({len(analytics):,} transaction rows)")
+        return True
+
+    def _save_analytics(self, outcome: RunOutcome, parts: Dict[str, Any]) -> None:
+        record_analyzed_run(outcome.run_id, outcome.run_status, parts, self.store, self.trend_store)
+        if self.exporter is not None:
+            try:
+                self.exporter.export_run(outcome, subdir=str(outcome.run_id))
+                if self.client.settings.lre_export_samples and outcome.extract_dir:
+                    self.exporter.export_samples(find_analysis_db(outcome.extract_dir), subdir=str(outcome.run_id),
+                                                 chunksize=self.chunksize)
+            except Exception as e:
+                log.warning(f"Could not export results of run {outcome.run_id}: {e}")
+
+    def _download(self, run_id: int) -> Path:
+        collection = self.client.results.get_run_results(run_id)
+        if self.store is not None:
+            self.store.update_run_results(collection)
+        result = collection.latest_analyzed
+        if not result:
+            raise LREAPIError(f"No analyzed result found for run {run_id}")
+        return self.client.results.download_result_data(
+            result.id, run_id, self.output_dir / f"Results_{run_id}.zip")
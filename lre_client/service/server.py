@@ -0,0 +1,429 @@
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import fields, is_dataclass
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional, Dict, Any, Callable, List, Tuple
+from urllib.parse import urlsplit, parse_qs
+
+import pandas as pd
+
+from lre_client.analytics.run_comparison import RunAnalytics, RunComparator
+from lre_client.analytics.sla import SLAEngine, SLARule
+from lre_client.api.exceptions import LREAPIError, LREError
+from lre_client.api.results_api import extract_result_data, find_analysis_db
+from lre_client.data.results_store import ResultsStore
+from lre_client.data.trend_store import TrendStore
+from lre_client.db.database_manager import SQLiteDBManager
+from lre_client.db.query_store import QueryStore
+from lre_client.pipeline.batch_extractor import analyze_run, analyze_run_args, record_analyzed_run
+from lre_client.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+# Parts of an analyzed run that can be requested, see pipeline.batch_extractor.analyze_run
+RESULT_PARTS = ("analytics", "profile", "sketches", "rollups", "histograms", "apdex", "errors", "monitors")
+
+
+class _LRU:
+    """Small thread-safe LRU mapping."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._items: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            value = self._items.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._items.move_to_end(key)
+            return value
+
+    def put(self, key, value) -> None:
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+    def pop(self, key):
+        with self._lock:
+            return self._items.pop(key, None)
+
+    def clear(self) -> list:
+        """Remove every entry and return the values."""
+        with self._lock:
+            values = list(self._items.values())
+            self._items.clear()
+        return values
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._items), "max_entries": self.max_entries, "hits": self.hits, "misses": self.misses}
+
+
+class AnalyticsService:
+    """
+    Long-lived home of the extractor's operations for the HTTP daemon.
+
+    Keeps what a CLI invocation would rebuild every time: the authenticated
+    LREClient, an LRU of analyzed runs (every part analyze_run() produces, plus
+    the SQL transaction summary) and a process pool for analytics. Downloads,
+    analyses and summaries are single-flight per run, so concurrent requests
+    for the same run share one computation. Analytics frames are also written
+    to the ResultsStore, so they survive a restart, and each analyzed run is
+    appended to the TrendStore history.
+    """
+
+    def __init__(self, client, settings=None, output_dir: Optional[Path] = None,
+                 store: Optional[ResultsStore] = None, analytics_workers: Optional[int] = None,
+                 cache_runs: Optional[int] = None, trend_store: Optional[TrendStore] = None):
+        """
+        :param client: Authenticated LREClient
+        :param settings: LRE settings; defaults to client.settings
+        :param output_dir: Download directory; defaults to ./lre_results
+        :param store: Persistent results store; defaults to one built from settings
+        :param analytics_workers: Analytics processes; defaults to settings.lre_service_workers
+        :param cache_runs: Analyzed runs kept in memory; defaults to settings.lre_service_cache_runs
+        :param trend_store: Cross-run trend history; defaults to one built from settings
+        """
+        self.client = client
+        self.settings = settings or client.settings
+        self.output_dir = Path(output_dir) if output_dir else Path.cwd() / "lre_results"
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.store = store or ResultsStore(settings=self.settings)
+        self.trend_store = trend_store or TrendStore(settings=self.settings)
+        self.started = time.time()
+
+        workers = analytics_workers or self.settings.lre_service_workers
+        self._analytics_pool = ProcessPoolExecutor(workers)
+        # Analyses wait on downloads, so the two never share a pool
+        self._analysis_threads = ThreadPoolExecutor(max(4, workers * 2), thread_name_prefix="lre-service-analyze")
+        self._download_threads = ThreadPoolExecutor(4, thread_name_prefix="lre-service-download")
+        self._results = _LRU(cache_runs or self.settings.lre_service_cache_runs)
+        self._summaries = _LRU(cache_runs or self.settings.lre_service_cache_runs)
+        self._db_paths: Dict[int, Path] = {}
+        self._inflight: Dict[Tuple[str, int], Future] = {}
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        self._analysis_threads.shutdown(wait=False, cancel_futures=True)
+        self._download_threads.shutdown(wait=False, cancel_futures=True)
+        self._analytics_pool.shutdown(wait=False, cancel_futures=True)
+        self._results.clear()
+        self._summaries.clear()
+
+    # -------------------- SINGLE FLIGHT --------------------
+
+    def _single_flight(self, kind: str, run_id: int, fn: Callable[[], Any], pool: ThreadPoolExecutor) -> Future:
+        key = (kind, run_id)
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future
+            future = pool.submit(fn)
+            self._inflight[key] = future
+        # Outside the lock: a finished future runs the callback inline, and _forget takes the lock
+        future.add_done_callback(lambda _: self._forget(key))
+        return future
+
+    def _forget(self, key: Tuple[str, int]) -> None:
+        with self._lock:
+            self._inflight.pop(key, None)
+
+    # -------------------- OPERATIONS --------------------
+
+    def run_status(self, run_id: int) -> Optional[dict]:
+        status = self.client.runs.get_run_status(run_id)
+        if status:
+            self.store.update_run_status(status, run_id)
+        return status
+
+    def _download(self, run_id: int) -> Path:
+        extract_dir = self.output_dir / f"Results_{run_id}"
+        if extract_dir.is_dir():
+            try:
+                return find_analysis_db(extract_dir)
+            except LREAPIError:
+                pass
+        collection = self.client.results.get_run_results(run_id)
+        self.store.update_run_results(collection)
+        result = collection.latest_analyzed
+        if not result:
+            raise LREAPIError(f"No analyzed result found for run {run_id}")
+        zip_path = self.client.results.download_result_data(
+            result.id, run_id, self.output_dir / f"Results_{run_id}.zip")
+        return find_analysis_db(extract_result_data(zip_path, extract_dir))
+
+    def download(self, run_id: int) -> Future:
+        """Future of the run's analysis DB path, downloading and extracting it if needed."""
+        path = self._db_paths.get(run_id)
+        if path is not None and path.exists():
+            done: Future = Future()
+            done.set_result(path)
+            return done
+
+        def task() -> Path:
+            path = self._download(run_id)
+            self._db_paths[run_id] = path
+            return path
+
+        return self._single_flight("download", run_id, task, self._download_threads)
+
+    def analyze(self, run_id: int) -> Future:
+        """Future of the run's analyzed parts, from memory or computed in the analytics pool."""
+        cached = self._results.get(run_id)
+        if cached is not None:
+            done: Future = Future()
+            done.set_result(cached)
+            return done
+
+        def task() -> Dict[str, Any]:
+            db_path = self.download(run_id).result()
+            started = time.perf_counter()
+            parts = self._analytics_pool.submit(analyze_run, *analyze_run_args(db_path, self.settings)).result()
+            log.info(f"Run {run_id} analyzed in {time.perf_counter() - started:.1f}s")
+            self._results.put(run_id, parts)
+            try:
+                run = self._known_run(run_id)
+            except LREError as e:
+                log.warning(f"Could not fetch the status of run {run_id}: {e}")
+                run = None
+            record_analyzed_run(run_id, run, parts, self.store, self.trend_store)
+            return parts
+
+        return self._single_flight("analyze", run_id, task, self._analysis_threads)
+
+    def evict(self, run_id: int) -> bool:
+        """Drop a run's analyzed parts and summary from memory; True if either was cached."""
+        had_results = self._results.pop(run_id) is not None
+        had_summary = self._summaries.pop(run_id) is not None
+        return had_results or had_summary
+
+    def result_part(self, run_id: int, part: str, timeout: Optional[float] = None) -> Any:
+        """
+        One part of an analyzed run. Analytics alone are served from the
+        ResultsStore when the run is not in memory, without recomputing.
+        """
+        if part not in RESULT_PARTS:
+            raise KeyError(f"Unknown result part '{part}', expected one of {list(RESULT_PARTS)}")
+        cached = self._results.get(run_id)
+        if cached is None and part == "analytics":
+            stored = self.store.get_analytics(run_id)
+            if stored is not None:
+                return stored
+        parts = cached if cached is not None else self.analyze(run_id).result(timeout)
+        return parts.get(part)
+
+    def summary(self, run_id: int, timeout: Optional[float] = None) -> pd.DataFrame:
+        """Transaction summary straight from the analysis DB, without percentiles; computed once per run."""
+        cached = self._summaries.get(run_id)
+        if cached is not None:
+            return cached
+
+        def task() -> pd.DataFrame:
+            db_path = self.download(run_id).result()
+            with SQLiteDBManager(str(db_path)) as db:
+                frame = db.query_single(QueryStore.SQL_TRANSACTION_SUMMARY)
+            self._summaries.put(run_id, frame)
+            return frame
+
+        return self._single_flight("summary", run_id, task, self._analysis_threads).result(timeout)
+
+    def _known_run(self, run_id: int) -> Optional[dict]:
+        """Run status from the results store, else from LRE."""
+        entry = self.store.get(run_id)
+        return (entry.run_status if entry and entry.run_status else None) or self.run_status(run_id)
+
+    def _run_analytics(self, run_id: int) -> RunAnalytics:
+        run = self._known_run(run_id) or {"Id": run_id}
+        parts = self._results.get(run_id) or self.analyze(run_id).result()
+        return RunAnalytics.from_run({**run, "Id": run_id}, parts["analytics"], parts.get("sketches"))
+
+    def compare(self, run_id: int, baseline_ids: List[int], **options) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """RunComparator result and summary of a run against baseline runs (analyzed in parallel)."""
+        if not baseline_ids:
+            raise ValueError("At least one baseline run is required")
+        for other in [run_id] + baseline_ids:
+            self.analyze(other)
+        comparator = RunComparator(**options)
+        comparison = comparator.compare(self._run_analytics(run_id), [self._run_analytics(b) for b in baseline_ids])
+        return comparison, comparator.summary(comparison)
+
+    def sla(self, run_id: int, rules: List[Dict[str, Any]]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """SLAEngine evaluation and per-rule summary of ad-hoc rules."""
+        engine = SLAEngine([SLARule(**rule) for rule in rules])
+        result = engine.evaluate(self._run_analytics(run_id))
+        return result, engine.summary(result)
+
+    def health(self) -> Dict[str, Any]:
+        with self._lock:
+            inflight = [f"{kind}:{run_id}" for kind, run_id in self._inflight]
+        return {
+            "status": "ok",
+            "uptime_seconds": round(time.time() - self.started, 1),
+            "results_cache": self._results.stats(),
+            "summary_cache": self._summaries.stats(),
+            "in_flight": inflight,
+        }
+
+
+# -------------------- HTTP --------------------
+
+def _jsonable(value: Any) -> Any:
+    """JSON-ready form of service results (frames become lists of records)."""
+    if isinstance(value, pd.DataFrame):
+        return json.loads(value.to_json(orient="records", date_format="iso"))
+    if isinstance(value, dict):
+        return {str(k): _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    if hasattr(value, "to_dict") and callable(value.to_dict):
+        return value.to_dict()
+    if is_dataclass(value):
+        return {f.name: _jsonable(getattr(value, f.name)) for f in fields(value)}
+    if isinstance(value, Path):
+        return str(value)
+    return value
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Routes requests to the AnalyticsService attached to the server."""
+
+    server_version = "LREAnalyticsService/1.0"
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; without this each response waits on a delayed ACK
+    disable_nagle_algorithm = True
+
+    ROUTES = [
+        ("GET", re.compile(r"^/health$"), "_health"),
+        ("GET", re.compile(r"^/runs/(\d+)/status$"), "_status"),
+        ("POST", re.compile(r"^/runs/(\d+)/download$"), "_download"),
+        ("GET", re.compile(r"^/runs/(\d+)/summary$"), "_summary"),
+        ("GET", re.compile(r"^/runs/(\d+)/compare$"), "_compare"),
+        ("POST", re.compile(r"^/runs/(\d+)/sla$"), "_sla"),
+        ("POST", re.compile(r"^/runs/(\d+)/evict$"), "_evict"),
+        ("GET", re.compile(r"^/runs/(\d+)/(\w+)$"), "_part"),
+    ]
+
+    @property
+    def service(self) -> AnalyticsService:
+        return self.server.service
+
+    def log_message(self, format, *args):
+        log.debug("%s - %s", self.address_string(), format % args)
+
+    def _send(self, status: int, payload: Any) -> None:
+        body = json.dumps(_jsonable(payload), separators=(",", ":"), default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _body(self) -> Any:
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}") if length else {}
+
+    def _dispatch(self, method: str) -> None:
+        url = urlsplit(self.path)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        started = time.perf_counter()
+        for route_method, pattern, handler in self.ROUTES:
+            match = pattern.match(url.path)
+            if route_method == method and match:
+                try:
+                    status, payload = getattr(self, handler)(*match.groups(), query=query)
+                except KeyError as e:
+                    status, payload = HTTPStatus.NOT_FOUND, {"error": str(e).strip("'\"")}
+                except (ValueError, TypeError) as e:
+                    status, payload = HTTPStatus.BAD_REQUEST, {"error": str(e)}
+                except TimeoutError:
+                    status, payload = HTTPStatus.ACCEPTED, {"status": "pending"}
+                except LREError as e:
+                    status, payload = HTTPStatus.BAD_GATEWAY, {"error": str(e)}
+                except Exception as e:
+                    log.exception(f"{method} {url.path} failed")
+                    status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(e)}
+                self._send(status, payload)
+                log.debug("%s %s -> %d in %.1f ms", method, url.path, status, (time.perf_counter() - started) * 1000)
+                return
+        self._send(HTTPStatus.NOT_FOUND, {"error": f"No route for {method} {url.path}"})
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    @staticmethod
+    def _timeout(query: Dict[str, str]) -> Optional[float]:
+        """``?wait=false`` answers 202 immediately while the work continues; ``?timeout=`` bounds the wait."""
+        if query.get("wait", "true").lower() in ("0", "false", "no"):
+            return 0.0
+        return float(query["timeout"]) if "timeout" in query else None
+
+    # -------------------- HANDLERS --------------------
+
+    def _health(self, query):
+        return HTTPStatus.OK, self.service.health()
+
+    def _status(self, run_id, query):
+        status = self.service.run_status(int(run_id))
+        if not status:
+            raise KeyError(f"Run {run_id} not found")
+        return HTTPStatus.OK, status
+
+    def _download(self, run_id, query):
+        path = self.service.download(int(run_id)).result(self._timeout(query))
+        return HTTPStatus.OK, {"run_id": int(run_id), "db_path": path}
+
+    def _summary(self, run_id, query):
+        return HTTPStatus.OK, self.service.summary(int(run_id), self._timeout(query))
+
+    def _part(self, run_id, part, query):
+        return HTTPStatus.OK, self.service.result_part(int(run_id), part, self._timeout(query))
+
+    def _compare(self, run_id, query):
+        baselines = [int(b) for b in query.get("baselines", "").split(",") if b.strip()]
+        options = {k: float(query[k]) for k in ("threshold", "error_rate_threshold", "ks_threshold") if k in query}
+        comparison, summary = self.service.compare(int(run_id), baselines, **options)
+        if query.get("regressions_only", "false").lower() in ("1", "true", "yes"):
+            comparison = comparison[comparison["regression"]]
+        return HTTPStatus.OK, {"summary": summary, "comparison": comparison}
+
+    def _sla(self, run_id, query):
+        body = self._body()
+        rules = body.get("rules") if isinstance(body, dict) else body
+        if not rules:
+            raise ValueError("Request body needs a 'rules' list")
+        result, summary = self.service.sla(int(run_id), rules)
+        return HTTPStatus.OK, {"summary": summary, "checks": result}
+
+    def _evict(self, run_id, query):
+        return HTTPStatus.OK, {"run_id": int(run_id), "evicted": self.service.evict(int(run_id))}
+
+
+def create_server(service: AnalyticsService, host: Optional[str] = None,
+                  port: Optional[int] = None) -> ThreadingHTTPServer:
+    """HTTP server for ``service``; call serve_forever() on it (each request gets its own thread)."""
+    host = host or service.settings.lre_service_host
+    port = port if port is not None else service.settings.lre_service_port
+    server = ThreadingHTTPServer((host, port), _Handler)
+    server.daemon_threads = True
+    server.service = service
+    log.info(f"Analytics service listening on http://{server.server_address[0]}:{server.server_address[1]}")
+    return server
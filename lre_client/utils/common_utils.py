@@ -1,3 +1,4 @@
+import argparse
 from datetime import datetime
 
 
@@ -30,6 +31,31 @@ def compute_duration(start: str, end: str) -> str:
     return f"{hrs:02d}:{mins:02d}:{secs:02d}"
 
 
+def parse_run_ids(spec: str) -> list:
+    """
+    Parse '101-105,110' → [101, 102, 103, 104, 105, 110].
+
+    Usable as an argparse ``type``: malformed specs raise ArgumentTypeError.
+    """
+    run_ids = []
+    for part in (p.strip() for p in spec.split(",")):
+        if not part:
+            continue
+        try:
+            if "-" in part:
+                first, last = (int(x) for x in part.split("-", 1))
+                if first > last:
+                    raise ValueError
+                run_ids.extend(range(first, last + 1))
+            else:
+                run_ids.append(int(part))
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid run ID or range '{part}' (expected e.g. '101-110,115')")
+    if not run_ids:
+        raise argparse.ArgumentTypeError("no run IDs given")
+    return run_ids
+
+
 def chunk_list(items, chunk_size):
     """Split a list into chunks of given size."""
     for i in range(0, len(items), chunk_size):
@@ -1,24 +1,128 @@
+import atexit
 import os
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
+from typing import Optional
 
+LOG_FORMAT = '%(asctime)s  |  %(name)-45s:%(lineno)-4d  |  %(levelname)-8s  |  %(message)s'
 
-def get_logger(name: str):
+# Package logger that owns the handler; module loggers below it propagate to it
+ROOT_LOGGER_NAME = "lre_client"
+
+_queue_handler: Optional[logging.Handler] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+_setup_lock = threading.Lock()
+_setup_args: tuple = ()
+# Loggers outside the package that get_logger() attached the handler to
+_external_loggers: set = set()
+
+
+class _ThreadQueueHandler(logging.handlers.QueueHandler):
     """
-    Returns a centralized logger.
+    QueueHandler for an in-process listener.
+
+    The stock ``prepare()`` formats the message on the calling thread so records
+    can be pickled; the listener here is a thread, so the record is queued as is
+    and ``%`` interpolation, formatting and I/O all happen on the listener thread.
+    Arguments are therefore rendered when the record is written, not when logged.
     """
-    logger = logging.getLogger(name)
 
-    log_level = os.getenv("LOG_LEVEL", "INFO").upper()  # default INFO
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _log_level() -> int:
+    return getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO)
+
+
+def configure_logging(level: Optional[int] = None, use_queue: bool = True, stream=None) -> logging.Handler:
+    """
+    Set up the process-wide log handler once.
+
+    With ``use_queue`` (default) callers only enqueue records; a QueueListener
+    thread formats them and writes to ``stream`` (stdout by default). Calling
+    again replaces the previous setup, which is mainly useful for benchmarks.
+
+    :param level: Log level; defaults to the LOG_LEVEL environment variable (INFO)
+    :param use_queue: Write through a background QueueListener instead of synchronously
+    :param stream: Output stream, stdout by default
+    :return: The handler attached to the package logger
+    """
+    global _queue_handler, _listener, _setup_args
+
+    with _setup_lock:
+        previous = _queue_handler
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+        level = _log_level() if level is None else level
+        output = logging.StreamHandler(stream or sys.stdout)
+        output.setFormatter(logging.Formatter(LOG_FORMAT))
 
-    if not logger.handlers:
-        logger.setLevel(getattr(logging, log_level))
+        if use_queue:
+            handler = _ThreadQueueHandler(queue.SimpleQueue())
+            _listener = logging.handlers.QueueListener(handler.queue, output, respect_handler_level=False)
+            _listener.start()
+        else:
+            handler = output
 
-        ch = logging.StreamHandler(sys.stdout)
-        ch.setLevel(getattr(logging, log_level))
+        root = logging.getLogger(ROOT_LOGGER_NAME)
+        for logger in [root] + [logging.getLogger(name) for name in _external_loggers]:
+            if previous is not None:
+                logger.removeHandler(previous)
+            logger.addHandler(handler)
+        root.setLevel(level)
 
-        formatter = logging.Formatter('%(asctime)s  |  %(name)-45s:%(lineno)-4d  |  %(levelname)-8s  |  %(message)s')
-        ch.setFormatter(formatter)
-        logger.addHandler(ch)
+        _queue_handler = handler
+        _setup_args = (level, use_queue, stream)
+        return handler
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    with _setup_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+
+def _restart_after_fork() -> None:
+    """
+    The listener thread does not survive fork(), and multiprocessing workers exit
+    through os._exit() without running atexit, so forked children write synchronously.
+    """
+    global _setup_lock, _listener
+    _setup_lock = threading.Lock()
+    _listener = None
+    level, _, stream = _setup_args or (None, True, None)
+    configure_logging(level, use_queue=False, stream=stream)
+
+
+atexit.register(shutdown_logging)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_after_fork)
+
+
+def get_logger(name: str):
+    """
+    Returns a centralized logger.
+
+    Loggers under ``lre_client`` share the package handler set up by
+    configure_logging(); any other name gets that handler attached directly.
+    """
+    if _queue_handler is None:
+        configure_logging()
+
+    logger = logging.getLogger(name)
+    if name != ROOT_LOGGER_NAME and not name.startswith(ROOT_LOGGER_NAME + "."):
+        if name not in _external_loggers:
+            logger.setLevel(_log_level())
+            logger.addHandler(_queue_handler)
+            _external_loggers.add(name)
 
     return logger
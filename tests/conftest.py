@@ -0,0 +1,124 @@
+import random
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from benchmarks.fake_lre_server import FakeLREConfig, FakeLREServer
+from lre_client.api.client import LREClient
+from lre_client.config import BaseLRESettings
+
+
+@pytest.fixture
+def fake_lre():
+    """Factory starting a FakeLREServer per config; every server is stopped after the test."""
+    servers = []
+
+    def start(**config) -> FakeLREServer:
+        config.setdefault("payload_bytes", 256 * 1024)
+        server = FakeLREServer(FakeLREConfig(**config)).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.stop()
+
+
+@pytest.fixture
+def lre_settings():
+    """Factory for settings pointing at a fake server, ignoring the project's .env file."""
+
+    def build(server: FakeLREServer, **overrides) -> BaseLRESettings:
+        values = dict(
+            _env_file=None,
+            lre_server=server.url,
+            lre_client_id=server.config.client_id,
+            lre_client_secret=server.config.client_secret,
+            lre_domain="DEFAULT",
+            lre_project="tests",
+            lre_retry_backoff=0.1,
+            lre_cache_enabled=False,
+            lre_metrics_enabled=False,
+        )
+        values.update(overrides)
+        return BaseLRESettings(**values)
+
+    return build
+
+
+@pytest.fixture
+def lre_client(lre_settings):
+    """Factory for LREClients logged in to a fake server; all are closed after the test."""
+    clients = []
+
+    def connect(server: FakeLREServer, **settings) -> LREClient:
+        client = LREClient(lre_settings(server, **settings)).__enter__()
+        clients.append(client)
+        return client
+
+    yield connect
+    for client in clients:
+        client.__exit__(None, None, None)
+
+
+def build_analysis_db(path: Path, rows: int = 2000, errors: bool = True, monitors: bool = True,
+                      seed: int = 1) -> Path:
+    """Write a small LRE analysis DB with the tables the analytics read."""
+    rng = random.Random(seed)
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+    CREATE TABLE Script("Script ID" INTEGER, "Script Name" TEXT);
+    CREATE TABLE Event_map("Event ID" INTEGER, "Event Name" TEXT, "Event Type" TEXT);
+    CREATE TABLE TransactionEndStatus(Status1 INTEGER, "Transaction End Status" TEXT);
+    CREATE TABLE VuserGroup("Group ID" INTEGER, "Group Name" TEXT);
+    CREATE TABLE Host("Host ID" INTEGER, "Host Name" TEXT);
+    CREATE TABLE Event_meter("Event ID" INTEGER, "Event Name" TEXT, "Script ID" INTEGER, "Group ID" INTEGER,
+                             Status1 INTEGER, Value REAL, "Think Time" REAL, Acount INTEGER, "End Time" REAL,
+                             "Host ID" INTEGER, "Vuser ID" INTEGER);
+    """)
+    transactions = [f"T{i:02d}" for i in range(5)]
+    conn.executemany("INSERT INTO Script VALUES (?, ?)", [(1, "s1"), (2, "s2")])
+    conn.executemany("INSERT INTO Event_map VALUES (?, ?, ?)",
+                     [(i, name, "Transaction") for i, name in enumerate(transactions)])
+    conn.executemany("INSERT INTO TransactionEndStatus VALUES (?, ?)", [(0, "Pass"), (1, "Fail")])
+    conn.executemany("INSERT INTO VuserGroup VALUES (?, ?)", [(1, "GroupA"), (2, "GroupB")])
+    conn.executemany("INSERT INTO Host VALUES (?, ?)", [(1, "lg01"), (2, "lg02")])
+    conn.executemany("INSERT INTO Event_meter VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", [
+        (t, transactions[t], g, g, int(rng.random() < 0.05), rng.lognormvariate(0, 0.5) * (t + 1), 0.0,
+         rng.randint(1, 3), k * 0.5, g, rng.randrange(20))
+        for k, t, g in ((k, rng.randrange(5), rng.choice((1, 2))) for k in range(rows))
+    ])
+    if errors:
+        conn.executescript("""
+        CREATE TABLE ErrorMessage("Error Message ID" INTEGER, "Error Message" TEXT);
+        CREATE TABLE Error_meter("Error Code" INTEGER, "Error Message ID" INTEGER, "Group ID" INTEGER,
+                                 "Host ID" INTEGER, "Vuser ID" INTEGER, "End Time" REAL);
+        """)
+        conn.executemany("INSERT INTO ErrorMessage VALUES (?, ?)", [
+            (k, f"Action.c(12): Error -26612: HTTP Status-Code=500 for \"https://app/api/order?id={k}\"")
+            for k in range(50)
+        ])
+        conn.executemany("INSERT INTO Error_meter VALUES (?, ?, ?, ?, ?, ?)",
+                         [(-26612, k, 1 + k % 2, 1 + k % 2, k, k * 10.0) for k in range(50)])
+    if monitors:
+        conn.execute("CREATE TABLE Monitor_meter(\"Event ID\" INTEGER, \"Host ID\" INTEGER, "
+                     "\"End Time\" REAL, Value REAL)")
+        conn.executemany("INSERT INTO Event_map VALUES (?, ?, ?)",
+                         [(100 + m, f"metric_{m}", "Windows Resources") for m in range(3)])
+        conn.executemany("INSERT INTO Monitor_meter VALUES (?, ?, ?, ?)",
+                         [(100 + m, h, t * 5.0, float(m * 10 + h + t % 4))
+                          for m in range(3) for h in (1, 2) for t in range(60)])
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def analysis_db(tmp_path):
+    """Factory for synthetic analysis DBs in the test's temporary directory."""
+
+    def build(name: str = "analysis.db", **options) -> Path:
+        return build_analysis_db(tmp_path / name, **options)
+
+    return build
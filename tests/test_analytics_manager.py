@@ -0,0 +1,59 @@
+import sqlite3
+
+from lre_client.analytics.analytics_manager import LoadTestAnalyticsManager
+
+
+def test_run_builds_core_and_optional_analytics(analysis_db):
+    manager = LoadTestAnalyticsManager(str(analysis_db()))
+
+    df = manager.run()
+
+    assert len(df) == 10
+    assert df["Transaction_Count"].sum() == manager.last_rollups.query("Level == 'overall'")["Transaction_Count"].sum()
+    assert manager.last_errors.total_errors == 50
+
+
+def test_error_tables_with_unexpected_schema_are_skipped(analysis_db):
+    path = analysis_db()
+    with sqlite3.connect(path) as conn:
+        conn.execute('ALTER TABLE Error_meter RENAME COLUMN "Error Code" TO "Code"')
+
+    manager = LoadTestAnalyticsManager(str(path))
+    df = manager.run()
+
+    assert len(df) == 10
+    assert manager.last_errors is None
+
+
+def test_failing_error_stage_does_not_fail_core_analytics(analysis_db, monkeypatch):
+    def broken(self):
+        raise ValueError("unexpected error rows")
+
+    monkeypatch.setattr("lre_client.analytics.errors.ErrorAnalyzer.run", broken)
+    manager = LoadTestAnalyticsManager(str(analysis_db()))
+
+    assert len(manager.run()) == 10
+    assert manager.last_errors is None
+
+
+def test_monitor_tables_with_unexpected_schema_are_skipped(analysis_db):
+    path = analysis_db()
+    with sqlite3.connect(path) as conn:
+        conn.execute('ALTER TABLE Monitor_meter DROP COLUMN "End Time"')
+
+    manager = LoadTestAnalyticsManager(str(path))
+
+    assert len(manager.run()) == 10
+    assert manager.last_monitors is None
+    assert manager.last_errors is not None
+
+
+def test_failing_monitor_stage_does_not_fail_core_analytics(analysis_db, monkeypatch):
+    def broken(self):
+        raise KeyError("Value")
+
+    monkeypatch.setattr("lre_client.analytics.monitors.MonitorAnalyzer.run", broken)
+    manager = LoadTestAnalyticsManager(str(analysis_db()))
+
+    assert len(manager.run()) == 10
+    assert manager.last_monitors is None
@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+from lre_client.api.async_client import AsyncLREClient
+from lre_client.api.exceptions import LREAPIError, LREAuthenticationError
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_concurrent_run_status(fake_lre, lre_settings):
+    server = fake_lre()
+
+    async def fetch():
+        async with AsyncLREClient(lre_settings(server), max_concurrency=4) as lre:
+            return await asyncio.gather(*(lre.runs.get_run_status(i) for i in range(1, 21)))
+
+    runs = run(fetch())
+
+    assert [r["Id"] for r in runs] == list(range(1, 21))
+    assert server.stats.logins == 1
+    assert server.stats.requests["logout"] == 1
+
+
+def test_invalid_credentials_fail_login(fake_lre, lre_settings):
+    server = fake_lre()
+
+    async def login():
+        async with AsyncLREClient(lre_settings(server, lre_client_secret="wrong")):
+            pass
+
+    with pytest.raises(LREAuthenticationError):
+        run(login())
+
+
+def test_throttled_requests_are_retried(fake_lre, lre_settings):
+    server = fake_lre(throttle_rate=0.2, unavailable_rate=0.1, seed=7)
+
+    async def fetch():
+        async with AsyncLREClient(lre_settings(server, lre_max_retries=8), max_concurrency=8) as lre:
+            return await asyncio.gather(*(lre.runs.get_run_status(i) for i in range(1, 41)))
+
+    runs = run(fetch())
+
+    assert [r["Id"] for r in runs] == list(range(1, 41))
+    assert server.stats.throttled > 0 and server.stats.unavailable > 0
+
+
+def test_download_analyzed_result(fake_lre, lre_settings, tmp_path):
+    server = fake_lre(payload_bytes=300_000)
+
+    async def download():
+        async with AsyncLREClient(lre_settings(server)) as lre:
+            collection = await lre.results.get_run_results(5)
+            path = await lre.results.download_analyzed_result(5, tmp_path / "r.zip")
+            return collection, path
+
+    collection, path = run(download())
+
+    assert len(collection.results) == 4
+    assert path.read_bytes() == server.payload.read_bytes()
+
+
+def test_unknown_result_is_an_api_error(fake_lre, lre_settings, tmp_path):
+    server = fake_lre()
+
+    async def download():
+        async with AsyncLREClient(lre_settings(server)) as lre:
+            await lre.results.download_result_data(999, 1, tmp_path / "missing.zip")
+
+    with pytest.raises(LREAPIError):
+        run(download())
+    assert not (tmp_path / "missing.zip").exists()
+
+
+def test_host_crud(fake_lre, lre_settings):
+    server = fake_lre(hosts=3)
+
+    async def crud():
+        async with AsyncLREClient(lre_settings(server)) as lre:
+            host = await lre.hosts.add_host("lg-new.example.com", "added by test")
+            fetched = await lre.hosts.get_host(host["id"])
+            listed = await lre.hosts.list_hosts()
+            deleted = await lre.hosts.delete_host(host["id"])
+            return fetched, listed, deleted, await lre.hosts.list_hosts()
+
+    fetched, listed, deleted, remaining = run(crud())
+
+    assert fetched["name"] == "lg-new.example.com"
+    assert len(listed) == 4
+    assert deleted is True
+    assert len(remaining) == 3
+
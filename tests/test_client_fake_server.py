@@ -0,0 +1,171 @@
+import time
+
+import pytest
+
+from benchmarks.fake_lre_server import SESSION_COOKIE
+from lre_client.api.auth import is_session_expired
+from lre_client.api.client import LREClient
+from lre_client.api.exceptions import LREAPIError, LREAuthenticationError
+
+
+# -------------------- AUTHENTICATION --------------------
+
+def test_login_and_run_status(fake_lre, lre_client):
+    server = fake_lre()
+    lre = lre_client(server)
+
+    run = lre.runs.get_run_status(3)
+
+    assert run["Id"] == 3
+    assert server.stats.logins == 1
+
+
+def test_invalid_credentials_fail_login(fake_lre, lre_settings):
+    server = fake_lre()
+    with pytest.raises(LREAuthenticationError):
+        with LREClient(lre_settings(server, lre_client_secret="wrong")):
+            pass
+
+
+def test_relogin_after_session_expiry(fake_lre, lre_client):
+    server = fake_lre(session_ttl=0.2)
+    lre = lre_client(server)
+    assert lre.runs.get_run_status(1)["Id"] == 1
+
+    time.sleep(0.3)
+
+    assert len(lre.results.get_run_results(1).results) == 4
+    assert server.stats.logins == 2
+    assert server.stats.statuses[401] == 1
+
+
+def test_permission_denied_is_not_session_expiry():
+    assert is_session_expired(LREAuthenticationError("Authentication failed: HTTP 401"))
+    assert not is_session_expired(LREAuthenticationError("Authentication failed: HTTP 403"))
+
+
+def test_logout_ends_session(fake_lre, lre_settings):
+    server = fake_lre()
+    with LREClient(lre_settings(server)) as lre:
+        lre.runs.get_run_status(1)
+        token = lre.session.cookies.get(SESSION_COOKIE)
+    assert server.stats.requests["logout"] == 1
+    assert server.session(token) is None
+
+
+# -------------------- THROTTLING --------------------
+
+def test_throttled_requests_are_retried(fake_lre, lre_client):
+    server = fake_lre(throttle_rate=0.2, unavailable_rate=0.1, seed=7)
+    lre = lre_client(server, lre_max_retries=8, lre_max_concurrency=8)
+
+    runs = lre.runs.get_runs_status(range(1, 41), batch_size=1)
+
+    assert sorted(runs) == list(range(1, 41))
+    assert server.stats.throttled > 0 and server.stats.unavailable > 0
+    # Every throttled response halves the shared in-flight limit
+    assert lre.executor.limiter.concurrency.limit < 8
+
+
+def test_throttling_beyond_retries_raises(fake_lre, lre_client):
+    server = fake_lre()
+    lre = lre_client(server, lre_max_retries=1)
+    server.config.throttle_rate = 1.0
+
+    with pytest.raises(LREAPIError, match="429"):
+        lre.runs.get_run_status(1)
+    assert server.stats.throttled == 2
+
+
+def test_retry_after_pauses_requests(fake_lre, lre_client):
+    server = fake_lre(retry_after=1)
+    lre = lre_client(server, lre_max_retries=1)
+    server.config.throttle_rate = 1.0
+
+    started = time.monotonic()
+    with pytest.raises(LREAPIError):
+        lre.runs.get_run_status(2)
+    # The retry waits for Retry-After rather than the 0.1s backoff
+    assert time.monotonic() - started >= 0.9
+
+
+def test_zero_retry_after_uses_backoff(fake_lre, lre_client):
+    server = fake_lre(retry_after=0)
+    lre = lre_client(server, lre_max_retries=3)
+    server.config.throttle_rate = 1.0
+
+    started = time.monotonic()
+    with pytest.raises(LREAPIError):
+        lre.runs.get_run_status(2)
+    # Retry-After: 0 must not retry hot: 0.1 + 0.2 + 0.4s of exponential backoff
+    assert time.monotonic() - started >= 0.6
+    assert server.stats.throttled == 4
+
+
+# -------------------- RESULTS --------------------
+
+def test_download_result_data(fake_lre, lre_client, tmp_path):
+    server = fake_lre(payload_bytes=300_000)
+    lre = lre_client(server)
+
+    collection = lre.results.get_run_results(5)
+    path = lre.results.download_result_data(collection.latest_analyzed.id, 5, tmp_path / "r.zip")
+
+    assert path.read_bytes() == server.payload.read_bytes()
+
+
+def test_range_download(fake_lre, lre_client):
+    server = fake_lre(payload_bytes=100_000)
+    lre = lre_client(server)
+    payload = server.payload.read_bytes()
+    url = lre.build_url(lre.results._build_result_download_url(5, 51))
+
+    part = lre.session.get(url, headers={"Range": "bytes=1000-1999"})
+    assert part.status_code == 206
+    assert part.headers["Content-Range"] == f"bytes 1000-1999/{len(payload)}"
+    assert part.content == payload[1000:2000]
+
+    tail = lre.session.get(url, headers={"Range": "bytes=-100"})
+    assert tail.status_code == 206 and tail.content == payload[-100:]
+
+    resumed = lre.session.get(url, headers={"Range": "bytes=5000-", "If-Range": part.headers["ETag"]})
+    assert resumed.content == payload[5000:]
+
+    beyond = lre.session.get(url, headers={"Range": f"bytes={len(payload)}-"})
+    assert beyond.status_code == 416
+    assert server.stats.range_requests == 4
+
+
+def test_unknown_result_is_an_api_error(fake_lre, lre_client, tmp_path):
+    lre = lre_client(fake_lre())
+    with pytest.raises(LREAPIError):
+        lre.results.download_result_data(999, 1, tmp_path / "missing.zip")
+    assert not (tmp_path / "missing.zip").exists()
+
+
+# -------------------- HOSTS --------------------
+
+def test_host_crud(fake_lre, lre_client):
+    server = fake_lre(hosts=3)
+    lre = lre_client(server)
+
+    host = lre.hosts.add_host("lg-new.example.com", "added by test")
+    assert lre.hosts.get_host(host["id"])["name"] == "lg-new.example.com"
+    assert len(lre.hosts.list_hosts()) == 4
+
+    assert lre.hosts.delete_host(host["id"]) is True
+    with pytest.raises(LREAPIError, match="404"):
+        lre.hosts.get_host(host["id"])
+    assert len(lre.hosts.list_hosts()) == 3
+
+
+def test_bulk_host_operations(fake_lre, lre_client):
+    lre = lre_client(fake_lre(hosts=0))
+
+    added = lre.hosts.add_hosts([f"lg{i}.example.com" for i in range(10)], max_workers=4)
+    assert all(r.ok for r in added)
+
+    deleted = lre.hosts.delete_hosts([r.result["id"] for r in added] + [999], max_workers=4)
+    assert [r.result for r in deleted[:10]] == [True] * 10
+    assert not deleted[10].ok
+    assert lre.hosts.list_hosts() == []
@@ -0,0 +1,45 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+import pytest
+
+from lre_client.data.exporter import TableWriter
+
+CHUNKS = [
+    pd.DataFrame({"Script_Name": ["Script0", "Script1"], "Count": [1, 2]}),
+    pd.DataFrame({"Script_Name": ["Script1", "Script2", None], "Count": [3, 4, 5]}),
+]
+
+
+def read_back(path, fmt):
+    return pq.read_table(path) if fmt == "parquet" else ipc.open_file(pa.memory_map(str(path))).read_all()
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+def test_round_trip_keeps_only_real_categories(tmp_path, fmt):
+    path = tmp_path / f"frame.{fmt}"
+    with TableWriter(path, fmt) as writer:
+        for chunk in CHUNKS:
+            writer.write(chunk)
+
+    table = read_back(path, fmt)
+
+    assert list(table.to_pandas()["Script_Name"].cat.categories) == ["Script0", "Script1", "Script2"]
+    assert table.column("Script_Name").to_pylist() == ["Script0", "Script1", "Script1", "Script2", None]
+    assert table.column("Count").to_pylist() == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+def test_all_null_first_chunk(tmp_path, fmt):
+    path = tmp_path / f"frame.{fmt}"
+    with TableWriter(path, fmt) as writer:
+        writer.write(pd.DataFrame({"Script_Name": [None, None], "Count": [1, 2]}))
+        writer.write(CHUNKS[0])
+
+    table = read_back(path, fmt)
+
+    assert table.column("Script_Name").to_pylist() == [None, None, "Script0", "Script1"]
+    # Only an IPC stream needs a placeholder for the otherwise empty first dictionary
+    expected = ["Script0", "Script1"] if fmt == "parquet" else ["", "Script0", "Script1"]
+    assert list(table.to_pandas()["Script_Name"].cat.categories) == expected
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from lre_client.analytics.histograms import (
+    DEFAULT_APDEX_THRESHOLD, DEFAULT_HISTOGRAM_EDGES, HistogramAccumulator, merge_histograms,
+)
+from lre_client.config.settings import BaseLRESettings
+
+
+def chunk(rows):
+    return pd.DataFrame(rows, columns=["Script_Name", "Transaction_Name", "Response_Times", "Counts"])
+
+
+def test_bucket_edges_are_upper_inclusive():
+    acc = HistogramAccumulator(edges=[1.0, 2.0], apdex_threshold=1.0)
+    acc.update(chunk([("s", "t", 0.5, 1), ("s", "t", 1.0, 2), ("s", "t", 1.0001, 1),
+                      ("s", "t", 2.0, 1), ("s", "t", 2.5, 3)]))
+
+    hist = acc.histogram_frame()
+
+    assert hist[["bucket", "bucket_lower", "bucket_upper", "count"]].values.tolist() == [
+        [0, 0.0, 1.0, 3],
+        [1, 1.0, 2.0, 2],
+        [2, 2.0, np.inf, 3],
+    ]
+
+
+def test_apdex_exact_values():
+    acc = HistogramAccumulator(edges=[0.5, 1.0, 4.0], apdex_threshold=1.0)
+    # Satisfied t <= 1 (weight 6), tolerating 1 < t <= 4 (weight 3), frustrated t > 4 (weight 1)
+    acc.update(chunk([("s", "a", 0.2, 4), ("s", "a", 1.0, 2), ("s", "a", 1.5, 2)]))
+    acc.update(chunk([("s", "a", 4.0, 1), ("s", "a", 4.01, 1), ("s", "b", 5.0, 1)]))
+
+    apdex = acc.apdex_frame().set_index("Transaction_Name")
+
+    assert apdex.loc["a", ["satisfied", "tolerating", "frustrated", "total"]].tolist() == [6, 3, 1, 10]
+    assert apdex.loc["a", "Apdex"] == 0.75
+    assert apdex.loc["b", "Apdex"] == 0.0
+    assert (apdex["Apdex_T"] == 1.0).all()
+
+
+def test_chunked_updates_match_direct_counts():
+    rng = np.random.default_rng(5)
+    edges = [0.1, 0.25, 0.5, 1.0, 2.0, 5.0]
+    frame = chunk({"Script_Name": "s", "Transaction_Name": rng.choice(["a", "b", "c"], 5000),
+                   "Response_Times": rng.lognormal(-0.5, 1.0, 5000).round(2),
+                   "Counts": rng.integers(1, 4, 5000)})
+    acc = HistogramAccumulator(edges)
+    for start in range(0, len(frame), 700):
+        acc.update(frame.iloc[start:start + 700])
+
+    hist = acc.histogram_frame()
+    for txn, rows in frame.groupby("Transaction_Name"):
+        # Upper-inclusive buckets: weight of samples with edges[i-1] < t <= edges[i]
+        times, weights = rows["Response_Times"].to_numpy(), rows["Counts"].to_numpy()
+        bounds = [0.0] + edges + [np.inf]
+        expected = [weights[(times > lo) & (times <= hi)].sum() for lo, hi in zip(bounds, bounds[1:])]
+        got = np.zeros(len(edges) + 1)
+        mine = hist[hist["Transaction_Name"] == txn]
+        got[mine["bucket"]] = mine["count"]
+        np.testing.assert_array_equal(got, expected)
+
+
+def test_merge_histograms_adds_buckets():
+    acc = HistogramAccumulator(edges=[1.0])
+    acc.update(chunk([("s1", "t", 0.5, 2), ("s2", "t", 0.7, 3), ("s2", "u", 3.0, 1)]))
+
+    merged = merge_histograms(acc.histogram_frame(), ["Transaction_Name"])
+    overall = merge_histograms(acc.histogram_frame())
+
+    assert merged[["Transaction_Name", "bucket", "count"]].values.tolist() == [["t", 0, 5], ["u", 1, 1]]
+    assert overall["count"].tolist() == [5, 1]
+
+
+@pytest.mark.parametrize("edges, threshold", [([], 1.0), ([0.0, 1.0], 1.0), ([1.0], 0.0)])
+def test_invalid_configuration(edges, threshold):
+    with pytest.raises(ValueError):
+        HistogramAccumulator(edges, threshold)
+
+
+def test_settings_default_to_the_accumulator_defaults():
+    settings = BaseLRESettings(_env_file=None, lre_client_id="id", lre_client_secret="secret", lre_project="p")
+    assert settings.lre_histogram_edges == list(DEFAULT_HISTOGRAM_EDGES)
+    assert settings.lre_apdex_threshold == DEFAULT_APDEX_THRESHOLD
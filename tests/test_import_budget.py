@@ -0,0 +1,18 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from benchmarks.import_benchmark import DEFAULT_BUDGET_MS, DEFAULT_MODULE
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_cli_import_stays_within_startup_budget():
+    proc = subprocess.run(
+        [sys.executable, "-m", "benchmarks.import_benchmark", "--top", "0", "--repeat", "3"],
+        cwd=REPO_ROOT, capture_output=True, text=True, timeout=120,
+    )
+
+    assert proc.returncode == 0, proc.stdout + proc.stderr
+    assert f"OK: within {DEFAULT_BUDGET_MS:.0f} ms" in proc.stdout
+    assert proc.stdout.startswith(f"{DEFAULT_MODULE}:")
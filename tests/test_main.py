@@ -0,0 +1,47 @@
+import pytest
+
+from lre_client import main as cli
+from lre_client.api.client import LREClient
+
+
+@pytest.fixture
+def cli_settings(lre_settings, tmp_path, monkeypatch):
+    """Run the CLI in tmp_path with an LREClient built from fake-server settings."""
+    monkeypatch.chdir(tmp_path)
+
+    def use(server, connect=None, **overrides):
+        settings = lre_settings(server, lre_results_store_path=tmp_path / "store",
+                                lre_trend_store_path=tmp_path / "trends", **overrides)
+        monkeypatch.setattr(cli, "LREClient", connect or (lambda: LREClient(settings=settings)))
+        return settings
+
+    return use
+
+
+def test_batch_exits_zero_when_every_run_succeeds(fake_lre, cli_settings, analysis_db):
+    cli_settings(fake_lre(analysis_db=analysis_db()))
+    assert cli.main(["--runs", "1-2"]) == 0
+
+
+def test_batch_exits_non_zero_when_a_run_fails(fake_lre, cli_settings, analysis_db):
+    cli_settings(fake_lre(runs=3, analysis_db=analysis_db()))
+    assert cli.main(["--runs", "1,99"]) == 1
+
+
+def test_connection_error_exits_non_zero(fake_lre, cli_settings, monkeypatch):
+    server = fake_lre()
+    settings = None
+
+    def connect():
+        # Log in, then lose the server before the batch starts
+        client = LREClient(settings=settings)
+        client.auth.login_with_client_credentials()
+        server.stop()
+        client.session.close()  # drop the keep-alive connection to the stopped server
+        return client
+
+    errors = []
+    monkeypatch.setattr(cli.log, "error", lambda msg, *args: errors.append(msg % args))
+    settings = cli_settings(server, connect=connect, lre_max_retries=0)
+    assert cli.main(["--runs", "1-2"]) == 1
+    assert any(e.startswith("Could not reach LRE server") for e in errors)
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+
+from lre_client.analytics.monitors import MonitorAccumulator
+
+HOSTS = {1: "lg01", 2: "lg02"}
+METRICS = pd.DataFrame({"Event_ID": [7], "Monitor": ["Windows Resources"], "Metric": ["CPU"]})
+
+
+def samples(rows: int = 1000, seed: int = 3) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "Host_ID": rng.choice([1, 2], rows),
+        "Event_ID": np.full(rows, 7),
+        "End_Time": rng.uniform(0, 600, rows),
+        "Value": rng.normal(50, 10, rows),
+    })
+
+
+def feed(accumulator: MonitorAccumulator, frame: pd.DataFrame, chunk: int) -> MonitorAccumulator:
+    for start in range(0, len(frame), chunk):
+        accumulator.update(frame.iloc[start:start + chunk])
+    return accumulator
+
+
+def test_series_matches_direct_groupby():
+    frame = samples()
+    series = feed(MonitorAccumulator(bucket_seconds=60, fold_every=2), frame, 50).series_frame(HOSTS, METRICS)
+
+    expected = (frame.assign(Host=frame["Host_ID"].map(HOSTS), Time_Bucket=(frame["End_Time"] // 60) * 60)
+                .groupby(["Host", "Time_Bucket"])["Value"].agg(["count", "mean", "max"]).reset_index())
+    assert len(series) == len(expected)
+    np.testing.assert_array_equal(series["Samples"], expected["count"])
+    np.testing.assert_allclose(series["Average"], expected["mean"])
+    np.testing.assert_array_equal(series["Maximum"], expected["max"])
+
+
+def test_folding_keeps_partials_bounded_and_results_unchanged():
+    frame = samples()
+    folded = feed(MonitorAccumulator(fold_every=3), frame, 20)
+    unfolded = feed(MonitorAccumulator(fold_every=10_000), frame, 20)
+
+    assert len(folded._series) <= 4
+    pdt.assert_frame_equal(folded.series_frame(HOSTS, METRICS), unfolded.series_frame(HOSTS, METRICS))
+
+
+def test_summary_exact_values():
+    frame = pd.DataFrame({"Host_ID": [1, 1, 1, 2], "Event_ID": [7, 7, 7, 7],
+                          "End_Time": [0.0, 1.0, 2.0, 3.0], "Value": [1.0, 2.0, 6.0, 4.0]})
+    summary = feed(MonitorAccumulator(), frame, 2).summary_frame(HOSTS, METRICS)
+
+    assert summary[["Host", "Samples", "Minimum", "Average", "Maximum"]].values.tolist() == [
+        ["lg01", 3, 1.0, 3.0, 6.0],
+        ["lg02", 1, 4.0, 4.0, 4.0],
+    ]
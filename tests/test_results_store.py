@@ -0,0 +1,50 @@
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from lre_client.data.results_store import ResultsStore
+from lre_client.pipeline.batch_extractor import BatchExtractionPipeline
+
+ANALYTICS = pd.DataFrame({"Script_Name": ["s1", "s1"], "Transaction_Name": ["login", "search"], "p95": [0.5, 1.5]})
+
+
+def snapshot(store_dir):
+    return next(store_dir.glob("7/*.parquet"))
+
+
+def test_analytics_survive_a_restart(tmp_path):
+    ResultsStore(tmp_path).update_analytics(7, ANALYTICS)
+
+    pdt.assert_frame_equal(ResultsStore(tmp_path).get_analytics(7), ANALYTICS)
+
+
+@pytest.mark.parametrize("damage", [
+    lambda data: data[: len(data) // 2],
+    lambda data: b"not a parquet file at all",
+    lambda data: b"",
+])
+def test_corrupt_snapshot_is_treated_as_missing(tmp_path, damage):
+    ResultsStore(tmp_path).update_analytics(7, ANALYTICS)
+    path = snapshot(tmp_path)
+    path.write_bytes(damage(path.read_bytes()))
+
+    store = ResultsStore(tmp_path)
+    assert store.get_analytics(7) is None
+    assert not store.has_analytics(7)
+
+
+def test_batch_resume_reprocesses_run_with_corrupt_snapshot(fake_lre, lre_client, analysis_db, tmp_path):
+    server = fake_lre(analysis_db=analysis_db())
+    lre = lre_client(server)
+    store_dir = tmp_path / "store"
+    pipeline_options = dict(output_dir=tmp_path / "results", analytics_workers=1)
+
+    first = BatchExtractionPipeline(lre, store=ResultsStore(store_dir), **pipeline_options).run([7])
+    assert first[0].ok
+    path = snapshot(store_dir)
+    path.write_bytes(path.read_bytes()[:100])
+
+    resumed = BatchExtractionPipeline(lre, store=ResultsStore(store_dir), **pipeline_options).run([7])
+
+    assert resumed[0].ok and len(resumed[0].analytics) == 10
+    assert server.stats.requests["result_data"] == 2
@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from lre_client.analytics.rollups import build_rollups
+from lre_client.analytics.sketches import SKETCH_COUNTS, SKETCH_MEANS
+
+# (script, transaction) -> (response times, weight of each sample, failed samples)
+SAMPLES = {
+    ("s1", "login"): ([1.0, 2.0, 3.0, 4.0], [1, 1, 2, 1], 1),
+    ("s1", "search"): ([0.5, 1.5, 2.5], [2, 1, 1], 0),
+    ("s2", "login"): ([2.0, 6.0, 10.0, 12.0], [1, 3, 1, 1], 2),
+}
+
+
+def analytics_and_sketches():
+    """Per-row analytics as the SQL computes them, and exact sketches (one unit centroid per sample)."""
+    rows, sketches = [], []
+    for (script, txn), (values, weights, failed) in SAMPLES.items():
+        values, weights = np.array(values), np.array(weights, dtype=float)
+        mean = np.average(values, weights=weights)
+        rows.append({"Script_Name": script, "Transaction_Name": txn,
+                     "Transaction_Count": int(weights.sum()) + failed,
+                     "Minimum": values.min(), "Average": mean, "Maximum": values.max(),
+                     "Std_Deviation": np.sqrt(np.average((values - mean) ** 2, weights=weights)),
+                     "Pass": int(weights.sum()), "Fail": failed,
+                     "p50": np.nan, "p90": np.nan, "p95": np.nan, "p99": np.nan})
+        sketches.append({"Script_Name": script, "Transaction_Name": txn,
+                         SKETCH_MEANS: np.repeat(values, weights.astype(int)).tolist(),
+                         SKETCH_COUNTS: [1.0] * int(weights.sum())})
+    return pd.DataFrame(rows), pd.DataFrame(sketches)
+
+
+def pooled(keys):
+    """Weighted samples and failed count of every (script, transaction) row matching ``keys``."""
+    values, weights, failed = [], [], 0
+    for (script, txn), (v, w, f) in SAMPLES.items():
+        if keys.get("Script_Name", script) == script and keys.get("Transaction_Name", txn) == txn:
+            values += v
+            weights += w
+            failed += f
+    return np.array(values), np.array(weights, dtype=float), failed
+
+
+@pytest.mark.parametrize("level, keys", [
+    ("overall", {}),
+    ("script", {"Script_Name": "s1"}),
+    ("script", {"Script_Name": "s2"}),
+    ("transaction", {"Transaction_Name": "login"}),
+    ("transaction", {"Transaction_Name": "search"}),
+])
+def test_rollup_matches_pooled_samples(level, keys):
+    analytics, sketches = analytics_and_sketches()
+    rollups = build_rollups(analytics, sketches)
+    row = rollups[(rollups["Level"] == level)
+                  & (rollups["Script_Name"] == keys.get("Script_Name", "*"))
+                  & (rollups["Transaction_Name"] == keys.get("Transaction_Name", "*"))].iloc[0]
+
+    values, weights, failed = pooled(keys)
+    mean = np.average(values, weights=weights)
+    assert (row["Pass"], row["Fail"]) == (weights.sum(), failed)
+    assert row["Transaction_Count"] == weights.sum() + failed
+    assert (row["Minimum"], row["Maximum"]) == (values.min(), values.max())
+    assert row["Average"] == round(mean, 3)
+    assert row["Std_Deviation"] == round(np.sqrt(np.average((values - mean) ** 2, weights=weights)), 3)
+    # Unit centroids interpolate between sample midpoints, i.e. the Hazen quantile definition
+    expanded = np.repeat(values, weights.astype(int))
+    for column, q in (("p50", 50), ("p90", 90), ("p95", 95), ("p99", 99)):
+        assert row[column] == pytest.approx(np.percentile(expanded, q, method="hazen"))
+
+
+def test_overall_exact_values():
+    analytics, sketches = analytics_and_sketches()
+    overall = build_rollups(analytics, sketches, levels=["overall"]).iloc[0]
+
+    # 15 passed samples, sorted: .5 .5 1 1.5 2 2 2.5 3 3 4 6 6 6 10 12
+    assert overall[["Transaction_Count", "Pass", "Fail"]].tolist() == [18, 15, 3]
+    assert (overall["Minimum"], overall["Average"], overall["Maximum"]) == (0.5, 4.0, 12.0)
+    assert overall["Std_Deviation"] == 3.307
+    # Hazen positions: p50 -> 8th sample, p90 -> 14th sample
+    assert (overall["p50"], overall["p90"]) == (3.0, 10.0)
+
+
+def test_percentiles_are_nan_without_sketches():
+    analytics, _ = analytics_and_sketches()
+    rollups = build_rollups(analytics, None)
+
+    assert rollups[["p50", "p90", "p95", "p99"]].isna().all().all()
+    assert rollups["Pass"].notna().all()
+
+
+def test_unknown_level_is_rejected():
+    analytics, sketches = analytics_and_sketches()
+    with pytest.raises(ValueError, match="Unknown rollup levels"):
+        build_rollups(analytics, sketches, levels=["host"])
@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from lre_client.analytics.run_comparison import RunAnalytics, RunComparator, ks_distances
+from lre_client.analytics.sketches import SKETCH_COUNTS, SKETCH_MEANS
+
+
+def analytics(rows):
+    """Analytics frame from (script, transaction, count, pass, fail, average, p90) tuples."""
+    frame = pd.DataFrame(rows, columns=["Script_Name", "Transaction_Name", "Transaction_Count",
+                                        "Pass", "Fail", "Average", "p90"])
+    return frame.assign(p95=frame["p90"], p99=frame["p90"])
+
+
+def sketches(samples, baseline=None):
+    """Sketch rows from {(script, transaction): (means, counts)}."""
+    frame = pd.DataFrame([{"Script_Name": script, "Transaction_Name": txn,
+                           SKETCH_MEANS: list(means), SKETCH_COUNTS: list(counts)}
+                          for (script, txn), (means, counts) in samples.items()])
+    return frame if baseline is None else frame.assign(baseline=baseline)
+
+
+def naive_ks(a_values, a_weights, b_values, b_weights):
+    """Largest gap between the two weighted CDFs, evaluated at every distinct value."""
+    a_values, a_weights = np.asarray(a_values, float), np.asarray(a_weights, float)
+    b_values, b_weights = np.asarray(b_values, float), np.asarray(b_weights, float)
+    return max(abs(a_weights[a_values <= x].sum() / a_weights.sum()
+                   - b_weights[b_values <= x].sum() / b_weights.sum())
+               for x in np.union1d(a_values, b_values))
+
+
+def test_compare_exact_deltas_and_flags():
+    current = RunAnalytics("cur", analytics([
+        ("s", "login", 100, 90, 10, 2.0, 3.3),
+        ("s", "search", 50, 50, 0, 1.0, 1.0),
+        ("s", "checkout", 10, 10, 0, 5.0, 6.0),
+    ]), duration_seconds=10.0)
+    baseline = RunAnalytics("base", analytics([
+        ("s", "login", 100, 98, 2, 1.6, 3.0),
+        ("s", "search", 100, 100, 0, 1.0, 1.0),
+        ("s", "logout", 10, 10, 0, 0.1, 0.2),
+    ]), duration_seconds=10.0)
+
+    out = RunComparator(threshold=0.10, error_rate_threshold=0.05).compare(current, baseline)
+    out = out.set_index("Transaction_Name")
+
+    assert out.loc["login", "Average_delta"] == pytest.approx(0.4)
+    assert out.loc["login", "Average_pct"] == pytest.approx(0.25)
+    assert out.loc["login", "p90_pct"] == pytest.approx(0.10)
+    assert not out.loc["login", "p90_regressed"]  # exactly at the threshold
+    assert out.loc["login", "error_rate_current"] == pytest.approx(0.10)
+    assert out.loc["login", "error_rate_delta"] == pytest.approx(0.08)
+    assert out.loc["login", "error_rate_regressed"]
+    assert out.loc["login", "Average_regressed"]
+
+    # 50 vs 100 transactions over the same 10 s: tps halves
+    assert out.loc["search", "tps_current"] == pytest.approx(5.0)
+    assert out.loc["search", "tps_pct"] == pytest.approx(-0.5)
+    assert out.loc["search", "tps_regressed"]
+    assert not out.loc["search", "Average_regressed"]
+
+    assert out.loc["checkout", "presence"] == "new"
+    assert out.loc["logout", "presence"] == "missing"
+    assert not out.loc[["checkout", "logout"], "regression"].any()
+    assert np.isnan(out.loc["login", "ks_distance"])
+
+    summary = RunComparator.summary(out.reset_index()).iloc[0]
+    assert (summary["transactions"], summary["regressions"], summary["new"], summary["missing"]) == (4, 2, 1, 1)
+
+
+def test_ks_distance_exact_value():
+    pairs = pd.DataFrame({"baseline": ["b"], "Script_Name": ["s"], "Transaction_Name": ["t"]})
+    current = sketches({("s", "t"): ([1.0, 2.0, 3.0, 4.0], [1, 1, 1, 1])})
+    baseline = sketches({("s", "t"): ([3.0, 4.0, 5.0, 6.0], [1, 1, 1, 1])}, baseline="b")
+    np.testing.assert_allclose(ks_distances(current, baseline, pairs), [0.5])
+
+    identical = sketches({("s", "t"): ([1.0, 2.0, 3.0, 4.0], [1, 1, 1, 1])}, baseline="b")
+    np.testing.assert_allclose(ks_distances(current, identical, pairs), [0.0])
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_ks_distances_match_naive_weighted_cdfs(seed):
+    rng = np.random.default_rng(seed)
+    keys = [("s1", "a"), ("s1", "b"), ("s2", "a")]
+    labels = ["b1", "b2"]
+
+    def draw(shift):
+        # Rounded values so both sides and centroids within one side share values
+        size = int(rng.integers(1, 30))
+        return (np.round(rng.gamma(2.0, 1.0 + shift, size), 1).tolist(),
+                rng.integers(1, 6, size).astype(float).tolist())
+
+    cur = {key: draw(0.0) for key in keys[:2]}
+    base = {label: {key: draw(rng.uniform(0, 1)) for key in keys} for label in labels}
+    pairs = pd.DataFrame([(label, script, txn) for label in labels for script, txn in keys],
+                         columns=["baseline", "Script_Name", "Transaction_Name"])
+
+    got = ks_distances(sketches(cur),
+                       pd.concat([sketches(base[label], label) for label in labels], ignore_index=True),
+                       pairs)
+
+    for i, (label, script, txn) in enumerate(pairs.itertuples(index=False)):
+        if (script, txn) not in cur:
+            assert np.isnan(got[i])
+        else:
+            expected = naive_ks(*cur[(script, txn)], *base[label][(script, txn)])
+            assert got[i] == pytest.approx(expected, abs=1e-9)
+
+
+def test_compare_requires_baseline():
+    run = RunAnalytics("cur", analytics([("s", "t", 1, 1, 0, 1.0, 1.0)]))
+    with pytest.raises(ValueError):
+        RunComparator().compare(run, [])
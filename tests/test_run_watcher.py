@@ -0,0 +1,60 @@
+import threading
+import time
+
+from lre_client.api.run_watcher import RunWatcher
+from lre_client.data.trend_store import TrendStore
+
+
+def test_slow_actions_do_not_block_polling(fake_lre, lre_client):
+    lre = lre_client(fake_lre())
+    # Each action waits until all three have started, which only happens if they run concurrently
+    started = threading.Barrier(3, timeout=5)
+
+    def slow_action(run, results):
+        started.wait()
+        time.sleep(0.2)
+        return results.latest_analyzed.id
+
+    watcher = RunWatcher(lre, on_ready=slow_action, min_interval=0.05, max_workers=3)
+    began = time.monotonic()
+    outcomes = watcher.watch([1, 2, 3], timeout=10)
+
+    assert outcomes == {1: 11, 2: 21, 3: 31}
+    assert time.monotonic() - began < 2
+
+
+def test_failed_action_is_returned_as_outcome(fake_lre, lre_client):
+    lre = lre_client(fake_lre())
+
+    def action(run, results):
+        if results.run_id == 2:
+            raise RuntimeError("analysis failed")
+        return "done"
+
+    outcomes = RunWatcher(lre, on_ready=action, min_interval=0.05).watch([1, 2], timeout=10)
+
+    assert outcomes[1] == "done"
+    assert isinstance(outcomes[2], RuntimeError)
+
+
+def test_timeout_leaves_running_action_without_outcome(fake_lre, lre_client):
+    lre = lre_client(fake_lre())
+    release = threading.Event()
+
+    watcher = RunWatcher(lre, on_ready=lambda run, results: release.wait(5), min_interval=0.05)
+    outcomes = watcher.watch([1], timeout=0.5)
+    release.set()
+
+    assert outcomes == {}
+
+
+def test_default_action_analyzes_and_records_trend(fake_lre, lre_client, analysis_db, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    lre = lre_client(fake_lre(analysis_db=analysis_db()), lre_trend_store_path=tmp_path / "trends")
+
+    watcher = RunWatcher(lre, min_interval=0.05)
+    outcomes = watcher.watch([1, 6], timeout=30)
+
+    assert len(outcomes[1]) == 10 and len(outcomes[6]) == 10
+    # Runs 1 and 6 are both runs of test 1
+    assert sorted(TrendStore(tmp_path / "trends").runs(1)["run_id"]) == [1, 6]
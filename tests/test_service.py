@@ -0,0 +1,110 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from lre_client.data.results_store import ResultsStore
+from lre_client.data.trend_store import TrendStore
+from lre_client.service.server import AnalyticsService, create_server
+
+
+@pytest.fixture
+def service(fake_lre, lre_client, analysis_db, tmp_path):
+    """AnalyticsService over a fake LRE server whose results hold a synthetic analysis DB."""
+    server = fake_lre(analysis_db=analysis_db(), runs=5)
+    service = AnalyticsService(lre_client(server), output_dir=tmp_path / "results",
+                               store=ResultsStore(persist=False), analytics_workers=1,
+                               trend_store=TrendStore(tmp_path / "trends"))
+    service.fake = server
+    yield service
+    service.close()
+
+
+@pytest.fixture
+def service_url(service):
+    httpd = create_server(service, "127.0.0.1", 0)
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def count_submissions(service):
+    """Wrap the analytics pool so the test can count analyses actually started."""
+    submitted = []
+    submit = service._analytics_pool.submit
+
+    def counting(fn, *args):
+        submitted.append(args[0])
+        return submit(fn, *args)
+
+    service._analytics_pool.submit = counting
+    return submitted
+
+
+def test_concurrent_identical_requests_share_one_analysis(service, service_url):
+    submitted = count_submissions(service)
+
+    with ThreadPoolExecutor(8) as pool:
+        responses = list(pool.map(lambda _: requests.get(f"{service_url}/runs/2/analytics"), range(8)))
+
+    assert [r.status_code for r in responses] == [200] * 8
+    assert all(r.json() == responses[0].json() for r in responses)
+    assert len(responses[0].json()) == 10
+    assert len(submitted) == 1
+    assert service.fake.stats.requests["result_data"] == 1
+
+
+def test_summary_is_computed_once(service, service_url):
+    first = requests.get(f"{service_url}/runs/1/summary").json()
+    second = requests.get(f"{service_url}/runs/1/summary").json()
+
+    assert first == second and len(first) == 10
+    assert service.health()["summary_cache"]["hits"] == 1
+
+
+def test_no_wait_answers_202_until_done(service, service_url):
+    pending = requests.get(f"{service_url}/runs/3/rollups", params={"wait": "false"})
+    assert pending.status_code == 202
+    assert pending.json() == {"status": "pending"}
+
+    done = requests.get(f"{service_url}/runs/3/rollups")
+    assert done.status_code == 200 and done.json()
+
+
+def test_unknown_routes_parts_and_runs_are_404(service_url):
+    assert requests.get(f"{service_url}/runs/1/bogus").status_code == 404
+    assert requests.get(f"{service_url}/nothing").status_code == 404
+    assert requests.get(f"{service_url}/runs/999/status").status_code == 404
+
+
+def test_bad_requests_are_400(service_url):
+    assert requests.post(f"{service_url}/runs/1/sla", json={}).status_code == 400
+    assert requests.get(f"{service_url}/runs/1/compare").status_code == 400
+    invalid_rule = requests.post(f"{service_url}/runs/1/sla", json={"rules": [{"no_such_field": 1}]})
+    assert invalid_rule.status_code == 400
+
+
+def test_evict_drops_cached_run(service, service_url):
+    submitted = count_submissions(service)
+    requests.get(f"{service_url}/runs/4/analytics")
+    requests.get(f"{service_url}/runs/4/summary")
+
+    assert requests.post(f"{service_url}/runs/4/evict").json() == {"run_id": 4, "evicted": True}
+    assert requests.post(f"{service_url}/runs/4/evict").json() == {"run_id": 4, "evicted": False}
+
+    # The next request analyzes again, from the already downloaded DB
+    assert requests.get(f"{service_url}/runs/4/rollups").status_code == 200
+    assert len(submitted) == 2
+    assert service.fake.stats.requests["result_data"] == 1
+
+
+def test_analyzed_runs_are_added_to_trend_history(service, service_url):
+    for run_id in (1, 2):
+        assert requests.get(f"{service_url}/runs/{run_id}/analytics").status_code == 200
+
+    # Fake runs cycle through five tests, so runs 1 and 2 belong to tests 1 and 2
+    assert service.trend_store.runs(1)["run_id"].tolist() == [1]
+    assert service.trend_store.runs(2)["run_id"].tolist() == [2]
@@ -0,0 +1,134 @@
+import fnmatch
+import itertools
+import json
+import random
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from lre_client.analytics.sla import SLAEngine, SLARule, load_sla_rules
+
+GLOBS = ["*", "a*", "ab*", "*b", "a?c", "[ab]*", "a.b*", "b*c", "abc", "a[!b]*", "*.*", "ba", "?"]
+REGEXES = ["re:a.*", "re:(a|b)c", "re:ab+c?", "re:a{2}.*", "re:b|c", "re:a\\.b.*", "re:.*c", "re:[ab]+"]
+
+
+def analytics(scripts, transactions, rng):
+    rows = [(s, t) for s in scripts for t in transactions]
+    frame = pd.DataFrame(rows, columns=["Script_Name", "Transaction_Name"])
+    frame["Transaction_Count"] = rng.integers(1, 100, len(frame))
+    frame["Pass"] = frame["Transaction_Count"]
+    frame["Fail"] = 0
+    frame["p95"] = rng.uniform(0, 2, len(frame)).round(2)
+    return frame
+
+
+def naive_matches(pattern: str, name: str) -> bool:
+    if pattern.startswith("re:"):
+        return re.fullmatch(pattern[3:], name) is not None
+    return fnmatch.fnmatchcase(name, pattern)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matching_agrees_with_naive_matcher(seed):
+    rng = np.random.default_rng(seed)
+    pick = random.Random(seed)
+    names = sorted({"".join(pick.choice("abc.") for _ in range(pick.randint(1, 4))) for _ in range(40)})
+    frame = analytics(names[:6], names, rng)
+    rules = [SLARule(f"r{i}", "p95", "<", 1.0, transaction=txn, script=script)
+             for i, (txn, script) in enumerate(pick.choices(list(itertools.product(GLOBS + REGEXES, GLOBS)), k=60))]
+
+    result = SLAEngine(rules).evaluate(frame)
+
+    matched = result[result["status"] != "no_match"]
+    got = set(zip(matched["rule"], matched["Script_Name"], matched["Transaction_Name"]))
+    expected = {
+        (rule.name, row.Script_Name, row.Transaction_Name)
+        for rule in rules for row in frame.itertuples()
+        if naive_matches(rule.script, row.Script_Name) and naive_matches(rule.transaction, row.Transaction_Name)
+    }
+    assert got == expected
+    assert set(result.loc[result["status"] == "no_match", "rule"]) == \
+        {rule.name for rule in rules} - {name for name, _, _ in expected}
+    # Every check compares the transaction's own value with the threshold
+    values = frame.set_index(["Script_Name", "Transaction_Name"])["p95"]
+    np.testing.assert_array_equal(
+        matched["value"].to_numpy(), values.loc[list(zip(matched["Script_Name"], matched["Transaction_Name"]))])
+    assert (matched["passed"] == (matched["value"] < 1.0)).all()
+
+
+def test_overlapping_rules_each_check_the_transaction():
+    frame = pd.DataFrame({"Script_Name": ["s1", "s1", "s2"], "Transaction_Name": ["login", "search", "login"],
+                          "Transaction_Count": [10, 10, 10], "Pass": [10, 9, 10], "Fail": [0, 1, 0],
+                          "p95": [0.5, 2.0, 1.0]})
+    rules = [
+        SLARule("all", "p95", "<=", 1.0),
+        SLARule("login glob", "p95", "<", 1.0, transaction="log*"),
+        SLARule("s1 literal", "p95", "<", 1.0, transaction="login", script="s1"),
+        SLARule("regex", "error_rate", "==", 0.0, transaction="re:s.*"),
+        SLARule("dotted", "p95", "<", 1.0, transaction="re:log.n"),
+    ]
+
+    result = SLAEngine(rules).evaluate(frame)
+    checks = {(r.rule, r.Script_Name, r.Transaction_Name): r.status for r in result.itertuples()}
+
+    assert checks == {
+        ("all", "s1", "login"): "pass", ("all", "s1", "search"): "fail", ("all", "s2", "login"): "pass",
+        ("login glob", "s1", "login"): "pass", ("login glob", "s2", "login"): "fail",
+        ("s1 literal", "s1", "login"): "pass",
+        ("regex", "s1", "search"): "fail",
+        ("dotted", "s1", "login"): "pass", ("dotted", "s2", "login"): "fail",
+    }
+    summary = SLAEngine.summary(result).set_index("rule")
+    assert summary.loc["all", ["pass", "fail"]].tolist() == [2, 1]
+
+
+def test_glob_characters_are_literal_in_globs_and_special_in_regexes():
+    frame = pd.DataFrame({"Script_Name": ["s"] * 3, "Transaction_Name": ["a.b", "axb", "a+b"],
+                          "Transaction_Count": [1] * 3, "Pass": [1] * 3, "Fail": [0] * 3, "p95": [1.0] * 3})
+    rules = [SLARule("glob", "p95", "<", 2, transaction="a.b"), SLARule("regex", "p95", "<", 2, transaction="re:a.b"),
+             SLARule("plus", "p95", "<", 2, transaction="a+b"), SLARule("none", "p95", "<", 2, transaction="zz*")]
+
+    result = SLAEngine(rules).evaluate(frame)
+
+    by_rule = result.groupby("rule")["Transaction_Name"].apply(lambda s: sorted(s.dropna()))
+    assert by_rule["glob"] == ["a.b"]
+    assert by_rule["regex"] == ["a+b", "a.b", "axb"]
+    assert by_rule["plus"] == ["a+b"]
+    assert result.loc[result["rule"] == "none", "status"].tolist() == ["no_match"]
+
+
+def test_missing_values_are_no_data():
+    frame = pd.DataFrame({"Script_Name": ["s"], "Transaction_Name": ["t"], "Transaction_Count": [0],
+                          "Pass": [0], "Fail": [0], "p95": [np.nan]})
+
+    result = SLAEngine([SLARule("r", "error_rate", "<", 0.1)]).evaluate(frame)
+
+    assert result["status"].tolist() == ["no_data"]
+
+
+def test_invalid_rules_fail_fast():
+    with pytest.raises(ValueError, match="unknown operator"):
+        SLARule("bad op", "p95", "=<", 1.0)
+    with pytest.raises(re.error):
+        SLAEngine([SLARule("bad regex", "p95", "<", 1.0, transaction="re:(unclosed")])
+    with pytest.raises(ValueError):
+        SLARule("bad threshold", "p95", "<", "fast")
+
+    frame = pd.DataFrame({"Script_Name": ["s"], "Transaction_Name": ["t"], "Transaction_Count": [1],
+                          "Pass": [1], "Fail": [0], "p95": [1.0]})
+    with pytest.raises(ValueError, match="unknown metrics"):
+        SLAEngine([SLARule("typo", "p959", "<", 1.0)]).evaluate(frame)
+
+
+def test_load_rules_from_json_and_csv(tmp_path):
+    json_path = tmp_path / "sla.json"
+    json_path.write_text(json.dumps({"rules": [{"name": "r", "metric": "p95", "op": "<", "threshold": 2,
+                                                "transaction": "log*"}]}))
+    csv_path = tmp_path / "sla.csv"
+    csv_path.write_text("name,metric,op,threshold,transaction\nr,p95,<,2,log*\ns,p90,<=,1,\n")
+
+    assert load_sla_rules(json_path) == [SLARule("r", "p95", "<", 2.0, transaction="log*")]
+    assert load_sla_rules(csv_path) == [SLARule("r", "p95", "<", 2.0, transaction="log*"),
+                                        SLARule("s", "p90", "<=", 1.0)]